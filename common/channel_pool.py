@@ -0,0 +1,73 @@
+import random
+import threading
+import time
+
+import grpc
+from loguru import logger
+
+
+class ChannelPool:
+    """
+    服务间调用的grpc channel池, 每个 host:port 只建一个channel并在请求之间复用
+    grpc channel是线程安全的, 一个channel上的请求通过同一个HTTP/2连接多路复用, 不需要每次请求都重新建连
+    get(name) 每次通过resolver解析服务的实例, 已经离开consul的实例对应的channel在close_grace秒后关闭
+    关闭channel会取消上面进行中的请求, 宽限期要比服务间调用的超时长, 让已经发出的请求正常结束
+    """
+    def __init__(self, resolver=None, options=None, close_grace=30):
+        # resolver.resolve(name) 返回服务实例的 [(host, port)], 如 ConsulResolver 或 ConsulRegister
+        self.resolver = resolver
+        self.options = options or []
+        self.close_grace = close_grace
+        self._lock = threading.Lock()
+        self._channels = {}
+        # 已经离开consul、等待关闭的channel: address -> (关闭时间, channel)
+        self._retired = {}
+        # 服务名 -> 最近一次解析出的地址, 用来判断哪些channel已经没有实例在用
+        self._services = {}
+
+    def channel(self, host, port) -> grpc.Channel:
+        address = f"{host}:{port}"
+        with self._lock:
+            channel = self._channels.get(address)
+            if channel is None:
+                # 实例在宽限期内重新出现时继续用原来的channel
+                _, channel = self._retired.pop(address, (None, None))
+                if channel is None:
+                    channel = grpc.insecure_channel(address, options=self.options)
+                self._channels[address] = channel
+            return channel
+
+    def get(self, name):
+        """从consul里随机选一个name服务的实例, 返回它的channel, 没有可用实例时返回None"""
+        addresses = [f"{host}:{port}" for host, port in self.resolver.resolve(name)]
+        self.retain(name, addresses)
+        if not addresses:
+            return None
+        host, port = random.choice(addresses).rsplit(":", 1)
+        return self.channel(host, port)
+
+    def retain(self, name, addresses):
+        """记录name服务当前的实例, 上次解析到、这次已经不在的实例的channel过了宽限期后关闭"""
+        now = time.monotonic()
+        with self._lock:
+            departed = self._services.get(name, set()) - set(addresses)
+            self._services[name] = set(addresses)
+            # 同一个地址可能同时被别的服务名用到, 这种情况保留channel
+            alive = set().union(*self._services.values())
+            for address in departed:
+                if address not in alive and address in self._channels:
+                    self._retired[address] = (now + self.close_grace, self._channels.pop(address))
+            expired = [address for address, (deadline, _) in self._retired.items() if deadline <= now]
+            channels = [self._retired.pop(address)[1] for address in expired]
+        for address, channel in zip(expired, channels):
+            logger.info(f"Close channel to {address}")
+            channel.close()
+
+    def close(self):
+        with self._lock:
+            channels = list(self._channels.values()) + [channel for _, channel in self._retired.values()]
+            self._channels.clear()
+            self._retired.clear()
+            self._services.clear()
+        for channel in channels:
+            channel.close()
@@ -0,0 +1,134 @@
+import inspect
+import threading
+from concurrent import futures
+
+import grpc
+
+# consul的健康检查不参与限流, 否则实例忙时被判定为不健康、注销后就再也不会有流量
+HEALTH_SERVICE = "/grpc.health.v1.Health/"
+OVERLOADED = "Server is overloaded"
+
+
+class SheddingExecutor(futures.ThreadPoolExecutor):
+    """
+    记录已提交还没执行完的任务数, grpc同步server每个请求提交一个任务, 即排队和正在处理的请求数
+    请求在排队时被取消也会执行提交的任务, 计数不会泄漏
+    健康检查和拒绝请求走单独的小线程池, 不排在业务请求后面, 也不计入pending
+    """
+    def __init__(self, max_workers=None, priority_workers=2, **kwargs):
+        super(SheddingExecutor, self).__init__(max_workers=max_workers, **kwargs)
+        self.pending = 0
+        self._pending_lock = threading.Lock()
+        self._priority = futures.ThreadPoolExecutor(max_workers=priority_workers, thread_name_prefix="grpc-priority")
+        self._local = threading.local()
+
+    def prioritize(self):
+        # grpc在同一个线程里先调用拦截器, 紧接着提交这个请求的任务, 标记只对下一次submit生效
+        self._local.priority = True
+
+    def _done(self):
+        with self._pending_lock:
+            self.pending -= 1
+
+    def submit(self, fn, /, *args, **kwargs):
+        if getattr(self._local, "priority", False):
+            self._local.priority = False
+            return self._priority.submit(fn, *args, **kwargs)
+
+        def run():
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self._done()
+
+        with self._pending_lock:
+            self.pending += 1
+        try:
+            return super(SheddingExecutor, self).submit(run)
+        except Exception:
+            self._done()
+            raise
+
+    def shutdown(self, *args, **kwargs):
+        self._priority.shutdown(*args, **kwargs)
+        super(SheddingExecutor, self).shutdown(*args, **kwargs)
+
+
+def _reject(request, context):
+    context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, OVERLOADED)
+
+
+def _rejection_handler(handler):
+    # 和原方法的流式类型一致, 不反序列化请求
+    if handler.request_streaming and handler.response_streaming:
+        return grpc.stream_stream_rpc_method_handler(_reject)
+    if handler.request_streaming:
+        return grpc.stream_unary_rpc_method_handler(_reject)
+    if handler.response_streaming:
+        return grpc.unary_stream_rpc_method_handler(_reject)
+    return grpc.unary_unary_rpc_method_handler(_reject)
+
+
+class LoadSheddingInterceptor(grpc.ServerInterceptor):
+    """同步server: executor里排队和处理中的请求达到limit时, 新请求直接返回RESOURCE_EXHAUSTED"""
+    def __init__(self, executor: SheddingExecutor, limit: int):
+        self.executor = executor
+        self.limit = limit
+
+    def intercept_service(self, continuation, handler_call_details):
+        handler = continuation(handler_call_details)
+        if handler is None:
+            return handler
+        if handler_call_details.method.startswith(HEALTH_SERVICE):
+            self.executor.prioritize()
+            return handler
+        if self.executor.pending >= self.limit:
+            self.executor.prioritize()
+            return _rejection_handler(handler)
+        return handler
+
+
+class AsyncLoadSheddingInterceptor(grpc.aio.ServerInterceptor):
+    """grpc.aio server: 同时处理的请求达到limit时, 新请求直接返回RESOURCE_EXHAUSTED, 计数只在事件循环里修改"""
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.active = 0
+
+    async def _enter(self, context):
+        if self.active >= self.limit:
+            await context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, OVERLOADED)
+        self.active += 1
+
+    def _wrap(self, behavior):
+        if inspect.isasyncgenfunction(behavior):
+            async def wrapper(request, context):
+                await self._enter(context)
+                try:
+                    async for response in behavior(request, context):
+                        yield response
+                finally:
+                    self.active -= 1
+        else:
+            async def wrapper(request, context):
+                await self._enter(context)
+                try:
+                    return await behavior(request, context)
+                finally:
+                    self.active -= 1
+        return wrapper
+
+    async def intercept_service(self, continuation, handler_call_details):
+        handler = await continuation(handler_call_details)
+        if handler is None or handler_call_details.method.startswith(HEALTH_SERVICE):
+            return handler
+        if handler.request_streaming and handler.response_streaming:
+            return grpc.stream_stream_rpc_method_handler(self._wrap(handler.stream_stream),
+                                                         handler.request_deserializer, handler.response_serializer)
+        if handler.request_streaming:
+            return grpc.stream_unary_rpc_method_handler(self._wrap(handler.stream_unary),
+                                                        handler.request_deserializer, handler.response_serializer)
+        if handler.response_streaming:
+            return grpc.unary_stream_rpc_method_handler(self._wrap(handler.unary_stream),
+                                                        handler.request_deserializer, handler.response_serializer)
+        return grpc.unary_unary_rpc_method_handler(self._wrap(handler.unary_unary),
+                                                   handler.request_deserializer, handler.response_serializer)
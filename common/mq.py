@@ -0,0 +1,55 @@
+import threading
+
+from loguru import logger
+
+try:
+    from rocketmq.client import Producer, TransactionMQProducer
+except ImportError:
+    Producer = TransactionMQProducer = None
+
+
+class ProducerRegistry:
+    """
+    进程内共享的RocketMQ producer, 每个group只在第一次使用时启动, 之后所有handler线程复用
+    启动producer需要访问name server并创建线程, 不能放在每个请求里做
+    只在使用时才启动, 预fork模式下各worker进程各自持有自己的producer
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._producers = {}
+        self.name_server = None
+
+    def configure(self, host, port):
+        self.name_server = f"{host}:{port}"
+
+    def _start(self, group_id, factory):
+        with self._lock:
+            producer = self._producers.get(group_id)
+            if producer is None:
+                producer = factory()
+                producer.set_name_server_address(self.name_server)
+                producer.start()
+                logger.info(f"Start RocketMQ producer {group_id}")
+                self._producers[group_id] = producer
+            return producer
+
+    def get(self, group_id):
+        return self._start(group_id, lambda: Producer(group_id))
+
+    def transaction(self, group_id, checker_callback):
+        """事务producer的回查回调在创建时绑定, 同一个group只用第一次传入的checker_callback"""
+        return self._start(group_id, lambda: TransactionMQProducer(group_id=group_id,
+                                                                   checker_callback=checker_callback))
+
+    def shutdown(self):
+        with self._lock:
+            producers = list(self._producers.items())
+            self._producers.clear()
+        for group_id, producer in producers:
+            try:
+                producer.shutdown()
+            except Exception as e:
+                logger.error(f"Shutdown RocketMQ producer {group_id} failed: {e}")
+
+
+producers = ProducerRegistry()
@@ -0,0 +1,133 @@
+import itertools
+import random
+import threading
+import time
+
+import grpc
+from loguru import logger
+
+# 这些状态码说明实例本身有问题, 计入错误率; 业务错误(NOT_FOUND等)不算
+FAILURE_CODES = (grpc.StatusCode.UNAVAILABLE, grpc.StatusCode.DEADLINE_EXCEEDED, grpc.StatusCode.UNKNOWN)
+
+
+class Endpoint:
+    """一个服务实例的调用统计, requests/failures 按decay衰减, 反映的是最近一段时间的错误率"""
+    def __init__(self, address):
+        self.address = address
+        self.inflight = 0
+        self.requests = 0.0
+        self.failures = 0.0
+        self.ejected_until = 0.0
+
+    def error_rate(self) -> float:
+        return self.failures / self.requests if self.requests else 0.0
+
+    def ejected(self, now) -> bool:
+        return self.ejected_until > now
+
+
+class _Tracker(grpc.UnaryUnaryClientInterceptor, grpc.UnaryStreamClientInterceptor):
+    """记录经过这个channel的请求数和结果, 请求结束时回调balancer"""
+    def __init__(self, balancer, endpoint: Endpoint):
+        self.balancer = balancer
+        self.endpoint = endpoint
+
+    def _track(self, continuation, client_call_details, request):
+        self.balancer.started(self.endpoint)
+        try:
+            call = continuation(client_call_details, request)
+        except Exception:
+            self.balancer.finished(self.endpoint, grpc.StatusCode.UNKNOWN)
+            raise
+        call.add_done_callback(lambda done: self.balancer.finished(self.endpoint, done.code()))
+        return call
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        return self._track(continuation, client_call_details, request)
+
+    def intercept_unary_stream(self, continuation, client_call_details, request):
+        return self._track(continuation, client_call_details, request)
+
+
+class Balancer:
+    """
+    客户端负载均衡, 在resolver解析出的实例里按策略选一个, channel从ChannelPool复用
+    - round_robin: 轮询
+    - least_outstanding: 选进行中请求最少的实例
+    - p2c: 随机取两个, 选进行中请求较少的那个(power of two choices)
+    最近错误率超过error_threshold的实例被摘除eject_seconds秒, 全部被摘除时仍在所有实例里选
+    channel(name) 每次调用选一次实例, 返回的channel只用于这一次请求才能按请求均衡
+    """
+    POLICIES = ("round_robin", "least_outstanding", "p2c")
+
+    def __init__(self, resolver, pool, policy="p2c", error_threshold=0.5, min_requests=5, eject_seconds=30,
+                 decay=0.9):
+        if policy not in self.POLICIES:
+            raise ValueError(f"Unsupported balance policy: {policy}")
+        self.resolver = resolver
+        self.pool = pool
+        self.policy = policy
+        self.error_threshold = error_threshold
+        self.min_requests = min_requests
+        self.eject_seconds = eject_seconds
+        self.decay = decay
+        self._lock = threading.Lock()
+        self._endpoints = {}
+        self._counters = {}
+
+    def _sync(self, name, addresses) -> list:
+        current = self._endpoints.get(name, {})
+        self._endpoints[name] = {address: current.get(address) or Endpoint(address) for address in addresses}
+        return list(self._endpoints[name].values())
+
+    def pick(self, name):
+        """按策略选一个实例, 没有可用实例时返回None"""
+        # 第一次resolve可能要同步访问consul, 在锁外完成, 锁只保护选择和统计
+        addresses = sorted(f"{host}:{port}" for host, port in self.resolver.resolve(name))
+        self.pool.retain(name, addresses)
+        with self._lock:
+            endpoints = self._sync(name, addresses)
+            if not endpoints:
+                return None
+            now = time.monotonic()
+            candidates = [endpoint for endpoint in endpoints if not endpoint.ejected(now)] or endpoints
+            if self.policy == "round_robin":
+                counter = self._counters.setdefault(name, itertools.count())
+                return candidates[next(counter) % len(candidates)]
+            if self.policy == "least_outstanding":
+                least = min(endpoint.inflight for endpoint in candidates)
+                return random.choice([endpoint for endpoint in candidates if endpoint.inflight == least])
+            if len(candidates) == 1:
+                return candidates[0]
+            first, second = random.sample(candidates, 2)
+            return first if first.inflight <= second.inflight else second
+
+    def channel(self, name):
+        endpoint = self.pick(name)
+        if endpoint is None:
+            return None
+        host, port = endpoint.address.rsplit(":", 1)
+        return grpc.intercept_channel(self.pool.channel(host, port), _Tracker(self, endpoint))
+
+    def started(self, endpoint: Endpoint):
+        with self._lock:
+            endpoint.inflight += 1
+
+    def finished(self, endpoint: Endpoint, code):
+        with self._lock:
+            endpoint.inflight -= 1
+            endpoint.requests = endpoint.requests * self.decay + 1
+            endpoint.failures = endpoint.failures * self.decay + (code in FAILURE_CODES)
+            if endpoint.requests >= self.min_requests and endpoint.error_rate() >= self.error_threshold:
+                logger.warning(f"Eject {endpoint.address} for {self.eject_seconds}s, "
+                               f"error rate {endpoint.error_rate():.2f}")
+                endpoint.ejected_until = time.monotonic() + self.eject_seconds
+                # 恢复后从头统计, 不会因为之前的错误立即再次被摘除
+                endpoint.requests = endpoint.failures = 0.0
+
+    def stats(self, name) -> list:
+        now = time.monotonic()
+        with self._lock:
+            return [{"address": endpoint.address, "inflight": endpoint.inflight,
+                     "error_rate": endpoint.error_rate(), "ejected": endpoint.ejected(now)}
+                    for endpoint in self._endpoints.get(name, {}).values()]
@@ -49,3 +49,11 @@ class ConsulRegister(base.Register):
             service_info = random.choice(list(data.values()))
             return service_info["Address"], service_info["Port"]
         return None, None
+
+    def get_addresses(self, filter) -> list:
+        data = self.filter_service(filter)
+        return [(service_info["Address"], service_info["Port"]) for service_info in data.values()]
+
+    def resolve(self, name) -> list:
+        """每次都查询consul, 服务端请求路径上用ConsulResolver"""
+        return self.get_addresses(f'Service == "{name}"')
@@ -0,0 +1,96 @@
+import threading
+import time
+
+import consul
+from loguru import logger
+
+
+class ConsulResolver:
+    """
+    缓存consul里各服务健康实例的解析器, resolve直接读内存, 不在请求路径上访问consul
+    每个服务第一次resolve时同步查一次, 之后由后台线程用blocking query(index/wait)等待变化并刷新
+    consul不可用时继续返回上一次的结果, staleness/metrics 给出距上次成功刷新的秒数
+    后台线程每report_interval秒把实例数和距上次刷新的秒数打到日志里, 刷新失败时的告警里也带上
+    """
+    def __init__(self, host, port, wait="30s", retry_interval=1, report_interval=60):
+        self.c = consul.Consul(host=host, port=port)
+        self.wait = wait
+        self.retry_interval = retry_interval
+        self.report_interval = report_interval
+        self._lock = threading.Lock()
+        self._instances = {}
+        self._refreshed = {}
+        self._watchers = {}
+        self._stopped = threading.Event()
+
+    def resolve(self, name) -> list:
+        """返回name服务健康实例的 [(host, port)]"""
+        with self._lock:
+            instances = self._instances.get(name)
+        if instances is not None:
+            return instances
+        index = None
+        try:
+            index = self.refresh(name)
+        except Exception as e:
+            logger.warning(f"Resolve {name} from consul failed: {e}")
+        self.watch(name, index)
+        with self._lock:
+            return self._instances.get(name, [])
+
+    def refresh(self, name, index=None):
+        """查询一次name服务的健康实例, 传入index时是blocking query, 直到有变化或超过wait才返回"""
+        index, nodes = self.c.health.service(name, index=index, wait=self.wait if index else None, passing=True)
+        instances = [(node["Service"]["Address"] or node["Node"]["Address"], node["Service"]["Port"])
+                     for node in nodes]
+        with self._lock:
+            if instances != self._instances.get(name):
+                logger.info(f"Consul instances of {name}: {instances}")
+            self._instances[name] = instances
+            self._refreshed[name] = time.monotonic()
+        return index
+
+    def watch(self, name, index=None):
+        with self._lock:
+            if name in self._watchers:
+                return
+            watcher = threading.Thread(target=self._watch, args=(name, index), name=f"consul-watch-{name}", daemon=True)
+            self._watchers[name] = watcher
+        watcher.start()
+
+    def _watch(self, name, index):
+        reported_at = time.monotonic()
+        while not self._stopped.is_set():
+            try:
+                index = self.refresh(name, index)
+            except Exception as e:
+                logger.warning(f"Refresh {name} from consul failed: {e}, {self._describe(name)}")
+                # 重新做一次非阻塞查询, 避免用过期的index
+                index = None
+                self._stopped.wait(self.retry_interval)
+            if time.monotonic() - reported_at >= self.report_interval:
+                logger.info(f"Consul resolver {name}: {self._describe(name)}")
+                reported_at = time.monotonic()
+
+    def _describe(self, name) -> str:
+        staleness = self.staleness(name)
+        with self._lock:
+            count = len(self._instances.get(name, []))
+        if staleness is None:
+            return f"{count} instances, never refreshed"
+        return f"{count} instances, last refresh {staleness:.1f}s ago"
+
+    def staleness(self, name):
+        """距上次成功刷新name服务的秒数, 从未成功刷新过返回None"""
+        with self._lock:
+            refreshed = self._refreshed.get(name)
+        return None if refreshed is None else time.monotonic() - refreshed
+
+    def metrics(self) -> dict:
+        """{服务名: 距上次成功刷新的秒数}"""
+        with self._lock:
+            names = list(self._watchers)
+        return {name: self.staleness(name) for name in names}
+
+    def close(self):
+        self._stopped.set()
@@ -1,7 +1,37 @@
+import multiprocessing
+import signal
+import sys
+import time
+from concurrent import futures
+from multiprocessing.connection import wait
+
 import consul
+import grpc
 import requests
 from loguru import logger
 
+from common.grpc_interceptor.load_shedding import AsyncLoadSheddingInterceptor, LoadSheddingInterceptor, \
+    SheddingExecutor
+from common.mq import producers
+
+COMPRESSION = {
+    "gzip": grpc.Compression.Gzip,
+    "deflate": grpc.Compression.Deflate,
+    "none": grpc.Compression.NoCompression,
+}
+
+# SERVER_CONFIG里的配置项 -> grpc channel参数
+CHANNEL_OPTIONS = {
+    "keepalive_time_ms": "grpc.keepalive_time_ms",
+    "keepalive_timeout_ms": "grpc.keepalive_timeout_ms",
+    "keepalive_permit_without_calls": "grpc.keepalive_permit_without_calls",
+    "min_ping_interval_ms": "grpc.http2.min_ping_interval_without_data_ms",
+    "max_connection_idle_ms": "grpc.max_connection_idle_ms",
+    "max_connection_age_ms": "grpc.max_connection_age_ms",
+    "max_send_message_length": "grpc.max_send_message_length",
+    "max_receive_message_length": "grpc.max_receive_message_length",
+}
+
 
 class BaseServer:
     SERVICE_HOST = None
@@ -13,9 +43,16 @@ class BaseServer:
     server = None
     consul = None
     check = None
+    # grpc server的调优配置, 一般取自nacos配置里的grpc字段:
+    # max_workers, max_concurrent_rpcs, load_shedding, shed_queue_size, compression, CHANNEL_OPTIONS里的各项
+    SERVER_CONFIG = None
+    # 预fork模式下的worker进程不注册consul, 由主进程统一注册
+    worker = False
+    workers = None
 
     def onExit(self, signo, frame):
-        pass
+        # 子类的onExit在退出前调用, 关闭本进程里共享的producer
+        producers.shutdown()
 
     def read_config(self):
         pass
@@ -23,7 +60,103 @@ class BaseServer:
     def serve(self):
         raise NotImplementedError
 
+    def server_options(self) -> list:
+        # 允许多个进程监听同一个端口, 由内核在进程间分发连接
+        options = [("grpc.so_reuseport", 1)]
+        config = self.SERVER_CONFIG or {}
+        for key, option in CHANNEL_OPTIONS.items():
+            if config.get(key) is not None:
+                options.append((option, int(config[key])))
+        return options
+
+    def max_concurrent_rpcs(self, workers: int):
+        """
+        load_shedding开启时最多同时处理 workers + shed_queue_size 个请求, 超出的请求直接返回RESOURCE_EXHAUSTED
+        不再无限制地在线程池里排队; 否则使用max_concurrent_rpcs, 默认不限制
+        限制由LoadSheddingInterceptor执行, 健康检查不计入也不会被拒绝
+        """
+        config = self.SERVER_CONFIG or {}
+        if config.get("load_shedding"):
+            return workers + config.get("shed_queue_size", 0)
+        return config.get("max_concurrent_rpcs")
+
+    def server_workers(self, max_workers: int) -> int:
+        # max_workers是服务的默认线程数, 配置了max_workers时以配置为准
+        return (self.SERVER_CONFIG or {}).get("max_workers", max_workers)
+
+    def create_server(self, max_workers=40):
+        config = self.SERVER_CONFIG or {}
+        workers = self.server_workers(max_workers)
+        limit = self.max_concurrent_rpcs(workers)
+        interceptors = None
+        if limit:
+            executor = SheddingExecutor(max_workers=workers)
+            interceptors = [LoadSheddingInterceptor(executor, limit)]
+        else:
+            executor = futures.ThreadPoolExecutor(max_workers=workers)
+        return grpc.server(executor,
+                           interceptors=interceptors,
+                           options=self.server_options(),
+                           compression=COMPRESSION.get(config.get("compression")))
+
+    def create_aio_server(self, workers: int):
+        # aio模式下workers是服务自己执行同步调用的线程数, 用server_workers得到
+        config = self.SERVER_CONFIG or {}
+        limit = self.max_concurrent_rpcs(workers)
+        return grpc.aio.server(interceptors=[AsyncLoadSheddingInterceptor(limit)] if limit else None,
+                               options=self.server_options(),
+                               compression=COMPRESSION.get(config.get("compression")))
+
+    def prefork(self, processes: int, target=None):
+        """
+        预fork模式: 启动processes个worker进程执行target(默认serve), 各自监听同一个端口, 各自建立数据库连接
+        consul注册和注销只在主进程做一次, 健康检查由任意一个worker响应
+        worker意外退出时重新拉起, 主进程收到SIGTERM/SIGINT后通知所有worker退出
+        """
+        target = target or self.serve
+        self.workers = [self.spawn_worker(target) for _ in range(processes)]
+        signal.signal(signal.SIGINT, self.onMasterExit)
+        signal.signal(signal.SIGTERM, self.onMasterExit)
+        logger.info(f"Start {self.SERVICE_NAME} with {processes} worker processes")
+        self.register()
+        while True:
+            sentinels = {worker.sentinel: worker for worker in self.workers}
+            for sentinel in wait(list(sentinels)):
+                worker = sentinels[sentinel]
+                logger.warning(f"Worker {worker.pid} exited with code {worker.exitcode}, restarting")
+                self.workers[self.workers.index(worker)] = self.spawn_worker(target)
+            # 避免worker启动即退出时不停地重启
+            time.sleep(1)
+
+    def spawn_worker(self, target):
+        # 必须fork之后再创建grpc server和数据库连接, 主进程里不能初始化它们
+        process = multiprocessing.get_context("fork").Process(target=self.run_worker, args=(target,))
+        process.start()
+        return process
+
+    def run_worker(self, target):
+        self.worker = True
+        self.workers = None
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        target()
+
+    def onMasterExit(self, signo, frame):
+        logger.info(f"{self.SERVICE_NAME} master terminate")
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        signal.signal(signal.SIGTERM, signal.SIG_IGN)
+        self.unregister()
+        for worker in self.workers:
+            worker.terminate()
+        for worker in self.workers:
+            worker.join(timeout=30)
+            if worker.is_alive():
+                worker.kill()
+        sys.exit(0)
+
     def register(self):
+        if self.worker:
+            return
         self.consul = consul.Consul(host=self.CONSUL_HOST, port=self.CONSUL_PORT)
         if self.check is None:
             check = {
@@ -44,6 +177,8 @@ class BaseServer:
             raise Exception('Failed to registered at consul ' + f"{self.CONSUL_HOST}:{self.CONSUL_PORT}")
 
     def unregister(self):
+        if self.worker:
+            return
         if self.consul is not None:
             logger.info('Unregister from consul {}:{}'.format(self.CONSUL_HOST, self.CONSUL_PORT))
             self.consul.agent.service.deregister(self.SERVICE_ID)
@@ -0,0 +1,43 @@
+import hashlib
+
+from goods_service.model.models import Banner
+from goods_service.proto import goods_pb2
+
+
+class BannerSnapshot:
+    """
+    按index排好序的轮播图列表, 构建一次后所有请求共用:
+    response: 构建好的BannerListResponse
+    payload: response序列化后的bytes, 可以直接写回给客户端
+    version: 轮播图内容的摘要, 内容不变时各副本算出的值相同, 客户端带上它可以跳过没有变化的数据
+    """
+    def __init__(self, banners):
+        self.response = goods_pb2.BannerListResponse()
+        for banner in banners:
+            self.response.data.append(goods_pb2.BannerResponse(
+                id=banner.id,
+                image=banner.image,
+                index=banner.index,
+                url=banner.url
+            ))
+        self.response.total = len(self.response.data)
+        self.version = hashlib.md5(self.response.SerializeToString()).hexdigest()
+        self.response.version = self.version
+        self.payload = self.response.SerializeToString()
+        self.not_modified = goods_pb2.BannerListResponse(total=self.response.total, version=self.version,
+                                                         notModified=True)
+        self.not_modified_payload = self.not_modified.SerializeToString()
+
+    @classmethod
+    def load(cls):
+        return cls(Banner.select().order_by(Banner.index, Banner.id))
+
+    def to_message(self, known_version: str) -> goods_pb2.BannerListResponse:
+        if known_version == self.version:
+            return self.not_modified
+        return self.response
+
+    def to_bytes(self, known_version: str) -> bytes:
+        if known_version == self.version:
+            return self.not_modified_payload
+        return self.payload
@@ -0,0 +1,40 @@
+from goods_service.cache.goods import LRUCache
+from goods_service.model.models import Brands
+from goods_service.proto import goods_pb2
+
+# 每个BrandDirectory最多缓存的分页结果数, 分页参数由客户端决定, 需要限制数量
+BRAND_PAGE_CACHE_SIZE = 128
+
+
+class BrandDirectory:
+    """
+    所有品牌的进程内目录, 按id排序:
+    by_id: 品牌id -> BrandInfoResponse
+    by_name: 品牌名 -> 品牌id, 用于CreateBrand的重名检查
+    分页结果按 (start, per_page) 缓存, 品牌变动时整个目录重建
+    """
+    def __init__(self, brands):
+        self.by_id = {}
+        self.by_name = {}
+        for brand in brands:
+            self.by_id[brand.id] = goods_pb2.BrandInfoResponse(id=brand.id, name=brand.name, logo=brand.logo)
+            self.by_name[brand.name] = brand.id
+        self.brands = list(self.by_id.values())
+        self._pages = LRUCache(BRAND_PAGE_CACHE_SIZE)
+
+    @classmethod
+    def load(cls):
+        return cls(Brands.select(Brands.id, Brands.name, Brands.logo).order_by(Brands.id))
+
+    def get(self, brand_id):
+        return self.by_id.get(brand_id)
+
+    def exists(self, name: str) -> bool:
+        return name in self.by_name
+
+    def page(self, start: int, per_page: int) -> goods_pb2.BrandListResponse:
+        rsp = self._pages.get((start, per_page))
+        if rsp is None:
+            rsp = goods_pb2.BrandListResponse(total=len(self.brands), data=self.brands[start:start + per_page])
+            self._pages.set((start, per_page), rsp)
+        return rsp
@@ -0,0 +1,92 @@
+import json
+from collections import defaultdict
+
+from goods_service.model.models import Category
+from goods_service.proto import goods_pb2
+
+
+class CategoryIndex:
+    """
+    一次遍历所有分类建立的索引, 不限层级:
+    children: 分类id -> 直接子分类id (None -> 一级分类)
+    leaves: 分类id -> 该分类下所有叶子分类id, 叶子分类对应它自己
+    response: 构建好的CategoryListResponse, jsonData只序列化一次
+    """
+    def __init__(self, categories):
+        self.nodes = {}
+        self.children = defaultdict(list)
+        for category in categories:
+            self.nodes[category.id] = category
+            self.children[category.parent_category_id].append(category.id)
+        self.leaves = self._collect_leaves()
+        self.response = self._build_response()
+
+    @classmethod
+    def load(cls):
+        return cls(Category.select().order_by(Category.id))
+
+    def _collect_leaves(self) -> dict:
+        leaves, visiting = {}, set()
+        for root in self.nodes:
+            if root in leaves:
+                continue
+            # 后序遍历, 子分类的叶子集合先于父分类算出
+            stack = [(root, False)]
+            while stack:
+                category_id, expanded = stack.pop()
+                if category_id in leaves:
+                    continue
+                children = self.children.get(category_id, [])
+                if not children:
+                    leaves[category_id] = [category_id]
+                elif expanded:
+                    leaves[category_id] = [leaf for child in children for leaf in leaves.get(child, [])]
+                elif category_id not in visiting:
+                    # visiting防止脏数据里的环导致死循环
+                    visiting.add(category_id)
+                    stack.append((category_id, True))
+                    stack.extend((child, False) for child in children if child not in visiting)
+        return leaves
+
+    def to_dict(self, category: Category) -> dict:
+        return {
+            "id": category.id,
+            "name": category.name,
+            "level": category.level,
+            "parent": category.parent_category_id,
+            "is_tab": category.is_tab
+        }
+
+    def to_message(self, category: Category) -> goods_pb2.CategoryInfoResponse:
+        category_rsp = goods_pb2.CategoryInfoResponse()
+        category_rsp.id = category.id
+        category_rsp.name = category.name
+        if category.parent_category_id:
+            category_rsp.parentCategory = category.parent_category_id
+        category_rsp.level = category.level
+        category_rsp.isTab = category.is_tab
+        return category_rsp
+
+    def _tree(self, category_id, path=()) -> dict:
+        data = self.to_dict(self.nodes[category_id])
+        children = [child for child in self.children.get(category_id, []) if child not in path]
+        if children:
+            data["sub_category"] = [self._tree(child, path + (category_id,)) for child in children]
+        return data
+
+    def _build_response(self) -> goods_pb2.CategoryListResponse:
+        rsp = goods_pb2.CategoryListResponse()
+        rsp.total = len(self.nodes)
+        for category in self.nodes.values():
+            rsp.data.append(self.to_message(category))
+        rsp.jsonData = json.dumps([self._tree(root) for root in self.children.get(None, [])])
+        return rsp
+
+    def get(self, category_id):
+        return self.nodes.get(category_id)
+
+    def leaf_ids(self, category_id) -> list:
+        return self.leaves.get(category_id, [])
+
+    def sub_categories(self, category_id) -> list:
+        return [self.nodes[child] for child in self.children.get(category_id, [])]
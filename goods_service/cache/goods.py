@@ -0,0 +1,128 @@
+import threading
+from collections import OrderedDict
+
+from loguru import logger
+
+
+class LRUCache:
+    def __init__(self, maxsize=10000):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+
+class GoodsDetailCache:
+    """
+    商品详情的两级缓存: 进程内LRU + Redis, 存序列化后的GoodsInfoResponse
+    key由商品id、商品版本号和全局epoch组成:
+    - 修改/删除商品时bump该商品的版本号
+    - 修改分类、品牌会影响所有商品里嵌入的category/brand字段, 这时bump全局epoch
+    旧版本的key不会再被读到, 进程内由LRU淘汰, Redis里靠过期时间清理
+    没有配置Redis时版本号保存在进程内, 只保证本进程的一致性
+    """
+    EPOCH_KEY = "goods:detail:epoch"
+    VERSION_KEY = "goods:detail:version:{}"
+    # 详情内容的格式变化时修改前缀里的版本, 让旧格式的缓存不再被读到
+    DETAIL_KEY = "goods:detail:v2:{}:{}:{}"
+
+    def __init__(self, redis_client=None, local_size=10000, expire=3600):
+        self.redis = redis_client
+        self.expire = expire
+        self.local = LRUCache(local_size)
+        self._lock = threading.Lock()
+        self._epoch = 0
+        self._versions = {}
+
+    def _keys(self, ids) -> list:
+        if self.redis is None:
+            with self._lock:
+                return [self.DETAIL_KEY.format(self._epoch, goods_id, self._versions.get(goods_id, 0))
+                        for goods_id in ids]
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.get(self.EPOCH_KEY)
+        pipe.mget([self.VERSION_KEY.format(goods_id) for goods_id in ids])
+        epoch, versions = pipe.execute()
+        epoch = int(epoch or 0)
+        return [self.DETAIL_KEY.format(epoch, goods_id, int(version or 0))
+                for goods_id, version in zip(ids, versions)]
+
+    def get_many(self, ids):
+        """
+        返回 ({id: bytes}, {id: key}), 后者是未命中的商品, 查库后用set_many回填
+        读不到版本号时所有商品都算未命中, key为None, 表示不知道当前版本, 查库后不能回填
+        """
+        ids = list(ids)
+        if not ids:
+            return {}, {}
+        try:
+            keys = self._keys(ids)
+        except Exception as e:
+            logger.warning(f"Goods detail cache unavailable: {e}")
+            return {}, {goods_id: None for goods_id in ids}
+        hits, misses = {}, {}
+        for goods_id, key in zip(ids, keys):
+            value = self.local.get(key)
+            if value is not None:
+                hits[goods_id] = value
+            else:
+                misses[goods_id] = key
+        if misses and self.redis is not None:
+            try:
+                values = self.redis.mget(list(misses.values()))
+            except Exception as e:
+                logger.warning(f"Goods detail cache unavailable: {e}")
+                return hits, misses
+            for goods_id, value in zip(list(misses), values):
+                if value is not None:
+                    hits[goods_id] = value
+                    self.local.set(misses.pop(goods_id), value)
+        return hits, misses
+
+    def set_many(self, items: dict):
+        """items: {key: bytes}, key来自get_many返回的未命中项"""
+        if not items:
+            return
+        for key, value in items.items():
+            self.local.set(key, value)
+        if self.redis is not None:
+            try:
+                pipe = self.redis.pipeline(transaction=False)
+                for key, value in items.items():
+                    pipe.set(key, value, ex=self.expire)
+                pipe.execute()
+            except Exception as e:
+                logger.warning(f"Goods detail cache unavailable: {e}")
+
+    def bump(self, goods_id):
+        if self.redis is None:
+            with self._lock:
+                self._versions[goods_id] = self._versions.get(goods_id, 0) + 1
+            return
+        try:
+            self.redis.incr(self.VERSION_KEY.format(goods_id))
+        except Exception as e:
+            logger.error(f"Bump goods detail version failed: {e}")
+
+    def bump_all(self):
+        if self.redis is None:
+            with self._lock:
+                self._epoch += 1
+            return
+        try:
+            self.redis.incr(self.EPOCH_KEY)
+        except Exception as e:
+            logger.error(f"Bump goods detail epoch failed: {e}")
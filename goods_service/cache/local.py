@@ -0,0 +1,78 @@
+import threading
+import time
+
+
+class _Build:
+    """一次正在进行的构建, 其他调用方在done上等待结果"""
+    def __init__(self, generation):
+        self.generation = generation
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class LocalCache:
+    """
+    进程内缓存一个由builder构建的对象
+    写操作调用invalidate; ttl不为空时到期自动重建, 这样其他副本上的写入最多ttl秒后也能看到
+    同一时间只有一个调用方执行builder: ttl到期时其他调用方先返回旧值, 没有值时等待这次构建
+    """
+    def __init__(self, builder, ttl=None):
+        self._builder = builder
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self._generation = 0
+        # (value, expire_at), 整体替换保证并发读到的是一致的一组
+        self._entry = None
+        self._building = None
+
+    def _fresh(self, entry) -> bool:
+        return entry is not None and (entry[1] is None or time.monotonic() < entry[1])
+
+    def get(self):
+        entry = self._entry
+        if self._fresh(entry):
+            return entry[0]
+        with self._lock:
+            entry = self._entry
+            if self._fresh(entry):
+                return entry[0]
+            build = self._building
+            owner = build is None
+            if owner:
+                build = self._building = _Build(self._generation)
+            elif entry is not None:
+                # 只是过期, 没有被invalidate, 构建完成前先用旧值
+                return entry[0]
+        if owner:
+            return self._build(build)
+        build.done.wait()
+        if build.error is not None:
+            raise build.error
+        return build.value
+
+    def _build(self, build: _Build):
+        try:
+            build.value = self._builder()
+        except Exception as e:
+            build.error = e
+            raise
+        finally:
+            entry = None
+            if build.error is None:
+                entry = (build.value, time.monotonic() + self._ttl if self._ttl else None)
+            with self._lock:
+                # 构建期间发生了invalidate的结果只返回给已经在等待的调用方, 不写回缓存
+                if entry is not None and build.generation == self._generation:
+                    self._entry = entry
+                if self._building is build:
+                    self._building = None
+            build.done.set()
+        return build.value
+
+    def invalidate(self):
+        with self._lock:
+            self._generation += 1
+            self._entry = None
+            # 之后的调用方不再等待invalidate之前开始的构建
+            self._building = None
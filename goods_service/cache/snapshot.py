@@ -0,0 +1,130 @@
+import threading
+
+from loguru import logger
+
+from goods_service.model.models import Goods
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class GoodsSnapshot:
+    """
+    Goods表筛选用到的列的列式快照, 每列一个numpy数组, 按id升序:
+    GoodsList的常用筛选变成数组上的布尔掩码, total和当前页的id直接从掩码得到, 不需要查库
+    keys/orders以排序字段名为key, 和pagination.SORT_FIELDS的字段对应
+    orders: 按 (字段, id) 升序排列的下标, 倒序时反过来取
+    没有安装numpy时available()返回False, GoodsList回到查库
+    """
+    COLUMNS = (Goods.id, Goods.shop_price, Goods.sold_num, Goods.brand_id, Goods.category_id,
+               Goods.is_hot, Goods.is_new)
+
+    def __init__(self, rows):
+        rows = np.array(rows, dtype=np.float64).reshape(-1, len(self.COLUMNS))
+        self.ids = rows[:, 0].astype(np.int64)
+        self.shop_price = rows[:, 1]
+        self.sold_num = rows[:, 2].astype(np.int64)
+        self.brand = rows[:, 3].astype(np.int64)
+        self.category = rows[:, 4].astype(np.int64)
+        self.is_hot = rows[:, 5].astype(bool)
+        self.is_new = rows[:, 6].astype(bool)
+        self.keys = {"id": self.ids, "shop_price": self.shop_price, "sold_num": self.sold_num}
+        self.orders = {
+            "id": np.arange(len(self.ids)),
+            "shop_price": np.lexsort((self.ids, self.shop_price)),
+            "sold_num": np.lexsort((self.ids, self.sold_num)),
+        }
+
+    @staticmethod
+    def available() -> bool:
+        return np is not None
+
+    @classmethod
+    def load(cls):
+        rows = list(Goods.select(*cls.COLUMNS).order_by(Goods.id).tuples())
+        logger.info(f"Load goods snapshot with {len(rows)} goods")
+        return cls(rows)
+
+    def mask(self, request, leaf_ids=None):
+        """和handler.filter_goods相同的筛选条件, 不支持keyWords"""
+        mask = np.ones(len(self.ids), dtype=bool)
+        if request.isHot:
+            mask &= self.is_hot
+        if request.isNew:
+            mask &= self.is_new
+        if request.priceMin:
+            mask &= self.shop_price >= request.priceMin
+        if request.priceMax:
+            mask &= self.shop_price <= request.priceMax
+        if request.brand:
+            mask &= self.brand == request.brand
+        if leaf_ids is not None:
+            mask &= np.isin(self.category, leaf_ids)
+        return mask
+
+    def seek(self, mask, name: str, desc: bool, key, last_id: int):
+        """只保留排在 (key, last_id) 之后的商品, 和pagination.seek一致, 边界值优先取快照里last_id的值"""
+        keys = self.keys[name]
+        position = np.searchsorted(self.ids, last_id)
+        if position < len(self.ids) and self.ids[position] == last_id:
+            key = keys[position]
+        if desc:
+            return mask & ((keys < key) | ((keys == key) & (self.ids < last_id)))
+        return mask & ((keys > key) | ((keys == key) & (self.ids > last_id)))
+
+    def page(self, mask, name: str, desc: bool, start: int, limit: int) -> list:
+        """按排序返回掩码命中的第start条开始的limit个 (id, 排序字段值)"""
+        order = self.orders[name]
+        if desc:
+            order = order[::-1]
+        positions = order[mask[order]][start:start + limit]
+        keys = self.keys[name][positions]
+        return [(int(goods_id), key.item()) for goods_id, key in zip(self.ids[positions], keys)]
+
+
+class SnapshotRefresher:
+    """
+    后台线程每interval秒重建一次GoodsSnapshot, 新快照构建完成后整体替换引用
+    写操作调用mark_stale提前唤醒后台线程, 请求线程只读当前引用, 不会在请求里加载整表
+    第一次加载完成前get返回None, GoodsList直接查库; 写入后到重建完成前读到的是上一份快照
+    """
+    # 连续写入时两次重建之间至少间隔的秒数, 避免批量写入期间不停地全表扫描
+    MIN_INTERVAL = 1
+
+    def __init__(self, loader, interval):
+        self.loader = loader
+        self.interval = interval
+        self.snapshot = None
+        self._stale = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="goods-snapshot", daemon=True)
+        self._thread.start()
+
+    def get(self):
+        return self.snapshot
+
+    def mark_stale(self):
+        self._stale.set()
+
+    def _run(self):
+        while not self._stopped.is_set():
+            # 重建期间的写入会再次设置stale, 下一轮接着重建
+            self._stale.clear()
+            try:
+                self.snapshot = self.loader()
+            except Exception as e:
+                logger.error(f"Refresh goods snapshot failed: {e}")
+            if self._stopped.wait(self.MIN_INTERVAL):
+                return
+            self._stale.wait(max(self.interval - self.MIN_INTERVAL, 0))
+
+    def stop(self):
+        self._stopped.set()
+        self._stale.set()
+        if self._thread is not None:
+            self._thread.join()
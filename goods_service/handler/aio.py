@@ -0,0 +1,103 @@
+import asyncio
+from concurrent import futures
+
+from goods_service.handler.handler import GoodsServices
+from goods_service.proto import goods_pb2, goods_pb2_grpc
+
+# 流式接口每次从线程池取回的消息数
+STREAM_BATCH_SIZE = 100
+
+# 生成的goods_pb2里方法描述不带流式标记, 流式方法需要在这里列出, 其余方法都按unary处理
+SERVER_STREAMING_METHODS = ("StreamGoodsList", "StreamBatchGetGoods")
+CLIENT_STREAMING_METHODS = ("ImportGoods",)
+UNARY_METHODS = [method.name for method in goods_pb2.DESCRIPTOR.services_by_name['Goods'].methods
+                 if method.name not in SERVER_STREAMING_METHODS + CLIENT_STREAMING_METHODS]
+
+
+class ThreadContext:
+    """在线程池里执行同步handler时代替grpc.aio的ServicerContext, 同步handler用到的接口都在这里"""
+    def __init__(self, context):
+        self._context = context
+
+    def set_code(self, code):
+        self._context.set_code(code)
+
+    def set_details(self, details):
+        self._context.set_details(details)
+
+    def is_active(self) -> bool:
+        return not self._context.done()
+
+
+def _take(iterator, size) -> list:
+    batch = []
+    for item in iterator:
+        batch.append(item)
+        if len(batch) >= size:
+            break
+    return batch
+
+
+class AsyncGoodsServices(goods_pb2_grpc.GoodsServicer):
+    """
+    grpc.aio模式下的商品服务, 请求的调度都在事件循环里, 不再受线程数限制
+    peewee是同步驱动, 业务逻辑仍然由GoodsServices在有界线程池里执行:
+    线程数就是同时访问数据库的上限, 超出的请求在事件循环里排队, 不会占用线程
+    """
+    def __init__(self, servicer: GoodsServices, max_workers=40):
+        self.servicer = servicer
+        self.executor = futures.ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="goods-db")
+
+    def close(self):
+        self.executor.shutdown(wait=True)
+        self.servicer.close()
+
+    async def run(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self.executor, func, *args)
+
+    async def EncodedBannerList(self, request, context) -> bytes:
+        return await self.run(self.servicer.EncodedBannerList, request, ThreadContext(context))
+
+    async def ImportGoods(self, request_iterator, context) -> goods_pb2.ImportGoodsResponse:
+        # 同步的ImportGoods在线程池里执行, 每条请求再回到事件循环里读取
+        loop = asyncio.get_running_loop()
+        requests = request_iterator.__aiter__()
+
+        async def next_request():
+            return await requests.__anext__()
+
+        def read():
+            while True:
+                try:
+                    yield asyncio.run_coroutine_threadsafe(next_request(), loop).result()
+                except StopAsyncIteration:
+                    return
+
+        return await self.run(self.servicer.ImportGoods, read(), ThreadContext(context))
+
+
+def _unary(name):
+    async def handler(self, request, context):
+        return await self.run(getattr(self.servicer, name), request, ThreadContext(context))
+    handler.__name__ = name
+    return handler
+
+
+def _server_streaming(name):
+    async def handler(self, request, context):
+        # 同步生成器在线程池里一批一批地取, 避免每条消息都切换一次线程
+        iterator = getattr(self.servicer, name)(request, ThreadContext(context))
+        while True:
+            batch = await self.run(_take, iterator, STREAM_BATCH_SIZE)
+            for message in batch:
+                yield message
+            if len(batch) < STREAM_BATCH_SIZE:
+                return
+    handler.__name__ = name
+    return handler
+
+
+for _name in UNARY_METHODS:
+    setattr(AsyncGoodsServices, _name, _unary(_name))
+for _name in SERVER_STREAMING_METHODS:
+    setattr(AsyncGoodsServices, _name, _server_streaming(_name))
@@ -0,0 +1,45 @@
+from collections import Counter
+
+from peewee import SQL, Case, fn
+
+from goods_service.model.models import Goods
+from goods_service.proto import goods_pb2
+
+# GoodsFilterRequest.priceBuckets 为空时使用的价格分段边界
+DEFAULT_PRICE_BUCKETS = (100, 500, 1000, 5000)
+
+
+def price_bounds(buckets) -> list:
+    """去重排序后的分段边界, 非正数忽略"""
+    return sorted(set(bound for bound in buckets if bound > 0)) or list(DEFAULT_PRICE_BUCKETS)
+
+
+def compute(goods, bounds: list, brand_directory) -> goods_pb2.GoodsFacets:
+    """
+    按 (品牌, 价格分段) 分组的一次聚合查询, 在内存里再合并出品牌、价格分段和is_hot/is_new的数量
+    goods是已经加上筛选条件的查询, 分组数最多是 品牌数 * (分段数+1)
+    """
+    bucket = Case(None, [(Goods.shop_price < bound, i) for i, bound in enumerate(bounds)], len(bounds))
+    rows = goods.select(
+        Goods.brand_id,
+        bucket.alias("bucket"),
+        fn.COUNT(Goods.id),
+        fn.SUM(Case(None, [(Goods.is_hot == True, 1)], 0)),
+        fn.SUM(Case(None, [(Goods.is_new == True, 1)], 0)),
+    ).order_by().group_by(Goods.brand_id, SQL("bucket")).tuples()
+
+    facets = goods_pb2.GoodsFacets()
+    brands, prices = Counter(), Counter()
+    for brand_id, price_bucket, count, hot, new in rows:
+        brands[brand_id] += count
+        prices[price_bucket] += count
+        facets.hotCount += int(hot or 0)
+        facets.newCount += int(new or 0)
+
+    for brand_id, count in brands.most_common():
+        brand = brand_directory.get(brand_id)
+        facets.brands.add(id=brand_id, name=brand.name if brand is not None else "", count=count)
+    for i in range(len(bounds) + 1):
+        facets.prices.add(min=bounds[i - 1] if i else 0, max=bounds[i] if i < len(bounds) else 0,
+                          count=prices[i])
+    return facets
@@ -1,23 +1,61 @@
-import json
-
 import grpc
 import time
+from datetime import datetime
 from goods_service.proto import goods_pb2, goods_pb2_grpc
+from goods_service.handler import facets, pagination
+from goods_service.handler.counter import ClickCounter
+from goods_service.cache.local import LocalCache
+from goods_service.cache.category import CategoryIndex
+from goods_service.cache.banner import BannerSnapshot
+from goods_service.cache.brand import BrandDirectory
+from goods_service.cache.snapshot import GoodsSnapshot, SnapshotRefresher
+from goods_service.cache.goods import GoodsDetailCache
+from goods_service.search import create_backend
+from goods_service.settings import settings
 from goods_service.model.models import *
 from google.protobuf import empty_pb2
 from loguru import logger
 
+# 流式接口每次查询的商品数
+STREAM_CHUNK_SIZE = 500
+
+# VIEW_SUMMARY只查询和返回这几列
+SUMMARY_COLUMNS = (Goods.id, Goods.name, Goods.shop_price, Goods.goods_front_image)
+# ImportGoods每批写入的商品数
+IMPORT_CHUNK_SIZE = 1000
+# ImportGoods更新已有商品时不覆盖的字段
+IMPORT_PRESERVE_EXCLUDE = {"id", "add_time", "is_deleted", "click_num", "sold_num", "fav_num"}
+
 
 class GoodsServices(goods_pb2_grpc.GoodsServicer):
-    def category_model_to_dic(self, category: Category) -> dict:
-        res = {
-            "id": category.id,
-            "name": category.name,
-            "level": category.level,
-            "parent": category.parent_category_id,
-            "is_tab": category.is_tab
-        }
-        return res
+    def __init__(self):
+        self.category_cache = LocalCache(CategoryIndex.load, ttl=settings.CATEGORY_CACHE_TTL)
+        self.banner_cache = LocalCache(BannerSnapshot.load, ttl=settings.BANNER_CACHE_TTL)
+        self.brand_cache = LocalCache(BrandDirectory.load, ttl=settings.BRAND_CACHE_TTL)
+        self.snapshot_refresher = None
+        if settings.GOODS_SNAPSHOT_REFRESH:
+            if GoodsSnapshot.available():
+                self.snapshot_refresher = SnapshotRefresher(GoodsSnapshot.load, settings.GOODS_SNAPSHOT_REFRESH)
+                self.snapshot_refresher.start()
+            else:
+                logger.warning("numpy is not installed, GoodsList will not use the goods snapshot")
+        self.search = create_backend(settings.SEARCH_CONFIG)
+        self.search.start()
+        self.detail_cache = GoodsDetailCache(settings.Redis_client, local_size=settings.GOODS_CACHE_SIZE,
+                                             expire=settings.GOODS_CACHE_EXPIRE)
+        self.click_counter = ClickCounter(interval=settings.CLICK_FLUSH_INTERVAL)
+        self.click_counter.start()
+
+    def close(self):
+        self.click_counter.stop()
+        self.search.close()
+        if self.snapshot_refresher is not None:
+            self.snapshot_refresher.stop()
+
+    def invalidate_snapshot(self):
+        # 只通知后台线程重建, 不在写请求里加载整表
+        if self.snapshot_refresher is not None:
+            self.snapshot_refresher.mark_stale()
 
     def convert_model_to_message(self, goods: BaseModel) -> goods_pb2.GoodsInfoResponse:
         info_rsp = goods_pb2.GoodsInfoResponse()
@@ -35,7 +73,7 @@ class GoodsServices(goods_pb2_grpc.GoodsServicer):
         info_rsp.goodsFrontImage = goods.goods_front_image
         info_rsp.isNew = goods.is_new
         info_rsp.descImages.extend(goods.desc_images)
-        info_rsp.images.extend(goods.desc_images)
+        info_rsp.images.extend(goods.images)
         info_rsp.isHot = goods.is_hot
         info_rsp.onSale = goods.on_sale
 
@@ -48,12 +86,52 @@ class GoodsServices(goods_pb2_grpc.GoodsServicer):
 
         return info_rsp
 
-    @logger.catch
-    def GoodsList(self, request: goods_pb2.GoodsFilterRequest, context) -> goods_pb2.GoodsListResponse:
-        rsp = goods_pb2.GoodsListResponse()
+    def convert_model_to_summary(self, goods: BaseModel) -> goods_pb2.GoodsInfoResponse:
+        return goods_pb2.GoodsInfoResponse(id=goods.id, name=goods.name, shopPrice=goods.shop_price,
+                                           goodsFrontImage=goods.goods_front_image)
+
+    def convert_to_message(self, goods: BaseModel, summary: bool) -> goods_pb2.GoodsInfoResponse:
+        if summary:
+            return self.convert_model_to_summary(goods)
+        return self.convert_model_to_message(goods)
+
+    def join_relations(self, goods):
+        # category和brand在同一条SQL里join出来, 避免convert_model_to_message逐行触发外键查询
+        return goods.select_extend(Category, Brands).join(Category).switch(Goods).join(Brands)
+
+    def select_view(self, goods, summary: bool, *extra):
+        # 摘要视图只查SUMMARY_COLUMNS和extra里的列, 完整视图join出分类和品牌
+        if summary:
+            columns = {column.name: column for column in SUMMARY_COLUMNS + extra}
+            return goods.select(*columns.values())
+        return self.join_relations(goods)
+
+    def load_goods(self, ids, summary=False) -> list:
+        # 按ids的顺序返回商品详情, 缓存未命中的商品合并成一次查询, 查到后回填缓存
+        hits, misses = self.detail_cache.get_many(ids)
+        messages = {goods_id: goods_pb2.GoodsInfoResponse.FromString(value) for goods_id, value in hits.items()}
+        if summary:
+            # 摘要从缓存的完整详情里截取, 未命中的只查摘要列, 不完整的结果不回填缓存
+            messages = {goods_id: goods_pb2.GoodsInfoResponse(id=info.id, name=info.name, shopPrice=info.shopPrice,
+                                                              goodsFrontImage=info.goodsFrontImage)
+                        for goods_id, info in messages.items()}
+            if misses:
+                for good in Goods.select(*SUMMARY_COLUMNS).where(Goods.id.in_(list(misses))):
+                    messages[good.id] = self.convert_model_to_summary(good)
+        elif misses:
+            fill = {}
+            for good in self.join_relations(Goods.select()).where(Goods.id.in_(list(misses))):
+                info_rsp = self.convert_model_to_message(good)
+                messages[good.id] = info_rsp
+                if misses[good.id] is not None:
+                    fill[misses[good.id]] = info_rsp.SerializeToString()
+            self.detail_cache.set_many(fill)
+        return [messages[goods_id] for goods_id in ids if goods_id in messages]
+
+    def filter_goods(self, request: goods_pb2.GoodsFilterRequest):
         goods: BaseModel = Goods.select()
         if request.keyWords:
-            goods = goods.where(Goods.name.contains(request.keyWords))
+            goods = self.search.filter(goods, request.keyWords)
         if request.isHot:
             goods = goods.filter(Goods.is_hot == True)
         if request.isNew:
@@ -64,45 +142,110 @@ class GoodsServices(goods_pb2_grpc.GoodsServicer):
             goods = goods.filter(Goods.shop_price <= request.priceMax)
         if request.brand:
             goods = goods.filter(Goods.brand_id == request.brand)
+        leaf_ids = self.category_leaf_ids(request)
+        if leaf_ids is not None:
+            goods = goods.where(Goods.category_id.in_(leaf_ids))
+        return goods
+
+    def category_leaf_ids(self, request: goods_pb2.GoodsFilterRequest):
+        # 从分类索引直接拿到所有叶子分类, 不再查询Category表, 不按分类筛选时返回None
         if request.topCategory:
-            try:
-                ids = []
-                category = Category.get(Category.id == request.topCategory)
-                level = category.level
-                if level == 1:
-                    c2 = Category.alias()
-                    categorys = Category.select().where(Category.parent_category_id.in_(
-                        c2.select(c2.id).where(c2.parent_category_id == request.topCategory)
-                    ))
-                    for category in categorys:
-                        ids.append(category.id)
-                elif level == 2:
-                    categorys = Category.select().where(Category.parent_category_id == request.topCategory)
-                    for category in categorys:
-                        ids.append(category.id)
-                elif level == 3:
-                    ids.append(request.topCategory)
-                goods = goods.where(Goods.category_id.in_(ids))
-            except Exception as e:
-                pass
+            category_index = self.category_cache.get()
+            if category_index.get(request.topCategory) is not None:
+                return category_index.leaf_ids(request.topCategory)
+        return None
+
+    def snapshot_goods_list(self, snapshot: GoodsSnapshot, request: goods_pb2.GoodsFilterRequest, last, start,
+                            per_page_nums) -> goods_pb2.GoodsListResponse:
+        # 在列式快照上筛选和分页, 只有缓存未命中的商品详情需要查库
+        rsp = goods_pb2.GoodsListResponse()
+        sort = request.sort or "id"
+        field, desc = pagination.parse_sort(sort)
+        mask = snapshot.mask(request, self.category_leaf_ids(request))
+        if request.countMode != goods_pb2.COUNT_NONE:
+            rsp.total = int(mask.sum())
+        if last is not None:
+            _, key, last_id = last
+            mask = snapshot.seek(mask, field.name, desc, key, last_id)
+            start = 0
+        page = snapshot.page(mask, field.name, desc, start, per_page_nums + 1)
+        if len(page) > per_page_nums:
+            page = page[:per_page_nums]
+            rsp.nextCursor = pagination.encode_cursor(sort, page[-1][1], page[-1][0])
+        rsp.data.extend(self.load_goods([goods_id for goods_id, _ in page], request.view == goods_pb2.VIEW_SUMMARY))
+        return rsp
+
+    def stream_goods(self, goods, context, summary=False):
+        # 按id分批查询, 每批用iterator()逐行转换, 进程里最多只有一批记录
+        last_id = 0
+        while context.is_active():
+            chunk = self.select_view(goods.where(Goods.id > last_id), summary)
+            chunk = chunk.order_by(Goods.id).limit(STREAM_CHUNK_SIZE)
+            count = 0
+            for good in chunk.iterator():
+                count += 1
+                last_id = good.id
+                yield self.convert_to_message(good, summary)
+            if count < STREAM_CHUNK_SIZE:
+                return
+
+    @logger.catch
+    def GoodsList(self, request: goods_pb2.GoodsFilterRequest, context) -> goods_pb2.GoodsListResponse:
+        rsp = goods_pb2.GoodsListResponse()
+        goods = self.filter_goods(request)
         start, per_page_nums = 0, 10
         if request.pagePerNums:
             per_page_nums = request.pagePerNums
         if request.pages:
             start = per_page_nums * (request.pages - 1)
-        rsp.total = goods.count()
-        goods = goods.limit(per_page_nums).offset(start)
-        for good in goods:
-            rsp.data.append(self.convert_model_to_message(good))
+
+        sort = request.sort or "id"
+        try:
+            last = pagination.decode_cursor(request.cursor) if request.cursor else None
+            if last is not None and last[0] != sort:
+                raise pagination.InvalidCursor("Cursor does not match sort")
+            ordered = pagination.order_by(goods, sort)
+        except pagination.InvalidCursor as e:
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details(str(e))
+            return rsp
+
+        snapshot = self.snapshot_refresher.get() if self.snapshot_refresher is not None else None
+        if snapshot is not None and not request.keyWords and not request.facets:
+            return self.snapshot_goods_list(snapshot, request, last, start, per_page_nums)
+
+        if request.countMode == goods_pb2.COUNT_EXACT:
+            rsp.total = goods.count()
+        elif request.countMode == goods_pb2.COUNT_ESTIMATE:
+            rsp.total = pagination.estimate_count(goods)
+        if request.facets:
+            rsp.facets.CopyFrom(facets.compute(goods, facets.price_bounds(request.priceBuckets),
+                                               self.brand_cache.get()))
+
+        # 多取一条用来判断是否还有下一页
+        if last is not None:
+            _, key, last_id = last
+            page = pagination.seek(ordered, sort, key, last_id).limit(per_page_nums + 1)
+        else:
+            page = ordered.limit(per_page_nums + 1).offset(start)
+        summary = request.view == goods_pb2.VIEW_SUMMARY
+        # 摘要视图也要查出排序字段, 用来生成nextCursor
+        page = list(self.select_view(page, summary, pagination.parse_sort(sort)[0]))
+        if len(page) > per_page_nums:
+            page = page[:per_page_nums]
+            rsp.nextCursor = pagination.encode_cursor(sort, pagination.sort_key(page[-1], sort), page[-1].id)
+        for good in page:
+            rsp.data.append(self.convert_to_message(good, summary))
         return rsp
 
     @logger.catch
     def GetGoodsDetail(self, request: goods_pb2.GoodInfoRequest, context):
         try:
-            goods = Goods.get(Goods.id == request.id)
-            goods.click_num += 1
-            goods.save()
-            return self.convert_model_to_message(goods)
+            goods = self.load_goods([request.id])
+            if not goods:
+                raise DoesNotExist
+            self.click_counter.incr(request.id)
+            return goods[0]
         except:
             context.set_code(grpc.StatusCode.NOT_FOUND)
             context.set_details("Goods Does not exist")
@@ -111,13 +254,26 @@ class GoodsServices(goods_pb2_grpc.GoodsServicer):
     @logger.catch
     def BatchGetGoods(self, request: goods_pb2.BatchGoodsIdInfo, context) -> goods_pb2.GoodsListResponse:
         rsp = goods_pb2.GoodsListResponse()
-        ids = list(request.id)
-        goods = Goods.select().where(Goods.id.in_(ids))
-        rsp.total = goods.count()
-        for good in goods:
-            rsp.data.append(self.convert_model_to_message(good))
+        ids = list(dict.fromkeys(request.id))
+        rsp.data.extend(self.load_goods(ids, request.view == goods_pb2.VIEW_SUMMARY))
+        rsp.total = len(rsp.data)
         return rsp
 
+    @logger.catch
+    def StreamGoodsList(self, request: goods_pb2.GoodsFilterRequest, context):
+        yield from self.stream_goods(self.filter_goods(request), context, request.view == goods_pb2.VIEW_SUMMARY)
+
+    @logger.catch
+    def StreamBatchGetGoods(self, request: goods_pb2.BatchGoodsIdInfo, context):
+        summary = request.view == goods_pb2.VIEW_SUMMARY
+        ids = sorted(set(request.id))
+        for i in range(0, len(ids), STREAM_CHUNK_SIZE):
+            if not context.is_active():
+                return
+            chunk = self.select_view(Goods.select(), summary).where(Goods.id.in_(ids[i:i + STREAM_CHUNK_SIZE]))
+            for good in chunk.iterator():
+                yield self.convert_to_message(good, summary)
+
     @logger.catch
     def CreateGoods(self, request: goods_pb2.CreateGoodsInfo, context) -> goods_pb2.GoodsInfoResponse:
         try:
@@ -148,13 +304,107 @@ class GoodsServices(goods_pb2_grpc.GoodsServicer):
         goods.is_hot = request.isHot
         goods.on_sale = request.onSale
         goods.save()
+        self.search.add(goods.id, goods.name)
+        self.invalidate_snapshot()
         return self.convert_model_to_message(goods)
 
+    def import_goods_chunk(self, chunk) -> list:
+        # 一批商品只查一次分类、品牌和已有商品, 新增用一条insert_many, 更新用一条upsert
+        category_ids = list({request.categoryId for _, request in chunk if request.categoryId})
+        brand_ids = list({request.brandId for _, request in chunk if request.brandId})
+        update_ids = list({request.id for _, request in chunk if request.id})
+        categories = {category.id for category in Category.select(Category.id).where(Category.id.in_(category_ids))}
+        brands = {brand.id for brand in Brands.select(Brands.id).where(Brands.id.in_(brand_ids))}
+        existing = {goods.id: goods for goods in
+                    Goods.select(Goods.id, Goods.category, Goods.brand).where(Goods.id.in_(update_ids))}
+
+        now = datetime.now()
+        statuses, inserts, updates = [], [], {}
+        for index, request in chunk:
+            status = goods_pb2.ImportGoodsStatus(index=index, id=request.id)
+            statuses.append(status)
+            if request.id and request.id not in existing:
+                status.code, status.detail = grpc.StatusCode.NOT_FOUND.value[0], "Goods does not exist"
+                continue
+            category_id = request.categoryId or (existing[request.id].category_id if request.id else 0)
+            brand_id = request.brandId or (existing[request.id].brand_id if request.id else 0)
+            if not category_id or (request.categoryId and request.categoryId not in categories):
+                status.code, status.detail = grpc.StatusCode.NOT_FOUND.value[0], "Category does not exist"
+                continue
+            if not brand_id or (request.brandId and request.brandId not in brands):
+                status.code, status.detail = grpc.StatusCode.NOT_FOUND.value[0], "Brand does not exist"
+                continue
+            row = {
+                "category": category_id,
+                "brand": brand_id,
+                "name": request.name,
+                "goods_sn": request.goodsSn,
+                "market_price": request.marketPrice,
+                "shop_price": request.shopPrice,
+                "goods_brief": request.goodsBrief,
+                "ship_free": request.shipFree,
+                "images": list(request.images),
+                "desc_images": list(request.descImages),
+                "goods_front_image": request.goodsFrontImage,
+                "is_new": request.isNew,
+                "is_hot": request.isHot,
+                "on_sale": request.onSale,
+                "add_time": now,
+                "update_time": now,
+            }
+            if request.id:
+                row["id"] = request.id
+                updates[request.id] = row
+            else:
+                inserts.append(row)
+
+        try:
+            with settings.DB.atomic():
+                if inserts:
+                    Goods.insert_many(inserts).execute()
+                if updates:
+                    preserve = [field for field in Goods._meta.sorted_fields
+                                if field.name not in IMPORT_PRESERVE_EXCLUDE]
+                    Goods.insert_many(list(updates.values())).on_conflict(preserve=preserve).execute()
+        except Exception as e:
+            logger.error(f"Import goods failed: {e}")
+            for status in statuses:
+                if status.code == 0:
+                    status.code, status.detail = grpc.StatusCode.INTERNAL.value[0], str(e)
+            return statuses
+
+        for goods_id, row in updates.items():
+            self.search.add(goods_id, row["name"])
+            self.detail_cache.bump(goods_id)
+        self.invalidate_snapshot()
+        return statuses
+
+    @logger.catch
+    def ImportGoods(self, request_iterator, context) -> goods_pb2.ImportGoodsResponse:
+        rsp = goods_pb2.ImportGoodsResponse()
+        chunk = []
+        for index, request in enumerate(request_iterator):
+            chunk.append((index, request))
+            if len(chunk) >= IMPORT_CHUNK_SIZE:
+                rsp.data.extend(self.import_goods_chunk(chunk))
+                chunk = []
+        if chunk:
+            rsp.data.extend(self.import_goods_chunk(chunk))
+        rsp.total = len(rsp.data)
+        rsp.succeeded = sum(1 for status in rsp.data if status.code == 0)
+        # 新增商品拿不到逐条id, 让搜索索引整体重建
+        if any(status.code == 0 and not status.id for status in rsp.data):
+            self.search.reload()
+        return rsp
+
     @logger.catch
     def DeleteGoods(self, request: goods_pb2.DeleteGoodsInfo, context):
         try:
             goods: Goods = Goods.get(Goods.id == request.id)
             goods.delete_instance()
+            self.search.remove(goods.id)
+            self.detail_cache.bump(goods.id)
+            self.invalidate_snapshot()
             return empty_pb2.Empty()
         except DoesNotExist as e:
             context.set_code(grpc.StatusCode.NOT_FOUND)
@@ -212,75 +462,30 @@ class GoodsServices(goods_pb2_grpc.GoodsServicer):
         goods.on_sale = request.onSale
 
         goods.save()
+        self.search.add(goods.id, goods.name)
+        self.detail_cache.bump(goods.id)
+        self.invalidate_snapshot()
         return self.convert_model_to_message(goods)
 
     @logger.catch
     def GetAllCategorysList(self, request, context):
-        rsp = goods_pb2.CategoryListResponse()
-        categories = Category.select()
-        rsp.total = categories.count()
-        level1, level2, level3 = [], [], []
-        for category in categories:
-            category_rsp = goods_pb2.CategoryInfoResponse()
-            category_rsp.id = category.id
-            category_rsp.name = category.name
-            if category.parent_category_id:
-                category_rsp.parentCategory = category.parent_category_id
-            category_rsp.level = category.level
-            category_rsp.isTab = category.is_tab
-            rsp.data.append(category_rsp)
-            if category.level == 1:
-                level1.append(self.category_model_to_dic(category))
-            elif category.level == 2:
-                level2.append(self.category_model_to_dic(category))
-            elif category.level == 3:
-                level3.append(self.category_model_to_dic(category))
-
-        for data3 in level3:
-            for data2 in level2:
-                if data3["parent"] == data2["id"]:
-                    if "sub_category" not in data2:
-                        data2["sub_category"] = [data3]
-                    else:
-                        data2["sub_category"].append(data3)
-        for data2 in level2:
-            for data1 in level1:
-                if data2["parent"] == data1["id"]:
-                    if "sub_category" not in data1:
-                        data1["sub_category"] = [data2]
-                    else:
-                        data1["sub_category"].append(data2)
-        rsp.jsonData = json.dumps(level1)
-        return rsp
+        return self.category_cache.get().response
 
     def GetSubCategory(self, request, context):
         category_list_rsp = goods_pb2.SubCategoryListResponse()
+        category_index = self.category_cache.get()
 
-        try:
-            category_info = Category.get(Category.id == request.id)
-            category_list_rsp.info.id = category_info.id
-            category_list_rsp.info.name = category_info.name
-            category_list_rsp.info.level = category_info.level
-            category_list_rsp.info.isTab = category_info.is_tab
-            if category_info.parent_category:
-                category_list_rsp.info.parentCategory = category_info.parent_category_id
-        except DoesNotExist:
+        category_info = category_index.get(request.id)
+        if category_info is None:
             context.set_code(grpc.StatusCode.NOT_FOUND)
             context.set_details('Category does not exist')
             return goods_pb2.SubCategoryListResponse()
+        category_list_rsp.info.CopyFrom(category_index.to_message(category_info))
 
-        categorys = Category.select().where(Category.parent_category == request.id)
-        category_list_rsp.total = categorys.count()
+        categorys = category_index.sub_categories(request.id)
+        category_list_rsp.total = len(categorys)
         for category in categorys:
-            category_rsp = goods_pb2.CategoryInfoResponse()
-            category_rsp.id = category.id
-            category_rsp.name = category.name
-            if category_info.parent_category:
-                category_rsp.parentCategory = category_info.parent_category_id
-            category_rsp.level = category.level
-            category_rsp.isTab = category.is_tab
-
-            category_list_rsp.subCategorys.append(category_rsp)
+            category_list_rsp.subCategorys.append(category_index.to_message(category))
 
         return category_list_rsp
 
@@ -301,6 +506,7 @@ class GoodsServices(goods_pb2_grpc.GoodsServicer):
                 category_rsp.parentCategory = category.parent_category.id
             category_rsp.level = category.level
             category_rsp.isTab = category.is_tab
+            self.category_cache.invalidate()
         except Exception as e:
             context.set_code(grpc.StatusCode.INTERNAL)
             context.set_details(str(e))
@@ -312,6 +518,8 @@ class GoodsServices(goods_pb2_grpc.GoodsServicer):
         try:
             category = Category.get(request.id)
             category.delete_instance()
+            self.category_cache.invalidate()
+            self.detail_cache.bump_all()
 
             # TODO 删除响应的category下的商品
             return empty_pb2.Empty()
@@ -332,6 +540,8 @@ class GoodsServices(goods_pb2_grpc.GoodsServicer):
             if request.isTab:
                 category.is_tab = request.isTab
             category.save()
+            self.category_cache.invalidate()
+            self.detail_cache.bump_all()
 
             return empty_pb2.Empty()
         except DoesNotExist:
@@ -340,23 +550,14 @@ class GoodsServices(goods_pb2_grpc.GoodsServicer):
             return empty_pb2.Empty()
 
     @logger.catch
-    def BannerList(self, request: empty_pb2.Empty, context):
-        # 获取分类列表
-        rsp = goods_pb2.BannerListResponse()
-        banners = Banner.select()
-
-        rsp.total = banners.count()
-        for banner in banners:
-            banner_rsp = goods_pb2.BannerResponse()
-
-            banner_rsp.id = banner.id
-            banner_rsp.image = banner.image
-            banner_rsp.index = banner.index
-            banner_rsp.url = banner.url
+    def BannerList(self, request: goods_pb2.BannerListRequest, context):
+        # 获取轮播图列表, request.version和当前版本一致时只返回notModified
+        return self.banner_cache.get().to_message(request.version)
 
-            rsp.data.append(banner_rsp)
-
-        return rsp
+    @logger.catch
+    def EncodedBannerList(self, request: goods_pb2.BannerListRequest, context) -> bytes:
+        # 同BannerList, 直接返回缓存好的bytes, 省掉每次请求的序列化, 由add_encoded_handlers_to_server注册
+        return self.banner_cache.get().to_bytes(request.version)
 
     @logger.catch
     def CreateBanner(self, request: goods_pb2.BannerRequest, context):
@@ -366,6 +567,7 @@ class GoodsServices(goods_pb2_grpc.GoodsServicer):
         banner.index = request.index
         banner.url = request.url
         banner.save()
+        self.banner_cache.invalidate()
 
         banner_rsp = goods_pb2.BannerResponse()
         banner_rsp.id = banner.id
@@ -379,6 +581,7 @@ class GoodsServices(goods_pb2_grpc.GoodsServicer):
         try:
             banner = Banner.get(request.id)
             banner.delete_instance()
+            self.banner_cache.invalidate()
 
             return empty_pb2.Empty()
         except DoesNotExist:
@@ -398,6 +601,7 @@ class GoodsServices(goods_pb2_grpc.GoodsServicer):
                 banner.url = request.url
 
             banner.save()
+            self.banner_cache.invalidate()
 
             return empty_pb2.Empty()
         except DoesNotExist:
@@ -408,33 +612,18 @@ class GoodsServices(goods_pb2_grpc.GoodsServicer):
     # 品牌相关的接口
 
     @logger.catch
-    def BrandList(self, request: empty_pb2.Empty, context):
-        # 获取品牌列表
+    def BrandList(self, request: goods_pb2.BrandFilterRequest, context):
+        # 获取品牌列表, 直接从品牌目录分页
         start, per_page = 0, 10
         if request.pagePerNums:
             per_page = request.pagePerNums
         if request.pages:
-            start = per_page * (request.pages-1)
-        rsp = goods_pb2.BrandListResponse()
-        brands = Brands.select()
-
-        rsp.total = brands.count()
-        brands = brands.limit(per_page).offset(start)
-        for brand in brands:
-            brand_rsp = goods_pb2.BrandInfoResponse()
-
-            brand_rsp.id = brand.id
-            brand_rsp.name = brand.name
-            brand_rsp.logo = brand.logo
-
-            rsp.data.append(brand_rsp)
-
-        return rsp
+            start = max(per_page * (request.pages-1), 0)
+        return self.brand_cache.get().page(start, per_page)
 
     @logger.catch
     def CreateBrand(self, request: goods_pb2.BrandRequest, context):
-        brands = Brands.select().where(Brands.name == request.name)
-        if brands:
+        if self.brand_cache.get().exists(request.name):
             context.set_code(grpc.StatusCode.ALREADY_EXISTS)
             context.set_details('Brand Already Exists')
             return goods_pb2.BrandInfoResponse()
@@ -444,7 +633,14 @@ class GoodsServices(goods_pb2_grpc.GoodsServicer):
         brand.name = request.name
         brand.logo = request.logo
 
-        brand.save()
+        try:
+            brand.save()
+        except IntegrityError:
+            # 其他副本刚创建的同名品牌还不在本进程的目录里, 由name上的唯一索引兜底
+            context.set_code(grpc.StatusCode.ALREADY_EXISTS)
+            context.set_details('Brand Already Exists')
+            return goods_pb2.BrandInfoResponse()
+        self.brand_cache.invalidate()
 
         rsp = goods_pb2.BrandInfoResponse()
         rsp.id = brand.id
@@ -458,6 +654,8 @@ class GoodsServices(goods_pb2_grpc.GoodsServicer):
         try:
             brand = Brands.get(request.id)
             brand.delete_instance()
+            self.brand_cache.invalidate()
+            self.detail_cache.bump_all()
 
             return empty_pb2.Empty()
         except DoesNotExist:
@@ -475,6 +673,8 @@ class GoodsServices(goods_pb2_grpc.GoodsServicer):
                 brand.logo = request.logo
 
             brand.save()
+            self.brand_cache.invalidate()
+            self.detail_cache.bump_all()
 
             return empty_pb2.Empty()
         except DoesNotExist:
@@ -483,59 +683,62 @@ class GoodsServices(goods_pb2_grpc.GoodsServicer):
             return empty_pb2.Empty()
 
     @logger.catch
-    def CategoryBrandList(self, request: empty_pb2.Empty, context):
-        # 获取品牌分类列表
+    def CategoryBrandList(self, request: goods_pb2.CategoryBrandFilterRequest, context):
+        # 获取品牌分类列表, 品牌和分类在同一条SQL里join出来, 只取需要的列
         rsp = goods_pb2.CategoryBrandListResponse()
-        category_brands = GoodsCategoryBrand.select()
+        category_brands = GoodsCategoryBrand.select(
+            GoodsCategoryBrand.id,
+            Brands.id, Brands.name, Brands.logo,
+            Category.id, Category.name, Category.parent_category_id, Category.level, Category.is_tab
+        ).join(Brands).switch(GoodsCategoryBrand).join(Category).where(
+            (Brands.is_deleted == False) & (Category.is_deleted == False))
 
         # 分页
         start = 0
         per_page_nums = 10
         if request.pagePerNums:
-            per_page_nums = request.PagePerNums
+            per_page_nums = request.pagePerNums
         if request.pages:
-            start = per_page_nums * (request.pages - 1)
-
-        category_brands = category_brands.limit(per_page_nums).offset(start)
+            start = max(per_page_nums * (request.pages - 1), 0)
 
+        # 总数要在分页之前统计
         rsp.total = category_brands.count()
-        for category_brand in category_brands:
-            category_brand_rsp = goods_pb2.CategoryBrandResponse()
-
-            category_brand_rsp.id = category_brand.id
-            category_brand_rsp.brand.id = category_brand.brand.id
-            category_brand_rsp.brand.name = category_brand.brand.name
-            category_brand_rsp.brand.logo = category_brand.brand.logo
-
-            category_brand_rsp.category.id = category_brand.category.id
-            category_brand_rsp.category.name = category_brand.category.name
-            category_brand_rsp.category.parentCategory = category_brand.category.parent_category_id
-            category_brand_rsp.category.level = category_brand.category.level
-            category_brand_rsp.category.isTab = category_brand.category.is_tab
-
-            rsp.data.append(category_brand_rsp)
+        category_brands = category_brands.order_by(GoodsCategoryBrand.id).limit(per_page_nums).offset(start)
+        for (category_brand_id, brand_id, brand_name, brand_logo,
+             category_id, category_name, parent_category_id, level, is_tab) in category_brands.tuples():
+            category_brand_rsp = rsp.data.add()
+
+            category_brand_rsp.id = category_brand_id
+            category_brand_rsp.brand.id = brand_id
+            category_brand_rsp.brand.name = brand_name
+            category_brand_rsp.brand.logo = brand_logo or ""
+
+            category_brand_rsp.category.id = category_id
+            category_brand_rsp.category.name = category_name
+            if parent_category_id is not None:
+                category_brand_rsp.category.parentCategory = parent_category_id
+            category_brand_rsp.category.level = level
+            category_brand_rsp.category.isTab = is_tab
         return rsp
 
     @logger.catch
     def GetCategoryBrandList(self, request, context):
-        # 获取某一个分类的所有品牌
+        # 获取某一个分类的所有品牌, 分类和品牌信息都从进程内索引获取, 只查询关联表的brand_id
         rsp = goods_pb2.BrandListResponse()
-        try:
-            category = Category.get(Category.id == request.id)
-            category_brands = GoodsCategoryBrand.select().where(GoodsCategoryBrand.category == category)
-            rsp.total = category_brands.count()
-            for category_brand in category_brands:
-                brand_rsp = goods_pb2.BrandInfoResponse()
-                brand_rsp.id = category_brand.brand.id
-                brand_rsp.name = category_brand.brand.name
-                brand_rsp.logo = category_brand.brand.logo
-
-                rsp.data.append(brand_rsp)
-        except DoesNotExist as e:
+        if self.category_cache.get().get(request.id) is None:
             context.set_code(grpc.StatusCode.NOT_FOUND)
             context.set_details('Record does not exist')
             return rsp
 
+        brand_directory = self.brand_cache.get()
+        category_brands = GoodsCategoryBrand.select(GoodsCategoryBrand.brand_id).where(
+            GoodsCategoryBrand.category_id == request.id).tuples()
+        for brand_id, in category_brands:
+            brand = brand_directory.get(brand_id)
+            if brand is not None:
+                rsp.data.append(brand)
+        rsp.total = len(rsp.data)
+
         return rsp
 
     @logger.catch
@@ -595,5 +798,16 @@ class GoodsServices(goods_pb2_grpc.GoodsServicer):
             return empty_pb2.Empty()
 
 
-
-
+def add_encoded_handlers_to_server(servicer: GoodsServices, server):
+    """
+    BannerList是首页请求量最大的接口, 这里注册一个直接写出缓存bytes的handler
+    必须在add_GoodsServicer_to_server之前调用, grpc按注册顺序匹配方法
+    """
+    handlers = {
+        'BannerList': grpc.unary_unary_rpc_method_handler(
+            servicer.EncodedBannerList,
+            request_deserializer=goods_pb2.BannerListRequest.FromString,
+            response_serializer=bytes,
+        ),
+    }
+    server.add_generic_rpc_handlers((grpc.method_handlers_generic_handler('Goods', handlers),))
@@ -0,0 +1,91 @@
+import base64
+import json
+
+from peewee import MySQLDatabase, fn
+
+from goods_service.model.models import Goods
+
+# GoodsFilterRequest.sort 可选的排序字段, 前缀 "-" 表示倒序
+SORT_FIELDS = {
+    "id": Goods.id,
+    "shopPrice": Goods.shop_price,
+    "soldNum": Goods.sold_num,
+}
+
+
+class InvalidCursor(Exception):
+    pass
+
+
+def parse_sort(sort: str):
+    """返回 (排序字段, 是否倒序), 不支持的字段抛出 InvalidCursor"""
+    sort = sort or "id"
+    desc = sort.startswith("-")
+    name = sort[1:] if desc else sort
+    if name not in SORT_FIELDS:
+        raise InvalidCursor(f"Unsupported sort field: {name}")
+    return SORT_FIELDS[name], desc
+
+
+def order_by(query, sort: str):
+    field, desc = parse_sort(sort)
+    if field is Goods.id:
+        return query.order_by(Goods.id.desc() if desc else Goods.id)
+    if desc:
+        return query.order_by(field.desc(), Goods.id.desc())
+    return query.order_by(field, Goods.id)
+
+
+def seek(query, sort: str, key, last_id: int):
+    """
+    只取排在 (key, last_id) 之后的记录, 可以直接走 (排序字段, id) 上的索引而不需要扫描 offset 行
+    边界值取库里last_id那一行的值: shop_price在MySQL里是单精度FLOAT, 游标里的key是double,
+    直接和key比较时价格相同的行会被漏掉或重复; 只有那一行已经被物理删除时才用key
+    """
+    field, desc = parse_sort(sort)
+    if field is Goods.id:
+        return query.where(Goods.id < last_id if desc else Goods.id > last_id)
+    boundary = Goods.alias("boundary")
+    key = fn.COALESCE(boundary.select(getattr(boundary, field.name)).where(boundary.id == last_id), key)
+    if desc:
+        return query.where((field < key) | ((field == key) & (Goods.id < last_id)))
+    return query.where((field > key) | ((field == key) & (Goods.id > last_id)))
+
+
+def sort_key(goods: Goods, sort: str):
+    field, _ = parse_sort(sort)
+    return getattr(goods, field.name)
+
+
+def encode_cursor(sort: str, key, last_id: int) -> str:
+    raw = json.dumps([sort or "id", key, last_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str):
+    """返回 (sort, key, last_id), 客户端篡改或格式错误时抛出 InvalidCursor"""
+    try:
+        sort, key, last_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except Exception:
+        raise InvalidCursor("Malformed cursor")
+    if not isinstance(last_id, int):
+        raise InvalidCursor("Malformed cursor")
+    parse_sort(sort)
+    return sort, key, last_id
+
+
+def estimate_count(query) -> int:
+    """用 EXPLAIN 的 rows 估算结果集大小, 避免深翻页时每次都跑一次 COUNT(*)"""
+    database = query.model._meta.database
+    if not isinstance(database, MySQLDatabase):
+        return query.count()
+    sql, params = query.order_by().sql()
+    cursor = database.execute_sql("EXPLAIN " + sql, params)
+    columns = [column[0] for column in cursor.description]
+    row = cursor.fetchone()
+    if row is None:
+        return 0
+    plan = dict(zip(columns, row))
+    rows = plan.get("rows") or 0
+    filtered = plan.get("filtered") or 100
+    return int(rows * float(filtered) / 100)
@@ -0,0 +1,49 @@
+from loguru import logger
+from peewee import MySQLDatabase
+
+from goods_service.model.models import Goods
+
+
+def missing_indexes(model) -> list:
+    """model上声明了但库里还没有的索引"""
+    database = model._meta.database
+    existing = {index.name for index in database.get_indexes(model._meta.table_name)}
+    return [index for index in model._meta.fields_to_index() if index._name not in existing]
+
+
+def create_goods_indexes():
+    """
+    给已有的goods表补上Goods.Meta.indexes里的联合索引, 可以重复执行
+    新建的表由create_tables直接创建, 不需要执行
+    """
+    database = Goods._meta.database
+    for index in missing_indexes(Goods):
+        logger.info(f"Create index {index._name}")
+        database.execute(index)
+
+
+def create_search_index(config: dict):
+    """search配置使用fulltext后端时创建它依赖的FULLTEXT索引, 其他后端不需要索引"""
+    if config.get("backend") != "fulltext":
+        return
+    from goods_service.search.fulltext import FullTextBackend
+    FullTextBackend.create_index()
+
+
+def drop_goods_indexes():
+    """删除Goods.Meta.indexes里的联合索引, 用于对比有无索引的查询性能"""
+    database = Goods._meta.database
+    existing = {index.name for index in database.get_indexes(Goods._meta.table_name)}
+    for index in Goods._meta.fields_to_index():
+        if len(index._expressions) > 1 and index._name in existing:
+            logger.info(f"Drop index {index._name}")
+            if isinstance(database, MySQLDatabase):
+                database.execute_sql(f"DROP INDEX {index._name} ON {Goods._meta.table_name}")
+            else:
+                database.execute_sql(f"DROP INDEX {index._name}")
+
+
+if __name__ == "__main__":
+    from goods_service.settings import settings
+    create_goods_indexes()
+    create_search_index(settings.SEARCH_CONFIG)
@@ -67,6 +67,18 @@ class Goods(BaseModel):
     is_new = BooleanField(default=False)
     is_hot = BooleanField(default=False)
 
+    class Meta:
+        # GoodsList的查询都带is_deleted=False, 所以联合索引都以is_deleted开头
+        # 后面跟等值筛选的列, 最后是shop_price, 同时用于价格区间筛选和按价格排序
+        indexes = (
+            (("is_deleted", "category", "shop_price"), False),
+            (("is_deleted", "brand", "shop_price"), False),
+            (("is_deleted", "is_hot", "shop_price"), False),
+            (("is_deleted", "is_new", "shop_price"), False),
+            (("is_deleted", "shop_price"), False),
+            (("is_deleted", "sold_num"), False),
+        )
+
 
 class GoodsCategoryBrand(BaseModel):
     #品牌分类
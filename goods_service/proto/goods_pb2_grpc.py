@@ -45,6 +45,21 @@ class GoodsStub(object):
                 request_serializer=goods__pb2.GoodInfoRequest.SerializeToString,
                 response_deserializer=goods__pb2.GoodsInfoResponse.FromString,
                 )
+        self.StreamGoodsList = channel.unary_stream(
+                '/Goods/StreamGoodsList',
+                request_serializer=goods__pb2.GoodsFilterRequest.SerializeToString,
+                response_deserializer=goods__pb2.GoodsInfoResponse.FromString,
+                )
+        self.StreamBatchGetGoods = channel.unary_stream(
+                '/Goods/StreamBatchGetGoods',
+                request_serializer=goods__pb2.BatchGoodsIdInfo.SerializeToString,
+                response_deserializer=goods__pb2.GoodsInfoResponse.FromString,
+                )
+        self.ImportGoods = channel.stream_unary(
+                '/Goods/ImportGoods',
+                request_serializer=goods__pb2.CreateGoodsInfo.SerializeToString,
+                response_deserializer=goods__pb2.ImportGoodsResponse.FromString,
+                )
         self.GetAllCategorysList = channel.unary_unary(
                 '/Goods/GetAllCategorysList',
                 request_serializer=google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
@@ -92,7 +107,7 @@ class GoodsStub(object):
                 )
         self.BannerList = channel.unary_unary(
                 '/Goods/BannerList',
-                request_serializer=google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
+                request_serializer=goods__pb2.BannerListRequest.SerializeToString,
                 response_deserializer=goods__pb2.BannerListResponse.FromString,
                 )
         self.CreateBanner = channel.unary_unary(
@@ -179,6 +194,27 @@ class GoodsServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def StreamGoodsList(self, request, context):
+        """导出和重建索引用, 按id分批流式返回, 不在内存中组装完整的列表
+        忽略分页参数, 返回全部符合条件的商品
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def StreamBatchGetGoods(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ImportGoods(self, request_iterator, context):
+        """批量导入商品, 带id的更新, 不带id的新增
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def GetAllCategorysList(self, request, context):
         """商品分类
         获取所有的分类
@@ -342,6 +378,21 @@ def add_GoodsServicer_to_server(servicer, server):
                     request_deserializer=goods__pb2.GoodInfoRequest.FromString,
                     response_serializer=goods__pb2.GoodsInfoResponse.SerializeToString,
             ),
+            'StreamGoodsList': grpc.unary_stream_rpc_method_handler(
+                    servicer.StreamGoodsList,
+                    request_deserializer=goods__pb2.GoodsFilterRequest.FromString,
+                    response_serializer=goods__pb2.GoodsInfoResponse.SerializeToString,
+            ),
+            'StreamBatchGetGoods': grpc.unary_stream_rpc_method_handler(
+                    servicer.StreamBatchGetGoods,
+                    request_deserializer=goods__pb2.BatchGoodsIdInfo.FromString,
+                    response_serializer=goods__pb2.GoodsInfoResponse.SerializeToString,
+            ),
+            'ImportGoods': grpc.stream_unary_rpc_method_handler(
+                    servicer.ImportGoods,
+                    request_deserializer=goods__pb2.CreateGoodsInfo.FromString,
+                    response_serializer=goods__pb2.ImportGoodsResponse.SerializeToString,
+            ),
             'GetAllCategorysList': grpc.unary_unary_rpc_method_handler(
                     servicer.GetAllCategorysList,
                     request_deserializer=google_dot_protobuf_dot_empty__pb2.Empty.FromString,
@@ -389,7 +440,7 @@ def add_GoodsServicer_to_server(servicer, server):
             ),
             'BannerList': grpc.unary_unary_rpc_method_handler(
                     servicer.BannerList,
-                    request_deserializer=google_dot_protobuf_dot_empty__pb2.Empty.FromString,
+                    request_deserializer=goods__pb2.BannerListRequest.FromString,
                     response_serializer=goods__pb2.BannerListResponse.SerializeToString,
             ),
             'CreateBanner': grpc.unary_unary_rpc_method_handler(
@@ -544,6 +595,57 @@ class Goods(object):
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
 
+    @staticmethod
+    def StreamGoodsList(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(request, target, '/Goods/StreamGoodsList',
+            goods__pb2.GoodsFilterRequest.SerializeToString,
+            goods__pb2.GoodsInfoResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def StreamBatchGetGoods(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(request, target, '/Goods/StreamBatchGetGoods',
+            goods__pb2.BatchGoodsIdInfo.SerializeToString,
+            goods__pb2.GoodsInfoResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def ImportGoods(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_unary(request_iterator, target, '/Goods/ImportGoods',
+            goods__pb2.CreateGoodsInfo.SerializeToString,
+            goods__pb2.ImportGoodsResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
     @staticmethod
     def GetAllCategorysList(request,
             target,
@@ -709,7 +811,7 @@ class Goods(object):
             timeout=None,
             metadata=None):
         return grpc.experimental.unary_unary(request, target, '/Goods/BannerList',
-            google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
+            goods__pb2.BannerListRequest.SerializeToString,
             goods__pb2.BannerListResponse.FromString,
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
@@ -0,0 +1,14 @@
+from goods_service.search.base import SearchBackend
+
+
+def create_backend(config: dict) -> SearchBackend:
+    """根据nacos里的search配置创建搜索后端: like(默认), fulltext, inverted"""
+    backend = config.get("backend", "like")
+    if backend == "inverted":
+        from goods_service.search.inverted import InvertedIndexBackend
+        return InvertedIndexBackend(ngram=config.get("ngram", 2), refresh=config.get("refresh"))
+    if backend == "fulltext":
+        from goods_service.search.fulltext import FullTextBackend
+        return FullTextBackend()
+    from goods_service.search.like import LikeBackend
+    return LikeBackend()
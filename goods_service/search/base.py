@@ -0,0 +1,25 @@
+import abc
+
+
+class SearchBackend(metaclass=abc.ABCMeta):
+    @abc.abstractmethod
+    def filter(self, query, keywords):
+        """返回只包含名称匹配keywords的商品的query, 分页和其他过滤条件仍由调用方追加"""
+        pass
+
+    def add(self, goods_id, name):
+        pass
+
+    def remove(self, goods_id):
+        pass
+
+    def reload(self):
+        """批量写入后无法逐条更新时调用, 需要自己维护索引的后端在这里安排重建"""
+        pass
+
+    def start(self):
+        """启动后端自己的后台线程, 服务创建时调用"""
+        pass
+
+    def close(self):
+        pass
@@ -0,0 +1,29 @@
+from loguru import logger
+from playhouse.mysql_ext import Match
+
+from goods_service.model.models import Goods
+from goods_service.search import base
+
+
+class FullTextBackend(base.SearchBackend):
+    """
+    MySQL FULLTEXT + ngram parser, 索引由MySQL维护, 增删改不需要额外处理
+    索引由 python -m goods_service.model.migrations 创建(search.backend配置为fulltext时), 也可以直接调用create_index
+    """
+    INDEX_NAME = "goods_name_fulltext"
+
+    @classmethod
+    def create_index(cls):
+        """创建FULLTEXT索引, 已存在时跳过"""
+        database = Goods._meta.database
+        if cls.INDEX_NAME in {index.name for index in database.get_indexes(Goods._meta.table_name)}:
+            return
+        logger.info(f"Create index {cls.INDEX_NAME}")
+        database.execute_sql(
+            f"ALTER TABLE {Goods._meta.table_name} ADD FULLTEXT INDEX {cls.INDEX_NAME} (name) WITH PARSER ngram"
+        )
+
+    def filter(self, query, keywords):
+        # 短语模式保证和LIKE一样要求关键词连续出现
+        phrase = '"{}"'.format(keywords.replace('"', " "))
+        return query.where(Match(Goods.name, phrase, "IN BOOLEAN MODE"))
@@ -0,0 +1,159 @@
+import threading
+
+from loguru import logger
+
+from goods_service.model.models import Goods
+from goods_service.search import base
+
+
+class InvertedIndex:
+    """
+    商品名称的n-gram倒排索引, 不依赖分词, 中文和英文一样处理
+    查询先对所有gram的倒排表求交集, 再用子串匹配去掉误命中, 结果和 LIKE '%kw%' 一致
+    """
+    def __init__(self, ngram=2):
+        self.ngram = ngram
+        self.names = {}
+        self.postings = {}
+
+    def normalize(self, text: str) -> str:
+        return text.lower()
+
+    def grams(self, text: str) -> set:
+        text = self.normalize(text)
+        if len(text) < self.ngram:
+            return {text} if text else set()
+        return {text[i:i + self.ngram] for i in range(len(text) - self.ngram + 1)}
+
+    def index_grams(self, text: str) -> set:
+        """建索引用的gram: 1到ngram的每种长度都建, 短于ngram的查询整体就是一个已索引的gram"""
+        text = self.normalize(text)
+        return {text[i:i + size] for size in range(1, self.ngram + 1) for i in range(len(text) - size + 1)}
+
+    def add(self, goods_id, name):
+        self.remove(goods_id)
+        self.names[goods_id] = self.normalize(name)
+        for gram in self.index_grams(name):
+            self.postings.setdefault(gram, set()).add(goods_id)
+
+    def remove(self, goods_id):
+        name = self.names.pop(goods_id, None)
+        if name is None:
+            return
+        for gram in self.index_grams(name):
+            ids = self.postings.get(gram)
+            if ids is not None:
+                ids.discard(goods_id)
+                if not ids:
+                    del self.postings[gram]
+
+    def search(self, keywords: str) -> set:
+        keywords = self.normalize(keywords)
+        grams = sorted(self.grams(keywords), key=lambda gram: len(self.postings.get(gram, ())))
+        if not grams:
+            return set()
+        ids = set(self.postings.get(grams[0], ()))
+        for gram in grams[1:]:
+            if not ids:
+                break
+            ids &= self.postings.get(gram, set())
+        if len(keywords) > self.ngram:
+            ids = {goods_id for goods_id in ids if keywords in self.names[goods_id]}
+        return ids
+
+
+class InvertedIndexBackend(base.SearchBackend):
+    """
+    进程内倒排索引, 后台线程从数据库加载, 新索引构建完成后整体替换引用, 请求线程不会加载整表
+    本进程的增删改实时更新当前索引, 重建期间的增删改记录下来, 替换前补到新索引上
+    refresh不为空时每refresh秒重建一次, 以同步其他副本的写入; reload提前唤醒后台线程
+    第一次加载完成前, 以及命中的商品超过MAX_IDS时, 退回 LIKE '%kw%', 避免 IN 列表过长
+    """
+    # 命中的商品id超过这个数量就不拼IN列表, count和分页都改用LIKE查询
+    MAX_IDS = 1000
+    # 连续reload时两次重建之间至少间隔的秒数, 和SnapshotRefresher一致
+    MIN_INTERVAL = 1
+
+    def __init__(self, ngram=2, refresh=None):
+        self.ngram = ngram
+        self.refresh = refresh
+        self._lock = threading.Lock()
+        self._index = None
+        self._journal = None
+        self._stale = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="goods-search-index", daemon=True)
+        self._thread.start()
+
+    def _load(self) -> InvertedIndex:
+        index = InvertedIndex(self.ngram)
+        for goods in Goods.select(Goods.id, Goods.name).iterator():
+            index.add(goods.id, goods.name)
+        logger.info(f"Goods search index loaded, {len(index.names)} goods")
+        return index
+
+    def _rebuild(self):
+        with self._lock:
+            self._journal = []
+        try:
+            index = self._load()
+        except Exception:
+            with self._lock:
+                self._journal = None
+            raise
+        with self._lock:
+            # 扫表期间本进程的写入可能没被扫到, 按顺序补到新索引上
+            for goods_id, name in self._journal:
+                if name is None:
+                    index.remove(goods_id)
+                else:
+                    index.add(goods_id, name)
+            self._journal = None
+            self._index = index
+
+    def _run(self):
+        while not self._stopped.is_set():
+            self._stale.clear()
+            try:
+                self._rebuild()
+            except Exception as e:
+                logger.error(f"Load goods search index failed: {e}")
+            if self._stopped.wait(self.MIN_INTERVAL):
+                return
+            self._stale.wait(max(self.refresh - self.MIN_INTERVAL, 0) if self.refresh else None)
+
+    def filter(self, query, keywords):
+        with self._lock:
+            ids = self._index.search(keywords) if self._index is not None else None
+        if ids is None or len(ids) > self.MAX_IDS:
+            return query.where(Goods.name.contains(keywords))
+        return query.where(Goods.id.in_(sorted(ids)))
+
+    def _record(self, goods_id, name):
+        with self._lock:
+            if self._index is not None:
+                if name is None:
+                    self._index.remove(goods_id)
+                else:
+                    self._index.add(goods_id, name)
+            if self._journal is not None:
+                self._journal.append((goods_id, name))
+
+    def add(self, goods_id, name):
+        self._record(goods_id, name)
+
+    def remove(self, goods_id):
+        self._record(goods_id, None)
+
+    def reload(self):
+        # 只通知后台线程重建, 重建完成前继续用当前索引
+        self._stale.set()
+
+    def close(self):
+        self._stopped.set()
+        self._stale.set()
+        if self._thread is not None:
+            self._thread.join()
@@ -1,20 +1,20 @@
+import asyncio
 import logging
 
-import grpc
 import signal
 import sys
 import os
 import argparse
 import environ
 import uuid
-from concurrent import futures
 from loguru import logger
 
 BASE_DIR = os.path.dirname(os.path.abspath(os.path.dirname(__file__)))
 sys.path.insert(0, BASE_DIR)
 
 from goods_service.proto import goods_pb2_grpc
-from goods_service.handler.handler import GoodsServices
+from goods_service.handler.handler import GoodsServices, add_encoded_handlers_to_server
+from goods_service.handler.aio import AsyncGoodsServices
 from goods_service.settings import settings
 from common.server import BaseServer
 from common.grpc_health.v1 import health_pb2, health_pb2_grpc
@@ -23,6 +23,8 @@ from common.grpc_health.v1 import health
 
 class GoodsServiceServer(BaseServer):
     SERVICE_NAME = "goods-srv"
+    servicer = None
+    stopping = False
 
     def __init__(self, host, port):
         super(GoodsServiceServer, self).__init__()
@@ -31,15 +33,20 @@ class GoodsServiceServer(BaseServer):
         self.SERVICE_PORT = port
         self.CONSUL_HOST = settings.data["consul"]["host"]
         self.CONSUL_PORT = settings.data["consul"]["port"]
+        self.SERVER_CONFIG = settings.data.get("grpc", {})
 
     def onExit(self, signo, frame):
         logger.info("Goods Service terminate")
         self.unregister()
+        if self.servicer is not None:
+            self.servicer.close()
         sys.exit(0)
 
     def serve(self):
-        self.server = grpc.server(futures.ThreadPoolExecutor(max_workers=40))
-        goods_pb2_grpc.add_GoodsServicer_to_server(GoodsServices(), self.server)
+        self.server = self.create_server(max_workers=40)
+        self.servicer = GoodsServices()
+        add_encoded_handlers_to_server(self.servicer, self.server)
+        goods_pb2_grpc.add_GoodsServicer_to_server(self.servicer, self.server)
         health_servicer = health.HealthServicer()
         health_pb2_grpc.add_HealthServicer_to_server(health_servicer, self.server)
         self.server.add_insecure_port(f'[::]:{self.SERVICE_PORT}')
@@ -50,6 +57,36 @@ class GoodsServiceServer(BaseServer):
         self.register()
         self.server.wait_for_termination()
 
+    async def stop_aio(self, grace=5):
+        # 由事件循环的信号回调调用: 先注销, 等进行中的请求结束后再关闭线程池
+        if self.stopping:
+            return
+        self.stopping = True
+        logger.info("Goods Service (aio) terminate")
+        self.unregister()
+        await self.server.stop(grace)
+        await asyncio.get_running_loop().run_in_executor(None, self.servicer.close)
+
+    async def serve_aio(self):
+        # grpc.aio模式, 数据库操作在有界线程池里执行, 线程数默认为DB_WORKERS
+        workers = self.server_workers(settings.DB_WORKERS)
+        self.server = self.create_aio_server(workers)
+        self.servicer = AsyncGoodsServices(GoodsServices(), max_workers=workers)
+        add_encoded_handlers_to_server(self.servicer, self.server)
+        goods_pb2_grpc.add_GoodsServicer_to_server(self.servicer, self.server)
+        health_servicer = health.aio.HealthServicer()
+        health_pb2_grpc.add_HealthServicer_to_server(health_servicer, self.server)
+        self.server.add_insecure_port(f'[::]:{self.SERVICE_PORT}')
+        # 信号处理放在事件循环里, 停止server后wait_for_termination返回, serve_aio正常结束
+        loop = asyncio.get_running_loop()
+        stop_tasks = []
+        for signo in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signo, lambda: stop_tasks.append(loop.create_task(self.stop_aio())))
+        logger.info("Start Goods Srv Service (aio) at {}:{}".format(self.SERVICE_HOST, self.SERVICE_PORT))
+        await self.server.start()
+        self.register()
+        await self.server.wait_for_termination()
+
 
 if __name__ == "__main__":
     logging.basicConfig()
@@ -63,7 +100,17 @@ if __name__ == "__main__":
                         type=int,
                         default=50059,
                         help="port")
+    parser.add_argument('--processes',
+                        nargs="?",
+                        type=int,
+                        default=1,
+                        help="worker processes sharing the port")
+    parser.add_argument('--aio', action="store_true", help="serve with grpc.aio")
     args = parser.parse_args()
     server = GoodsServiceServer(args.host, args.port)
-    server.serve()
+    target = (lambda: asyncio.run(server.serve_aio())) if args.aio else server.serve
+    if args.processes > 1:
+        server.prefork(args.processes, target)
+    else:
+        target()
 
@@ -2,6 +2,7 @@ import json
 
 import environ
 import nacos
+import redis
 from playhouse.pool import PooledMySQLDatabase
 from playhouse.shortcuts import ReconnectMixin
 from loguru import logger
@@ -42,4 +43,28 @@ mysql_config = data['mysql']
 DB = ReconnectMySQLDataBase(database=mysql_config['db'], host=mysql_config['host'], port=mysql_config['port'], user=mysql_config['user'],
                             password=mysql_config['password'])
 HOST = data['host']
+
+# 商品详情缓存的共享层, 没有配置redis时只使用进程内缓存
+redis_config = data.get('redis')
+Redis_client = None
+if redis_config:
+    pool = redis.ConnectionPool(host=redis_config['host'], port=redis_config['port'])
+    Redis_client = redis.StrictRedis(connection_pool=pool)
+
+# 进程内缓存配置, ttl单位为秒, 不配置则只依赖写操作失效
+cache_config = data.get('cache', {})
+CATEGORY_CACHE_TTL = cache_config.get('category_ttl')
+BANNER_CACHE_TTL = cache_config.get('banner_ttl')
+BRAND_CACHE_TTL = cache_config.get('brand_ttl')
+GOODS_CACHE_SIZE = cache_config.get('goods_size', 10000)
+GOODS_CACHE_EXPIRE = cache_config.get('goods_expire', 3600)
+# GoodsList列式快照的刷新间隔, 需要安装numpy, 不配置则GoodsList直接查库
+GOODS_SNAPSHOT_REFRESH = cache_config.get('goods_snapshot_refresh')
+# 商品点击数在内存中累加, 每隔多少秒写回一次数据库
+CLICK_FLUSH_INTERVAL = data.get('click_flush_interval', 5)
+
+# 商品名称搜索后端: like(默认), fulltext, inverted
+SEARCH_CONFIG = data.get('search', {})
+# grpc.aio模式下执行数据库操作的线程数, 即同时访问数据库的上限
+DB_WORKERS = data.get('db_workers', 40)
 logger.info("Read config from nacos " + f"{NACOS['Host']}:{NACOS['Port']}")
@@ -0,0 +1,112 @@
+import asyncio
+import multiprocessing
+import os
+import tempfile
+import time
+from concurrent import futures
+
+import grpc
+
+from goods_service.test import offline
+
+# 服务端子进程和压测进程要看到同一份数据, 用SQLite文件而不是内存库
+DB_PATH = os.path.join(tempfile.gettempdir(), "goods_aio_benchmark.db")
+settings = offline.install(DB_PATH)
+
+from goods_service.handler.aio import AsyncGoodsServices  # noqa: E402
+from goods_service.handler.handler import GoodsServices, add_encoded_handlers_to_server  # noqa: E402
+from goods_service.model.models import Brands, Category, Goods  # noqa: E402
+from goods_service.proto import goods_pb2, goods_pb2_grpc  # noqa: E402
+
+
+def serve_sync(port, ready):
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=40))
+    servicer = GoodsServices()
+    add_encoded_handlers_to_server(servicer, server)
+    goods_pb2_grpc.add_GoodsServicer_to_server(servicer, server)
+    server.add_insecure_port(f"127.0.0.1:{port}")
+    server.start()
+    ready.set()
+    server.wait_for_termination()
+
+
+def serve_aio(port, ready):
+    async def serve():
+        server = grpc.aio.server()
+        servicer = AsyncGoodsServices(GoodsServices(), max_workers=settings.DB_WORKERS)
+        add_encoded_handlers_to_server(servicer, server)
+        goods_pb2_grpc.add_GoodsServicer_to_server(servicer, server)
+        server.add_insecure_port(f"127.0.0.1:{port}")
+        await server.start()
+        ready.set()
+        await server.wait_for_termination()
+    asyncio.run(serve())
+
+
+class AioBenchmark:
+    """
+    分别在子进程里启动同步和grpc.aio的商品服务, 用concurrency个并发请求压测GoodsList
+    每个并发连续发calls个请求, 统计延迟的p50/p99和总吞吐
+    数据是临时SQLite文件里造的goods个商品, 不需要nacos和MySQL
+    """
+    def __init__(self, concurrency=1000, calls=20, port=50159, goods=10000):
+        self.concurrency = concurrency
+        self.calls = calls
+        self.port = port
+        self.goods = goods
+
+    def seed(self):
+        if os.path.exists(DB_PATH):
+            os.remove(DB_PATH)
+        settings.DB.create_tables([Category, Brands, Goods])
+        category = Category.create(name="c", level=1)
+        brand = Brands.create(name="b", logo="")
+        with settings.DB.atomic():
+            for i in range(0, self.goods, 1000):
+                Goods.insert_many([{"category": category, "brand": brand, "name": f"goods {n}", "goods_sn": str(n),
+                                    "shop_price": n % 5000, "goods_brief": "", "images": [], "desc_images": [],
+                                    "goods_front_image": ""}
+                                   for n in range(i, min(i + 1000, self.goods))]).execute()
+        # 子进程里重新连接
+        settings.DB.close()
+
+    async def load(self) -> list:
+        latencies = []
+        request = goods_pb2.GoodsFilterRequest(pagePerNums=10, countMode=goods_pb2.COUNT_NONE)
+        async with grpc.aio.insecure_channel(f"127.0.0.1:{self.port}") as channel:
+            stub = goods_pb2_grpc.GoodsStub(channel)
+            await stub.GoodsList(request)
+
+            async def worker():
+                for _ in range(self.calls):
+                    started = time.perf_counter()
+                    await stub.GoodsList(request)
+                    latencies.append(time.perf_counter() - started)
+
+            await asyncio.gather(*(worker() for _ in range(self.concurrency)))
+        return latencies
+
+    def measure(self, name, target):
+        ready = multiprocessing.Event()
+        process = multiprocessing.Process(target=target, args=(self.port, ready), daemon=True)
+        process.start()
+        ready.wait(30)
+        try:
+            started = time.perf_counter()
+            latencies = sorted(asyncio.run(self.load()))
+            elapsed = time.perf_counter() - started
+        finally:
+            process.terminate()
+            process.join()
+        p50 = latencies[len(latencies) // 2] * 1000
+        p99 = latencies[int(len(latencies) * 0.99)] * 1000
+        print(f"{name}: p50 {p50:.1f} ms, p99 {p99:.1f} ms, {len(latencies) / elapsed:.0f} req/s")
+
+    def run(self):
+        self.seed()
+        self.measure("sync", serve_sync)
+        self.measure("aio", serve_aio)
+
+
+if __name__ == "__main__":
+    AioBenchmark().run()
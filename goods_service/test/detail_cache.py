@@ -0,0 +1,49 @@
+from goods_service.test import offline
+
+
+class DownRedis:
+    """模拟Redis不可用, 所有命令都抛异常"""
+    def pipeline(self, transaction=True):
+        raise ConnectionError("redis is down")
+
+    def mget(self, keys):
+        raise ConnectionError("redis is down")
+
+    def incr(self, key):
+        raise ConnectionError("redis is down")
+
+
+settings = offline.install(Redis_client=DownRedis())
+
+from goods_service.handler.handler import GoodsServices  # noqa: E402
+from goods_service.model.models import Brands, Category, Goods  # noqa: E402
+from goods_service.proto import goods_pb2  # noqa: E402
+from goods_service.test.goods import Context, QueryCounter  # noqa: E402
+
+
+class DetailCacheTest:
+    """Redis不可用时商品详情直接查库, 不能返回空结果, 也不能回填不知道版本的缓存"""
+    def __init__(self):
+        settings.DB.create_tables([Category, Brands, Goods])
+        category = Category.create(name="c", level=1)
+        brand = Brands.create(name="b", logo="")
+        for i in range(5):
+            Goods.create(category=category, brand=brand, name=f"goods-{i}", goods_brief="", images=[],
+                         desc_images=[], goods_front_image="", shop_price=i)
+        self.service = GoodsServices()
+        self.context = Context()
+
+    def redis_down(self):
+        ids = [goods.id for goods in Goods.select(Goods.id)]
+        for _ in range(2):
+            # 两次都查库, 第一次的结果没有写进本地缓存
+            with QueryCounter(settings.DB) as counter:
+                rsp = self.service.BatchGetGoods(goods_pb2.BatchGoodsIdInfo(id=ids), self.context)
+            assert [info.id for info in rsp.data] == ids
+            assert counter.count == 1, f"BatchGetGoods ran {counter.count} queries with redis down"
+        assert not self.service.detail_cache.local._data
+        self.service.close()
+
+
+if __name__ == "__main__":
+    DetailCacheTest().redis_down()
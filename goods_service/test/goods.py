@@ -0,0 +1,76 @@
+from goods_service.handler.handler import GoodsServices
+from goods_service.model.models import Goods
+from goods_service.proto import goods_pb2
+from goods_service.settings import settings
+
+
+class QueryCounter:
+    """统计 with 块内对数据库执行的SQL条数"""
+    def __init__(self, database):
+        self.database = database
+        self.count = 0
+
+    def __enter__(self):
+        execute_sql = self.database.execute_sql
+
+        def counted(*args, **kwargs):
+            self.count += 1
+            return execute_sql(*args, **kwargs)
+
+        self.database.execute_sql = counted
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        del self.database.execute_sql
+
+
+class Context:
+    def set_code(self, code):
+        raise AssertionError(f"Unexpected status {code}")
+
+    def set_details(self, details):
+        pass
+
+
+class GoodsTest:
+    def __init__(self):
+        # 直接调用handler, 只依赖数据库
+        self.service = GoodsServices()
+        self.context = Context()
+
+    def batch_get_queries(self):
+        ids = [goods.id for goods in Goods.select(Goods.id).limit(100)]
+        # bump epoch让详情缓存全部失效, 缓存全部未命中时也只查一次库
+        self.service.detail_cache.bump_all()
+        with QueryCounter(settings.DB) as counter:
+            rsp = self.service.BatchGetGoods(goods_pb2.BatchGoodsIdInfo(id=ids), self.context)
+        assert rsp.total == len(ids)
+        assert counter.count == 1, f"Cold BatchGetGoods ran {counter.count} queries for {len(ids)} goods"
+        # 刚回填的缓存全部命中, 不查库
+        with QueryCounter(settings.DB) as counter:
+            rsp = self.service.BatchGetGoods(goods_pb2.BatchGoodsIdInfo(id=ids), self.context)
+        assert rsp.total == len(ids)
+        assert counter.count == 0, f"Warm BatchGetGoods ran {counter.count} queries for {len(ids)} goods"
+
+    def goods_list_queries(self):
+        with QueryCounter(settings.DB) as counter:
+            rsp = self.service.GoodsList(goods_pb2.GoodsFilterRequest(pagePerNums=50,
+                                                                      countMode=goods_pb2.COUNT_NONE), self.context)
+        assert rsp.data
+        assert counter.count == 1, f"GoodsList ran {counter.count} queries for {len(rsp.data)} goods"
+
+    def goods_list_facets(self):
+        self.service.brand_cache.get()
+        with QueryCounter(settings.DB) as counter:
+            rsp = self.service.GoodsList(goods_pb2.GoodsFilterRequest(pagePerNums=50, facets=True), self.context)
+        # 分页、total和分面统计各一条SQL
+        assert counter.count == 3, f"GoodsList with facets ran {counter.count} queries"
+        assert sum(brand.count for brand in rsp.facets.brands) == rsp.total
+        assert sum(price.count for price in rsp.facets.prices) == rsp.total
+
+
+if __name__ == "__main__":
+    goods = GoodsTest()
+    goods.batch_get_queries()
+    goods.goods_list_queries()
+    goods.goods_list_facets()
@@ -0,0 +1,119 @@
+import random
+import sys
+import time
+
+from peewee import SqliteDatabase
+
+from goods_service.test import offline
+
+# 只有测MySQL时才读nacos里的配置
+MYSQL = sys.argv[1:2] == ["mysql"]
+if not MYSQL:
+    offline.install()
+
+from goods_service.handler.handler import GoodsServices  # noqa: E402
+from goods_service.model.migrations import create_goods_indexes, drop_goods_indexes  # noqa: E402
+from goods_service.model.models import Brands, Category, Goods  # noqa: E402
+from goods_service.proto import goods_pb2  # noqa: E402
+from goods_service.test.goods import Context  # noqa: E402
+
+# GoodsList常见的筛选组合
+FILTER_MATRIX = {
+    "all": {},
+    "category": {"topCategory": 1},
+    "brand": {"brand": 1},
+    "hot": {"isHot": True},
+    "new": {"isNew": True},
+    "price": {"priceMin": 100, "priceMax": 200},
+    "brand+price": {"brand": 1, "priceMin": 100, "priceMax": 500},
+    "category+sort price": {"topCategory": 1, "sort": "shopPrice"},
+    "hot+sort sold": {"isHot": True, "sort": "-soldNum"},
+    "sort price page 50": {"sort": "shopPrice", "pages": 50},
+}
+
+
+class GoodsIndexBenchmark:
+    """
+    对FILTER_MATRIX里的每种筛选跑GoodsList, 统计平均耗时
+    默认在内存SQLite里造数据, 分别测无联合索引和有联合索引的耗时
+    传入mysql参数时直接测当前配置的库, 不改动索引, 在执行migrations前后各跑一次对比
+    """
+    def __init__(self, goods=50000, categories=50, brands=200, rounds=20):
+        self.goods = goods
+        self.categories = categories
+        self.brands = brands
+        self.rounds = rounds
+        self.context = Context()
+
+    def seed(self):
+        random.seed(0)
+        Category.insert(name="root", level=1).execute()
+        Category.insert_many([{"name": f"c{i}", "level": 2, "parent_category": 1}
+                              for i in range(self.categories)]).execute()
+        Brands.insert_many([{"name": f"b{i}", "logo": ""} for i in range(self.brands)]).execute()
+        rows = []
+        for i in range(self.goods):
+            rows.append({
+                "category": random.randint(2, self.categories + 1),
+                "brand": random.randint(1, self.brands),
+                "name": f"goods {i}",
+                "goods_sn": str(i),
+                "shop_price": round(random.uniform(1, 5000), 2),
+                "sold_num": random.randint(0, 10000),
+                "goods_brief": "",
+                "images": [],
+                "desc_images": [],
+                "goods_front_image": "",
+                "is_new": random.random() < 0.1,
+                "is_hot": random.random() < 0.05,
+                "is_deleted": random.random() < 0.02,
+            })
+            if len(rows) == 1000:
+                Goods.insert_many(rows).execute()
+                rows = []
+        if rows:
+            Goods.insert_many(rows).execute()
+
+    def measure(self, service) -> dict:
+        results = {}
+        for name, params in FILTER_MATRIX.items():
+            request = goods_pb2.GoodsFilterRequest(pagePerNums=20, **params)
+            service.GoodsList(request, self.context)
+            started = time.perf_counter()
+            for _ in range(self.rounds):
+                service.GoodsList(request, self.context)
+            results[name] = (time.perf_counter() - started) / self.rounds * 1000
+        return results
+
+    def report(self, *columns):
+        print(f"{'filter':<22}" + "".join(f"{label:>14}" for label, _ in columns))
+        for name in FILTER_MATRIX:
+            print(f"{name:<22}" + "".join(f"{results[name]:>11.2f} ms" for _, results in columns))
+
+    def run_sqlite(self):
+        database = SqliteDatabase(":memory:")
+        with database.bind_ctx([Category, Brands, Goods]):
+            database.create_tables([Category, Brands, Goods])
+            self.seed()
+            service = GoodsServices()
+            drop_goods_indexes()
+            database.execute_sql("ANALYZE")
+            without = self.measure(service)
+            create_goods_indexes()
+            database.execute_sql("ANALYZE")
+            indexed = self.measure(service)
+            service.close()
+        self.report(("no index", without), ("indexed", indexed))
+
+    def run_mysql(self):
+        service = GoodsServices()
+        results = self.measure(service)
+        service.close()
+        self.report((Goods._meta.database.database, results))
+
+
+if __name__ == "__main__":
+    if MYSQL:
+        GoodsIndexBenchmark().run_mysql()
+    else:
+        GoodsIndexBenchmark().run_sqlite()
@@ -0,0 +1,32 @@
+import sys
+import types
+
+from peewee import SqliteDatabase
+
+
+def install(database=":memory:", **overrides):
+    """
+    不读nacos, 用SQLite代替settings里的数据库, 其余配置取settings.py里的默认值
+    需要在导入goods_service.model和handler之前调用, 用于离线跑测试和压测
+    """
+    settings = types.ModuleType("goods_service.settings.settings")
+    settings.DB = SqliteDatabase(database)
+    settings.data = {}
+    settings.HOST = "127.0.0.1"
+    settings.Redis_client = None
+    settings.CATEGORY_CACHE_TTL = None
+    settings.BANNER_CACHE_TTL = None
+    settings.BRAND_CACHE_TTL = None
+    settings.GOODS_CACHE_SIZE = 10000
+    settings.GOODS_CACHE_EXPIRE = 3600
+    settings.GOODS_SNAPSHOT_REFRESH = None
+    settings.CLICK_FLUSH_INTERVAL = 5
+    settings.SEARCH_CONFIG = {}
+    settings.DB_WORKERS = 40
+    for name, value in overrides.items():
+        setattr(settings, name, value)
+
+    import goods_service.settings as package
+    sys.modules[settings.__name__] = settings
+    package.settings = settings
+    return settings
@@ -0,0 +1,84 @@
+import struct
+
+from goods_service.test import offline
+
+settings = offline.install()
+
+from goods_service.cache.snapshot import GoodsSnapshot  # noqa: E402
+from goods_service.handler import pagination  # noqa: E402
+from goods_service.handler.handler import GoodsServices  # noqa: E402
+from goods_service.model.models import Brands, Category, Goods  # noqa: E402
+from goods_service.proto import goods_pb2  # noqa: E402
+from goods_service.test.goods import Context  # noqa: E402
+
+# 都不能用二进制精确表示, 19.9有多件商品价格相同
+PRICES = [9.9, 19.9, 19.9, 19.9, 19.9, 19.9, 19.9, 19.9, 29.9, 0.1]
+
+
+def single(value: float) -> float:
+    """MySQL FLOAT列里实际存的值"""
+    return struct.unpack("f", struct.pack("f", value))[0]
+
+
+class CursorTest:
+    """
+    SQLite的REAL是双精度, 这里直接存入单精度舍入后的价格来模拟MySQL的FLOAT列,
+    游标里的价格换成驱动返回的十进制值(19.9), 翻完所有页每个商品都要恰好出现一次
+    """
+    def __init__(self):
+        settings.DB.create_tables([Category, Brands, Goods])
+        category = Category.create(name="c", level=1)
+        brand = Brands.create(name="b", logo="")
+        self.displayed = {}
+        for price in PRICES:
+            goods = Goods.create(category=category, brand=brand, name="g", goods_brief="", images=[],
+                                 desc_images=[], goods_front_image="", shop_price=single(price))
+            self.displayed[single(price)] = price
+        self.service = GoodsServices()
+        self.context = Context()
+
+    def driver_cursor(self, cursor: str) -> str:
+        sort, key, last_id = pagination.decode_cursor(cursor)
+        return pagination.encode_cursor(sort, self.displayed.get(key, key), last_id)
+
+    def expected(self, desc: bool) -> list:
+        rows = Goods.select(Goods.id, Goods.shop_price)
+        return [goods.id for goods in sorted(rows, key=lambda goods: (goods.shop_price, goods.id), reverse=desc)]
+
+    def walk(self, sort: str) -> list:
+        ids, cursor = [], ""
+        for _ in range(len(PRICES) + 1):
+            rsp = self.service.GoodsList(goods_pb2.GoodsFilterRequest(pagePerNums=3, sort=sort, cursor=cursor,
+                                                                      countMode=goods_pb2.COUNT_NONE), self.context)
+            ids.extend(goods.id for goods in rsp.data)
+            if not rsp.nextCursor:
+                return ids
+            cursor = self.driver_cursor(rsp.nextCursor)
+        raise AssertionError(f"Cursor for {sort} did not terminate: {ids}")
+
+    def tied_float_prices(self):
+        for sort, desc in (("shopPrice", False), ("-shopPrice", True)):
+            ids = self.walk(sort)
+            assert ids == self.expected(desc), (sort, ids, self.expected(desc))
+
+    def snapshot_tied_float_prices(self):
+        if not GoodsSnapshot.available():
+            return
+        snapshot = GoodsSnapshot.load()
+        for desc in (False, True):
+            mask = snapshot.mask(goods_pb2.GoodsFilterRequest())
+            ids = []
+            while True:
+                page = snapshot.page(mask, "shop_price", desc, 0, 3)
+                ids.extend(goods_id for goods_id, _ in page)
+                if len(page) < 3 or len(ids) > len(PRICES):
+                    break
+                goods_id, key = page[-1]
+                mask = snapshot.seek(mask, "shop_price", desc, self.displayed.get(key, key), goods_id)
+            assert ids == self.expected(desc), (desc, ids, self.expected(desc))
+
+
+if __name__ == "__main__":
+    test = CursorTest()
+    test.tied_float_prices()
+    test.snapshot_tied_float_prices()
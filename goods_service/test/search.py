@@ -0,0 +1,95 @@
+import os
+import tempfile
+import time
+
+from goods_service.test import offline
+
+# 索引在后台线程加载, 内存SQLite每个连接是独立的库, 这里用临时文件
+DB_PATH = os.path.join(tempfile.gettempdir(), "goods_search_test.db")
+if os.path.exists(DB_PATH):
+    os.remove(DB_PATH)
+settings = offline.install(DB_PATH)
+
+from goods_service.model.models import Brands, Category, Goods  # noqa: E402
+from goods_service.search.inverted import InvertedIndex, InvertedIndexBackend  # noqa: E402
+
+NAMES = ["小米手机 Redmi", "华为手机 Mate", "苹果 iPhone 手机壳", "Redmi 充电器"]
+
+
+class SearchTest:
+    """倒排索引的结果要和 LIKE '%kw%' 一致, 在内存SQLite上执行"""
+    def __init__(self):
+        settings.DB.create_tables([Category, Brands, Goods])
+        category = Category.create(name="c", level=1)
+        brand = Brands.create(name="b", logo="")
+        for name in NAMES:
+            Goods.create(category=category, brand=brand, name=name, goods_brief="", images=[], desc_images=[],
+                         goods_front_image="", shop_price=1)
+
+    def like(self, keywords) -> set:
+        return {goods.id for goods in Goods.select(Goods.id).where(Goods.name.contains(keywords))}
+
+    def ngram_lengths(self):
+        for ngram in (2, 3, 4):
+            index = InvertedIndex(ngram)
+            for goods in Goods.select(Goods.id, Goods.name):
+                index.add(goods.id, goods.name)
+            # 长度在1到ngram之间的查询都要能查到
+            for keywords in ("手", "手机", "手机壳", "redmi", "iphone 手机", "不存在"):
+                assert index.search(keywords) == self.like(keywords), (ngram, keywords)
+
+    def search(self, backend, keywords) -> set:
+        return {goods.id for goods in backend.filter(Goods.select(Goods.id), keywords)}
+
+    def wait_loaded(self, backend, timeout=5):
+        deadline = time.monotonic() + timeout
+        while backend._index is None:
+            assert time.monotonic() < deadline, "search index not loaded"
+            time.sleep(0.01)
+
+    def refresh(self):
+        backend = InvertedIndexBackend(ngram=3, refresh=1.5)
+        # 加载完成前退回LIKE, 请求线程不扫表
+        assert self.search(backend, "手机") == self.like("手机")
+        assert backend._index is None
+        backend.start()
+        self.wait_loaded(backend)
+        assert self.search(backend, "手机") == self.like("手机")
+        # 其他副本写入的商品, refresh到期后重建索引才能查到
+        Goods.update(name="小米 手机 青春版").where(Goods.id == 4).execute()
+        assert self.search(backend, "手机") != self.like("手机")
+        time.sleep(2)
+        assert self.search(backend, "手机") == self.like("手机")
+        backend.close()
+        Goods.update(name="Redmi 充电器").where(Goods.id == 4).execute()
+
+    def rebuild_journal(self):
+        # 扫表期间本进程的增删要补到新索引上
+        backend = InvertedIndexBackend(ngram=2)
+        load = backend._load
+
+        def slow_load():
+            backend.add(2, "华为 平板")
+            backend.remove(1)
+            return load()
+        backend._load = slow_load
+        backend._rebuild()
+        assert self.search(backend, "平板") == {2}
+        assert 1 not in self.search(backend, "redmi")
+
+    def max_ids(self):
+        backend = InvertedIndexBackend(ngram=2)
+        backend._rebuild()
+        backend.MAX_IDS = 1
+        # 命中超过MAX_IDS时不拼IN列表
+        query = backend.filter(Goods.select(Goods.id), "手机")
+        assert " IN " not in query.sql()[0], query.sql()
+        assert {goods.id for goods in query} == self.like("手机")
+
+
+if __name__ == "__main__":
+    search = SearchTest()
+    search.ngram_lengths()
+    search.refresh()
+    search.rebuild_journal()
+    search.max_ids()
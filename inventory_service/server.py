@@ -1,13 +1,11 @@
 import logging
 
-import grpc
 import signal
 import sys
 import os
 import argparse
 import environ
 import uuid
-from concurrent import futures
 from loguru import logger
 from rocketmq.client import PushConsumer, ConsumeStatus
 BASE_DIR = os.path.dirname(os.path.abspath(os.path.dirname(__file__)))
@@ -31,14 +29,16 @@ class InventoryServiceServer(BaseServer):
         self.SERVICE_PORT = port
         self.CONSUL_HOST = settings.data["consul"]["host"]
         self.CONSUL_PORT = settings.data["consul"]["port"]
+        self.SERVER_CONFIG = settings.data.get("grpc", {})
 
     def onExit(self, signo, frame):
         logger.info("Inventory Service terminate")
         self.unregister()
+        super(InventoryServiceServer, self).onExit(signo, frame)
         sys.exit(0)
 
     def serve(self):
-        self.server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
+        self.server = self.create_server(max_workers=10)
         inventory_pb2_grpc.add_InventoryServicer_to_server(InventoryService(), self.server)
         health_servicer = health.HealthServicer()
         health_pb2_grpc.add_HealthServicer_to_server(health_servicer, self.server)
@@ -68,6 +68,14 @@ if __name__ == "__main__":
                         type=int,
                         default=50061,
                         help="port")
+    parser.add_argument('--processes',
+                        nargs="?",
+                        type=int,
+                        default=1,
+                        help="worker processes sharing the port")
     args = parser.parse_args()
     server = InventoryServiceServer(args.host, args.port)
-    server.serve()
+    if args.processes > 1:
+        server.prefork(args.processes)
+    else:
+        server.serve()
@@ -1,27 +1,20 @@
 import json
-import grpc
-import consul
 
 from google.protobuf import empty_pb2
 
+from common.channel_pool import ChannelPool
+from common.register import consul
+
 from inventory_service.proto import inventory_pb2, inventory_pb2_grpc
 from inventory_service.settings import settings
 
 class InventoryTest:
     def __init__(self):
         #连接grpc服务器
-        c = consul.Consul(host="192.168.0.10", port=8500)
-        services = c.agent.services()
-        ip = ""
-        port = ""
-        for key, value in services.items():
-            if value["Service"] == "inventory-srv":
-                ip = value["Address"]
-                port = value["Port"]
-                break
-        if not ip:
+        channels = ChannelPool(consul.ConsulRegister("192.168.0.10", 8500))
+        channel = channels.get("inventory-srv")
+        if channel is None:
             raise Exception()
-        channel = grpc.insecure_channel(f"{ip}:{port}")
         self.inventory_stub = inventory_pb2_grpc.InventoryStub(channel)
 
     def set_inv(self):
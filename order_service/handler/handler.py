@@ -10,10 +10,17 @@ from random import Random
 from datetime import datetime
 from order_service.model.model import *
 from google.protobuf import empty_pb2
-from common.register import consul
+from common.channel_pool import ChannelPool
+from order_service.handler.pending import PendingOrders
+from common.register.balancer import Balancer
+from common.register.resolver import ConsulResolver
 from order_service.settings import settings
 from order_service.proto import goods_pb2, goods_pb2_grpc, inventory_pb2, inventory_pb2_grpc
-from rocketmq.client import Producer, TransactionStatus, TransactionMQProducer, Message, SendStatus, ConsumeStatus
+from rocketmq.client import TransactionStatus, Message, SendStatus, ConsumeStatus
+from common.mq import producers
+
+
+producers.configure(settings.RocketMQ_HOST, settings.RocketMQ_PORT)
 
 
 def generate_order_sn(user_id):
@@ -39,13 +46,9 @@ def order_timeout(msg):
                 msg.set_body(json.dumps({
                     "orderSn": order_sn
                 }))
-                sync_producer = Producer("order_sender")
-                sync_producer.set_name_server_address(f"{settings.RocketMQ_HOST}:{settings.RocketMQ_PORT}")
-                sync_producer.start()
-                ret = sync_producer.send_sync(msg)
+                ret = producers.get("order_sender").send_sync(msg)
                 if ret.status != SendStatus.OK:
                     raise Exception("发送失败")
-                sync_producer.shutdown()
         except Exception as e:
             logger.info(e)
             txn.rollback()
@@ -53,22 +56,66 @@ def order_timeout(msg):
     return ConsumeStatus.CONSUME_SUCCESS
 
 
-local_execute_dict = {}
 class OrderService(order_pb2_grpc.OrderServicer):
+    def __init__(self):
+        # 访问商品、库存服务的channel按地址复用, 不再每个订单新建连接
+        self.resolver = ConsulResolver(settings.CONSUL_HOST, settings.CONSUL_POST)
+        self.channels = ChannelPool(self.resolver)
+        # 每次调用商品、库存服务都按策略在它们的实例间选一个
+        self.balancer = Balancer(self.resolver, self.channels, policy=settings.LB_POLICY)
+        self.pending = PendingOrders()
+
+    def close(self):
+        logger.info(f"Consul resolver seconds since last refresh: {self.resolver.metrics()}")
+        self.resolver.close()
+        self.channels.close()
 
     @logger.catch
     def CartItemList(self, request: order_pb2.UserInfo, context):
-        items = ShoppingCart.select().where(ShoppingCart.user == request.id)
         rsp = order_pb2.CartItemListResponse()
-        rsp.total = items.count()
+        # 购物车不分页, 条数直接取查询结果, 不再单独count一次
+        for item in ShoppingCart.select().where(ShoppingCart.user == request.id):
+            rsp.data.add(id=item.id, userId=item.user, goodsId=item.goods, nums=item.nums, checked=item.checked)
+        rsp.total = len(rsp.data)
+        return rsp
+
+    @logger.catch
+    def CartItemDetailList(self, request: order_pb2.UserInfo, context):
+        items = list(ShoppingCart.select().where(ShoppingCart.user == request.id))
+        rsp = order_pb2.CartItemDetailListResponse(total=len(items))
+        if not items:
+            return rsp
+
+        goods_channel = self.balancer.channel(settings.Goods_srv_name)
+        if goods_channel is None:
+            context.set_code(grpc.StatusCode.NOT_FOUND)
+            context.set_details("Goods service not available")
+            return order_pb2.CartItemDetailListResponse()
+        # 所有商品一次批量查询, 只要名称、图片和价格; 请求在途时先填好购物车条目
+        goods_future = goods_pb2_grpc.GoodsStub(goods_channel).BatchGetGoods.future(goods_pb2.BatchGoodsIdInfo(
+            id=list({item.goods for item in items}), view=goods_pb2.VIEW_SUMMARY))
         for item in items:
-            item_rsp = order_pb2.ShopCartInfoResponse()
-            item_rsp.id = item.id
-            item_rsp.userId = item.user
-            item_rsp.goodsId = item.goods
-            item_rsp.nums = item.nums
-            items.checked = item.checked
-            rsp.data.append(item_rsp)
+            rsp.data.add(id=item.id, userId=item.user, goodsId=item.goods, nums=item.nums, checked=item.checked)
+        try:
+            goods = {good.id: good for good in goods_future.result().data}
+        except grpc.RpcError as e:
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details(str(e))
+            return order_pb2.CartItemDetailListResponse()
+
+        checked_total = 0
+        for line in rsp.data:
+            good = goods.get(line.goodsId)
+            if good is None:
+                continue
+            line.available = True
+            line.goodsName = good.name
+            line.goodsImage = good.goodsFrontImage
+            line.goodsPrice = good.shopPrice
+            line.amount = good.shopPrice * line.nums
+            if line.checked:
+                checked_total += good.shopPrice * line.nums
+        rsp.checkedTotal = checked_total
         return rsp
 
     def CreateCartItem(self, request: order_pb2.CartItemRequest, context):
@@ -180,10 +227,16 @@ class OrderService(order_pb2_grpc.OrderServicer):
 
     def local_execute(self, msg, user_args):
         msg_body = json.loads(msg.body.decode("utf-8"))
-        order_sn = msg_body["orderSn"]
-        local_execute_dict[order_sn] = {}
-        parent_span = local_execute_dict[msg_body["parent_span_id"]]
+        result = {}
+        try:
+            return self.execute_order(msg_body, result)
+        finally:
+            # 不管提交还是回滚都通知等待中的CreateOrder
+            self.pending.complete(msg_body["orderSn"], result)
 
+    def execute_order(self, msg_body, result: dict):
+        order_sn = msg_body["orderSn"]
+        parent_span = self.pending.span(order_sn)
 
         with settings.DB.atomic() as txn:
             goods_ids = []
@@ -196,20 +249,18 @@ class OrderService(order_pb2_grpc.OrderServicer):
                     goods_ids.append(cart_item.goods)
                     goods_nums[cart_item.goods] = cart_item.nums
                 if not goods_ids:
-                    local_execute_dict[order_sn]["code"] = grpc.StatusCode.NOT_FOUND
-                    local_execute_dict[order_sn]["detail"] = "No item in shopping cart"
+                    result["code"] = grpc.StatusCode.NOT_FOUND
+                    result["detail"] = "No item in shopping cart"
                     return TransactionStatus.ROLLBACK
 
             # query goods info from goods srv
             with tracer.start_span("query_goods", child_of=parent_span) as query_goods_span:
-                register = consul.ConsulRegister(settings.CONSUL_HOST, settings.CONSUL_POST)
-                goods_srv_host, goods_srv_port = register.get_host_port(f'Service == "{settings.Goods_srv_name}"')
-                if not goods_srv_host or not goods_srv_port:
-                    local_execute_dict[order_sn]["code"] = grpc.StatusCode.NOT_FOUND
-                    local_execute_dict[order_sn]["detail"] = "Goods service not available"
+                goods_channel = self.balancer.channel(settings.Goods_srv_name)
+                if goods_channel is None:
+                    result["code"] = grpc.StatusCode.NOT_FOUND
+                    result["detail"] = "Goods service not available"
                     return TransactionStatus.ROLLBACK
 
-                goods_channel = grpc.insecure_channel(f"{goods_srv_host}:{goods_srv_port}")
                 goods_stub = goods_pb2_grpc.GoodsStub(goods_channel)
                 goods_sell_info = []
                 try:
@@ -221,25 +272,24 @@ class OrderService(order_pb2_grpc.OrderServicer):
                         order_goods_list.append(order_goods)
                         goods_sell_info.append(inventory_pb2.GoodsInvInfo(goodsId=good.id, num=goods_nums[good.id]))
                 except grpc.RpcError as e:
-                    local_execute_dict[order_sn]["code"] = grpc.StatusCode.INTERNAL
-                    local_execute_dict[order_sn]["detail"] = str(e)
+                    result["code"] = grpc.StatusCode.INTERNAL
+                    result["detail"] = str(e)
                     return TransactionStatus.ROLLBACK
             # prepare half message
 
             with tracer.start_span("query_inv", child_of=parent_span) as query_inv_span:
-                inventory_host, inventory_port = register.get_host_port(f'Service == "{settings.Inventory_srv_name}"')
-                if not inventory_host or not inventory_port:
-                    local_execute_dict[order_sn]["code"] = grpc.StatusCode.INTERNA
-                    local_execute_dict[order_sn]["detail"] = "Inventory service not available"
+                inventory_channel = self.balancer.channel(settings.Inventory_srv_name)
+                if inventory_channel is None:
+                    result["code"] = grpc.StatusCode.INTERNAL
+                    result["detail"] = "Inventory service not available"
                     return TransactionStatus.ROLLBACK
-                inventory_channel = grpc.insecure_channel(f"{inventory_host}:{inventory_port}")
-                inventory_channel = grpc.intercept_channel(inventory_channel, RetryInterceptor)
+                inventory_channel = grpc.intercept_channel(inventory_channel, RetryInterceptor())
                 inv_stub = inventory_pb2_grpc.InventoryStub(inventory_channel)
                 try:
                     inv_stub.Sell(inventory_pb2.SellInfo(goodsInfo=goods_sell_info, orderSn=order_sn))
                 except grpc.RpcError as e:
-                    local_execute_dict[order_sn]["code"] = grpc.StatusCode.INTERNAL
-                    local_execute_dict[order_sn]["detail"] = str(e)
+                    result["code"] = grpc.StatusCode.INTERNAL
+                    result["detail"] = str(e)
                     err_code = e.code()
                     if err_code == grpc.StatusCode.UNKNOWN or grpc.StatusCode.DEADLINE_EXCEEDED:
                         return TransactionStatus.COMMIT
@@ -262,7 +312,7 @@ class OrderService(order_pb2_grpc.OrderServicer):
                     OrderGoods.bulk_create(order_goods_list)
 
                     ShoppingCart.delete().where(ShoppingCart.user == msg_body["userId"], ShoppingCart.checked == True).execute()
-                    local_execute_dict[order_sn] = {
+                    result.update({
                         "code": grpc.StatusCode.OK,
                         "detail": "Create order succeeded",
                         "order": {
@@ -270,7 +320,7 @@ class OrderService(order_pb2_grpc.OrderServicer):
                             "orderSn": order_sn,
                             "total": order.order_amount
                         }
-                    }
+                    })
                     #发送延时消息
                     msg = Message("order_timeout")
                     msg.set_delay_time_level(16)
@@ -279,27 +329,20 @@ class OrderService(order_pb2_grpc.OrderServicer):
                     msg.set_body(json.dumps({
                         "orderSn": order_sn
                     }))
-                    sync_producer = Producer("cancel")
-                    sync_producer.set_name_server_address(f"{settings.RocketMQ_HOST}:{settings.RocketMQ_PORT}")
-                    sync_producer.start()
-                    ret = sync_producer.send_sync(msg)
+                    ret = producers.get("cancel").send_sync(msg)
                     if ret.status != SendStatus.OK:
                         raise Exception("延时消息发送失败")
-                    logger.info("发送延时消息时间" + datetime.now())
-                    sync_producer.shutdown()
+                    logger.info("发送延时消息时间" + f"{datetime.now()}")
                 except Exception as e:
                     txn.rollback()
-                    local_execute_dict[order_sn]["code"] = grpc.StatusCode.INTERNA
-                    local_execute_dict[order_sn]["detail"] = str(e)
+                    result["code"] = grpc.StatusCode.INTERNAL
+                    result["detail"] = str(e)
                     return TransactionStatus.COMMIT
             return TransactionStatus.ROLLBACK
 
     def CreateOrder(self, request, context):
         parent_span = context.get_active_span()
-        local_execute_dict[parent_span.context.span_id] = parent_span
-        producer = TransactionMQProducer(group_id="mxshop", checker_callback=self.check_callback)
-        producer.set_name_server_address(f"{settings.RocketMQ_HOST}:{settings.RocketMQ_PORT}")
-        producer.start()
+        producer = producers.transaction("mxshop", self.check_callback)
         msg = Message("order_reback")
         msg.set_keys("mxshop")
         msg.set_tags("order")
@@ -311,28 +354,36 @@ class OrderService(order_pb2_grpc.OrderServicer):
             "address": request.address,
             "name": request.name,
             "mobile": request.mobile,
-            "post": request.post,
-            "parent_span_id": parent_span.context.span_id
+            "post": request.post
         }
         msg.set_body(json.dumps(msg_body))
-        ret = producer.send_message_in_transaction(msg, self.local_execute, user_args=None)
-        logger.info(f"Send status: {ret.status}, id: {ret.msg_id}")
-        if ret.status != SendStatus.OK:
+        self.pending.register(order_sn, parent_span)
+        # 发送消息可能抛异常, 无论哪种情况离开时都要清理登记项
+        try:
+            ret = producer.send_message_in_transaction(msg, self.local_execute, user_args=None)
+            logger.info(f"Send status: {ret.status}, id: {ret.msg_id}")
+            if ret.status != SendStatus.OK:
+                context.set_code(grpc.StatusCode.INTERNAL)
+                context.set_details("Create order failed")
+                return order_pb2.OrderInfoResponse()
+            result = self.pending.wait(order_sn, settings.CREATE_ORDER_TIMEOUT)
+        except Exception as e:
+            logger.error(f"Send order message failed: {e}")
             context.set_code(grpc.StatusCode.INTERNAL)
             context.set_details("Create order failed")
             return order_pb2.OrderInfoResponse()
+        finally:
+            self.pending.discard(order_sn)
 
-        while True:
-            if order_sn in local_execute_dict:
-                context.set_code(local_execute_dict[order_sn]["code"])
-                context.set_details(local_execute_dict[order_sn]["detail"])
-                producer.shutdown()
-                if local_execute_dict[order_sn]["code"] == grpc.StatusCode.OK:
-                    return order_pb2.OrderInfoResponse(id=local_execute_dict[order_sn]["order"]["id"],
-                                                       orderSn=order_sn,
-                                                       total=local_execute_dict[order_sn]["order"]["total"])
-                else:
-                    return order_pb2.OrderInfoResponse()
-            time.sleep(0.1)
+        if result is None:
+            context.set_code(grpc.StatusCode.DEADLINE_EXCEEDED)
+            context.set_details("Create order timeout")
+            return order_pb2.OrderInfoResponse()
+        context.set_code(result.get("code", grpc.StatusCode.INTERNAL))
+        context.set_details(result.get("detail", "Create order failed"))
+        if result.get("code") == grpc.StatusCode.OK:
+            return order_pb2.OrderInfoResponse(id=result["order"]["id"], orderSn=order_sn,
+                                               total=result["order"]["total"])
+        return order_pb2.OrderInfoResponse()
 
 
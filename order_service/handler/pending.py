@@ -0,0 +1,47 @@
+import threading
+from concurrent import futures
+
+
+class PendingOrders:
+    """
+    CreateOrder 等待本地事务结果的登记表, 每个订单一个Future
+    local_execute 决定提交或回滚后调用 complete, CreateOrder 在 wait 里立即拿到结果, 不需要轮询
+    wait 返回或超时后登记项和父span一起清理, 不会随订单数增长
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._orders = {}
+
+    def register(self, order_sn, parent_span):
+        with self._lock:
+            self._orders[order_sn] = (futures.Future(), parent_span)
+
+    def span(self, order_sn):
+        with self._lock:
+            entry = self._orders.get(order_sn)
+        return entry[1] if entry else None
+
+    def complete(self, order_sn, result: dict):
+        with self._lock:
+            entry = self._orders.get(order_sn)
+            # CreateOrder 已经超时离开, 或者结果已经设置过, 没人再等待这次的结果
+            if entry is None or entry[0].done():
+                return
+            entry[0].set_result(result)
+
+    def wait(self, order_sn, timeout):
+        """返回local_execute的结果, 超时返回None"""
+        with self._lock:
+            entry = self._orders.get(order_sn)
+        if entry is None:
+            return None
+        try:
+            return entry[0].result(timeout)
+        except futures.TimeoutError:
+            return None
+        finally:
+            self.discard(order_sn)
+
+    def discard(self, order_sn):
+        with self._lock:
+            self._orders.pop(order_sn, None)
@@ -2,6 +2,7 @@
 # Generated by the protocol buffer compiler.  DO NOT EDIT!
 # source: goods.proto
 """Generated protocol buffer code."""
+from google.protobuf.internal import enum_type_wrapper
 from google.protobuf import descriptor as _descriptor
 from google.protobuf import message as _message
 from google.protobuf import reflection as _reflection
@@ -20,10 +21,72 @@ DESCRIPTOR = _descriptor.FileDescriptor(
   syntax='proto3',
   serialized_options=b'Z\007.;proto',
   create_key=_descriptor._internal_create_key,
-  serialized_pb=b'\n\x0bgoods.proto\x1a\x1bgoogle/protobuf/empty.proto\"0\n\x13\x43\x61tegoryListRequest\x12\n\n\x02id\x18\x01 \x01(\x05\x12\r\n\x05level\x18\x02 \x01(\x05\"e\n\x13\x43\x61tegoryInfoRequest\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x16\n\x0eparentCategory\x18\x03 \x01(\x05\x12\r\n\x05level\x18\x04 \x01(\x05\x12\r\n\x05isTab\x18\x05 \x01(\x08\"#\n\x15\x44\x65leteCategoryRequest\x12\n\n\x02id\x18\x01 \x01(\x05\"0\n\x14QueryCategoryRequest\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\"f\n\x14\x43\x61tegoryInfoResponse\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x16\n\x0eparentCategory\x18\x03 \x01(\x05\x12\r\n\x05level\x18\x04 \x01(\x05\x12\r\n\x05isTab\x18\x05 \x01(\x08\"\\\n\x14\x43\x61tegoryListResponse\x12\r\n\x05total\x18\x01 \x01(\x05\x12#\n\x04\x64\x61ta\x18\x02 \x03(\x0b\x32\x15.CategoryInfoResponse\x12\x10\n\x08jsonData\x18\x03 \x01(\t\"z\n\x17SubCategoryListResponse\x12\r\n\x05total\x18\x01 \x01(\x05\x12#\n\x04info\x18\x02 \x01(\x0b\x32\x15.CategoryInfoResponse\x12+\n\x0csubCategorys\x18\x03 \x03(\x0b\x32\x15.CategoryInfoResponse\"@\n\x1a\x43\x61tegoryBrandFilterRequest\x12\r\n\x05pages\x18\x01 \x01(\x05\x12\x13\n\x0bpagePerNums\x18\x02 \x01(\x05\"3\n\rFilterRequest\x12\r\n\x05pages\x18\x01 \x01(\x05\x12\x13\n\x0bpagePerNums\x18\x02 \x01(\x05\"G\n\x14\x43\x61tegoryBrandRequest\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x12\n\ncategoryId\x18\x02 \x01(\x05\x12\x0f\n\x07\x62randId\x18\x03 \x01(\x05\"o\n\x15\x43\x61tegoryBrandResponse\x12\n\n\x02id\x18\x01 \x01(\x05\x12!\n\x05\x62rand\x18\x02 \x01(\x0b\x32\x12.BrandInfoResponse\x12\'\n\x08\x63\x61tegory\x18\x03 \x01(\x0b\x32\x15.CategoryInfoResponse\"F\n\rBannerRequest\x12\n\n\x02id\x18\x01 \x01(\x05\x12\r\n\x05index\x18\x02 \x01(\x05\x12\r\n\x05image\x18\x03 \x01(\t\x12\x0b\n\x03url\x18\x04 \x01(\t\"G\n\x0e\x42\x61nnerResponse\x12\n\n\x02id\x18\x01 \x01(\x05\x12\r\n\x05index\x18\x02 \x01(\x05\x12\r\n\x05image\x18\x03 \x01(\t\x12\x0b\n\x03url\x18\x04 \x01(\t\"8\n\x12\x42randFilterRequest\x12\r\n\x05pages\x18\x01 \x01(\x05\x12\x13\n\x0bpagePerNums\x18\x02 \x01(\x05\"6\n\x0c\x42randRequest\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0c\n\x04logo\x18\x03 \x01(\t\";\n\x11\x42randInfoResponse\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0c\n\x04logo\x18\x03 \x01(\t\"D\n\x11\x42randListResponse\x12\r\n\x05total\x18\x01 \x01(\x05\x12 \n\x04\x64\x61ta\x18\x02 \x03(\x0b\x32\x12.BrandInfoResponse\"B\n\x12\x42\x61nnerListResponse\x12\r\n\x05total\x18\x01 \x01(\x05\x12\x1d\n\x04\x64\x61ta\x18\x02 \x03(\x0b\x32\x0f.BannerResponse\"P\n\x19\x43\x61tegoryBrandListResponse\x12\r\n\x05total\x18\x01 \x01(\x05\x12$\n\x04\x64\x61ta\x18\x02 \x03(\x0b\x32\x16.CategoryBrandResponse\"\x1e\n\x10\x42\x61tchGoodsIdInfo\x12\n\n\x02id\x18\x01 \x03(\x05\"\x1d\n\x0f\x44\x65leteGoodsInfo\x12\n\n\x02id\x18\x01 \x01(\x05\"5\n\x19\x43\x61tegoryBriefInfoResponse\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\"2\n\x15\x43\x61tegoryFilterRequest\x12\n\n\x02id\x18\x01 \x01(\x05\x12\r\n\x05isTab\x18\x02 \x01(\x08\"\x1d\n\x0fGoodInfoRequest\x12\n\n\x02id\x18\x01 \x01(\x05\"\xbd\x02\n\x0f\x43reateGoodsInfo\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0f\n\x07goodsSn\x18\x03 \x01(\t\x12\x0e\n\x06stocks\x18\x07 \x01(\x05\x12\x13\n\x0bmarketPrice\x18\x08 \x01(\x02\x12\x11\n\tshopPrice\x18\t \x01(\x02\x12\x12\n\ngoodsBrief\x18\n \x01(\t\x12\x11\n\tgoodsDesc\x18\x0b \x01(\t\x12\x10\n\x08shipFree\x18\x0c \x01(\x08\x12\x0e\n\x06images\x18\r \x03(\t\x12\x12\n\ndescImages\x18\x0e \x03(\t\x12\x17\n\x0fgoodsFrontImage\x18\x0f \x01(\t\x12\r\n\x05isNew\x18\x10 \x01(\x08\x12\r\n\x05isHot\x18\x11 \x01(\x08\x12\x0e\n\x06onSale\x18\x12 \x01(\x08\x12\x12\n\ncategoryId\x18\x13 \x01(\x05\x12\x0f\n\x07\x62randId\x18\x14 \x01(\x05\"3\n\x12GoodsReduceRequest\x12\x0f\n\x07GoodsId\x18\x01 \x01(\x05\x12\x0c\n\x04nums\x18\x02 \x01(\x05\"L\n\x18\x42\x61tchCategoryInfoRequest\x12\n\n\x02id\x18\x01 \x03(\x05\x12\x11\n\tgoodsNums\x18\x02 \x01(\x05\x12\x11\n\tbrandNums\x18\x03 \x01(\x05\"\xbf\x01\n\x12GoodsFilterRequest\x12\x10\n\x08priceMin\x18\x01 \x01(\x05\x12\x10\n\x08priceMax\x18\x02 \x01(\x05\x12\r\n\x05isHot\x18\x03 \x01(\x08\x12\r\n\x05isNew\x18\x04 \x01(\x08\x12\r\n\x05isTab\x18\x05 \x01(\x08\x12\x13\n\x0btopCategory\x18\x06 \x01(\x05\x12\r\n\x05pages\x18\x07 \x01(\x05\x12\x13\n\x0bpagePerNums\x18\x08 \x01(\x05\x12\x10\n\x08keyWords\x18\t \x01(\t\x12\r\n\x05\x62rand\x18\n \x01(\x05\"\xb3\x03\n\x11GoodsInfoResponse\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x12\n\ncategoryId\x18\x02 \x01(\x05\x12\x0c\n\x04name\x18\x03 \x01(\t\x12\x0f\n\x07goodsSn\x18\x04 \x01(\t\x12\x10\n\x08\x63lickNum\x18\x05 \x01(\x05\x12\x0f\n\x07soldNum\x18\x06 \x01(\x05\x12\x0e\n\x06\x66\x61vNum\x18\x07 \x01(\x05\x12\x13\n\x0bmarketPrice\x18\t \x01(\x02\x12\x11\n\tshopPrice\x18\n \x01(\x02\x12\x12\n\ngoodsBrief\x18\x0b \x01(\t\x12\x11\n\tgoodsDesc\x18\x0c \x01(\t\x12\x10\n\x08shipFree\x18\r \x01(\x08\x12\x0e\n\x06images\x18\x0e \x03(\t\x12\x12\n\ndescImages\x18\x0f \x03(\t\x12\x17\n\x0fgoodsFrontImage\x18\x10 \x01(\t\x12\r\n\x05isNew\x18\x11 \x01(\x08\x12\r\n\x05isHot\x18\x12 \x01(\x08\x12\x0e\n\x06onSale\x18\x13 \x01(\x08\x12\x0f\n\x07\x61\x64\x64Time\x18\x14 \x01(\x03\x12,\n\x08\x63\x61tegory\x18\x15 \x01(\x0b\x32\x1a.CategoryBriefInfoResponse\x12!\n\x05\x62rand\x18\x16 \x01(\x0b\x32\x12.BrandInfoResponse\"D\n\x11GoodsListResponse\x12\r\n\x05total\x18\x01 \x01(\x05\x12 \n\x04\x64\x61ta\x18\x02 \x03(\x0b\x32\x12.GoodsInfoResponse2\xaf\x0b\n\x05Goods\x12\x34\n\tGoodsList\x12\x13.GoodsFilterRequest\x1a\x12.GoodsListResponse\x12\x36\n\rBatchGetGoods\x12\x11.BatchGoodsIdInfo\x1a\x12.GoodsListResponse\x12\x33\n\x0b\x43reateGoods\x12\x10.CreateGoodsInfo\x1a\x12.GoodsInfoResponse\x12\x37\n\x0b\x44\x65leteGoods\x12\x10.DeleteGoodsInfo\x1a\x16.google.protobuf.Empty\x12\x37\n\x0bUpdateGoods\x12\x10.CreateGoodsInfo\x1a\x16.google.protobuf.Empty\x12\x36\n\x0eGetGoodsDetail\x12\x10.GoodInfoRequest\x1a\x12.GoodsInfoResponse\x12\x44\n\x13GetAllCategorysList\x12\x16.google.protobuf.Empty\x1a\x15.CategoryListResponse\x12@\n\x0eGetSubCategory\x12\x14.CategoryListRequest\x1a\x18.SubCategoryListResponse\x12=\n\x0e\x43reateCategory\x12\x14.CategoryInfoRequest\x1a\x15.CategoryInfoResponse\x12@\n\x0e\x44\x65leteCategory\x12\x16.DeleteCategoryRequest\x1a\x16.google.protobuf.Empty\x12>\n\x0eUpdateCategory\x12\x14.CategoryInfoRequest\x1a\x16.google.protobuf.Empty\x12\x34\n\tBrandList\x12\x13.BrandFilterRequest\x1a\x12.BrandListResponse\x12\x30\n\x0b\x43reateBrand\x12\r.BrandRequest\x1a\x12.BrandInfoResponse\x12\x34\n\x0b\x44\x65leteBrand\x12\r.BrandRequest\x1a\x16.google.protobuf.Empty\x12\x34\n\x0bUpdateBrand\x12\r.BrandRequest\x1a\x16.google.protobuf.Empty\x12\x39\n\nBannerList\x12\x16.google.protobuf.Empty\x1a\x13.BannerListResponse\x12/\n\x0c\x43reateBanner\x12\x0e.BannerRequest\x1a\x0f.BannerResponse\x12\x36\n\x0c\x44\x65leteBanner\x12\x0e.BannerRequest\x1a\x16.google.protobuf.Empty\x12\x36\n\x0cUpdateBanner\x12\x0e.BannerRequest\x1a\x16.google.protobuf.Empty\x12L\n\x11\x43\x61tegoryBrandList\x12\x1b.CategoryBrandFilterRequest\x1a\x1a.CategoryBrandListResponse\x12@\n\x14GetCategoryBrandList\x12\x14.CategoryInfoRequest\x1a\x12.BrandListResponse\x12\x44\n\x13\x43reateCategoryBrand\x12\x15.CategoryBrandRequest\x1a\x16.CategoryBrandResponse\x12\x44\n\x13\x44\x65leteCategoryBrand\x12\x15.CategoryBrandRequest\x1a\x16.google.protobuf.Empty\x12\x44\n\x13UpdateCategoryBrand\x12\x15.CategoryBrandRequest\x1a\x16.google.protobuf.EmptyB\tZ\x07.;protob\x06proto3'
+  serialized_pb=b'\n\x0bgoods.proto\x1a\x1bgoogle/protobuf/empty.proto\"0\n\x13\x43\x61tegoryListRequest\x12\n\n\x02id\x18\x01 \x01(\x05\x12\r\n\x05level\x18\x02 \x01(\x05\"e\n\x13\x43\x61tegoryInfoRequest\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x16\n\x0eparentCategory\x18\x03 \x01(\x05\x12\r\n\x05level\x18\x04 \x01(\x05\x12\r\n\x05isTab\x18\x05 \x01(\x08\"#\n\x15\x44\x65leteCategoryRequest\x12\n\n\x02id\x18\x01 \x01(\x05\"0\n\x14QueryCategoryRequest\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\"f\n\x14\x43\x61tegoryInfoResponse\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x16\n\x0eparentCategory\x18\x03 \x01(\x05\x12\r\n\x05level\x18\x04 \x01(\x05\x12\r\n\x05isTab\x18\x05 \x01(\x08\"\\\n\x14\x43\x61tegoryListResponse\x12\r\n\x05total\x18\x01 \x01(\x05\x12#\n\x04\x64\x61ta\x18\x02 \x03(\x0b\x32\x15.CategoryInfoResponse\x12\x10\n\x08jsonData\x18\x03 \x01(\t\"z\n\x17SubCategoryListResponse\x12\r\n\x05total\x18\x01 \x01(\x05\x12#\n\x04info\x18\x02 \x01(\x0b\x32\x15.CategoryInfoResponse\x12+\n\x0csubCategorys\x18\x03 \x03(\x0b\x32\x15.CategoryInfoResponse\"@\n\x1a\x43\x61tegoryBrandFilterRequest\x12\r\n\x05pages\x18\x01 \x01(\x05\x12\x13\n\x0bpagePerNums\x18\x02 \x01(\x05\"3\n\rFilterRequest\x12\r\n\x05pages\x18\x01 \x01(\x05\x12\x13\n\x0bpagePerNums\x18\x02 \x01(\x05\"G\n\x14\x43\x61tegoryBrandRequest\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x12\n\ncategoryId\x18\x02 \x01(\x05\x12\x0f\n\x07\x62randId\x18\x03 \x01(\x05\"o\n\x15\x43\x61tegoryBrandResponse\x12\n\n\x02id\x18\x01 \x01(\x05\x12!\n\x05\x62rand\x18\x02 \x01(\x0b\x32\x12.BrandInfoResponse\x12\'\n\x08\x63\x61tegory\x18\x03 \x01(\x0b\x32\x15.CategoryInfoResponse\"F\n\rBannerRequest\x12\n\n\x02id\x18\x01 \x01(\x05\x12\r\n\x05index\x18\x02 \x01(\x05\x12\r\n\x05image\x18\x03 \x01(\t\x12\x0b\n\x03url\x18\x04 \x01(\t\"G\n\x0e\x42\x61nnerResponse\x12\n\n\x02id\x18\x01 \x01(\x05\x12\r\n\x05index\x18\x02 \x01(\x05\x12\r\n\x05image\x18\x03 \x01(\t\x12\x0b\n\x03url\x18\x04 \x01(\t\"8\n\x12\x42randFilterRequest\x12\r\n\x05pages\x18\x01 \x01(\x05\x12\x13\n\x0bpagePerNums\x18\x02 \x01(\x05\"6\n\x0c\x42randRequest\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0c\n\x04logo\x18\x03 \x01(\t\";\n\x11\x42randInfoResponse\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0c\n\x04logo\x18\x03 \x01(\t\"D\n\x11\x42randListResponse\x12\r\n\x05total\x18\x01 \x01(\x05\x12 \n\x04\x64\x61ta\x18\x02 \x03(\x0b\x32\x12.BrandInfoResponse\"$\n\x11\x42\x61nnerListRequest\x12\x0f\n\x07version\x18\x01 \x01(\t\"h\n\x12\x42\x61nnerListResponse\x12\r\n\x05total\x18\x01 \x01(\x05\x12\x1d\n\x04\x64\x61ta\x18\x02 \x03(\x0b\x32\x0f.BannerResponse\x12\x0f\n\x07version\x18\x03 \x01(\t\x12\x13\n\x0bnotModified\x18\x04 \x01(\x08\"P\n\x19\x43\x61tegoryBrandListResponse\x12\r\n\x05total\x18\x01 \x01(\x05\x12$\n\x04\x64\x61ta\x18\x02 \x03(\x0b\x32\x16.CategoryBrandResponse\"8\n\x10\x42\x61tchGoodsIdInfo\x12\n\n\x02id\x18\x01 \x03(\x05\x12\x18\n\x04view\x18\x02 \x01(\x0e\x32\n.GoodsView\"\x1d\n\x0f\x44\x65leteGoodsInfo\x12\n\n\x02id\x18\x01 \x01(\x05\"5\n\x19\x43\x61tegoryBriefInfoResponse\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\"2\n\x15\x43\x61tegoryFilterRequest\x12\n\n\x02id\x18\x01 \x01(\x05\x12\r\n\x05isTab\x18\x02 \x01(\x08\"\x1d\n\x0fGoodInfoRequest\x12\n\n\x02id\x18\x01 \x01(\x05\"\xbd\x02\n\x0f\x43reateGoodsInfo\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0f\n\x07goodsSn\x18\x03 \x01(\t\x12\x0e\n\x06stocks\x18\x07 \x01(\x05\x12\x13\n\x0bmarketPrice\x18\x08 \x01(\x02\x12\x11\n\tshopPrice\x18\t \x01(\x02\x12\x12\n\ngoodsBrief\x18\n \x01(\t\x12\x11\n\tgoodsDesc\x18\x0b \x01(\t\x12\x10\n\x08shipFree\x18\x0c \x01(\x08\x12\x0e\n\x06images\x18\r \x03(\t\x12\x12\n\ndescImages\x18\x0e \x03(\t\x12\x17\n\x0fgoodsFrontImage\x18\x0f \x01(\t\x12\r\n\x05isNew\x18\x10 \x01(\x08\x12\r\n\x05isHot\x18\x11 \x01(\x08\x12\x0e\n\x06onSale\x18\x12 \x01(\x08\x12\x12\n\ncategoryId\x18\x13 \x01(\x05\x12\x0f\n\x07\x62randId\x18\x14 \x01(\x05\"L\n\x11ImportGoodsStatus\x12\r\n\x05index\x18\x01 \x01(\x05\x12\n\n\x02id\x18\x02 \x01(\x05\x12\x0c\n\x04\x63ode\x18\x03 \x01(\x05\x12\x0e\n\x06\x64\x65tail\x18\x04 \x01(\t\"Y\n\x13ImportGoodsResponse\x12\r\n\x05total\x18\x01 \x01(\x05\x12\x11\n\tsucceeded\x18\x02 \x01(\x05\x12 \n\x04\x64\x61ta\x18\x03 \x03(\x0b\x32\x12.ImportGoodsStatus\"3\n\x12GoodsReduceRequest\x12\x0f\n\x07GoodsId\x18\x01 \x01(\x05\x12\x0c\n\x04nums\x18\x02 \x01(\x05\"L\n\x18\x42\x61tchCategoryInfoRequest\x12\n\n\x02id\x18\x01 \x03(\x05\x12\x11\n\tgoodsNums\x18\x02 \x01(\x05\x12\x11\n\tbrandNums\x18\x03 \x01(\x05\"\xbc\x02\n\x12GoodsFilterRequest\x12\x10\n\x08priceMin\x18\x01 \x01(\x05\x12\x10\n\x08priceMax\x18\x02 \x01(\x05\x12\r\n\x05isHot\x18\x03 \x01(\x08\x12\r\n\x05isNew\x18\x04 \x01(\x08\x12\r\n\x05isTab\x18\x05 \x01(\x08\x12\x13\n\x0btopCategory\x18\x06 \x01(\x05\x12\r\n\x05pages\x18\x07 \x01(\x05\x12\x13\n\x0bpagePerNums\x18\x08 \x01(\x05\x12\x10\n\x08keyWords\x18\t \x01(\t\x12\r\n\x05\x62rand\x18\n \x01(\x05\x12\x0e\n\x06\x63ursor\x18\x0b \x01(\t\x12\x1d\n\tcountMode\x18\x0c \x01(\x0e\x32\n.CountMode\x12\x0c\n\x04sort\x18\r \x01(\t\x12\x0e\n\x06\x66\x61\x63\x65ts\x18\x0e \x01(\x08\x12\x14\n\x0cpriceBuckets\x18\x0f \x03(\x05\x12\x18\n\x04view\x18\x10 \x01(\x0e\x32\n.GoodsView\"\xb3\x03\n\x11GoodsInfoResponse\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x12\n\ncategoryId\x18\x02 \x01(\x05\x12\x0c\n\x04name\x18\x03 \x01(\t\x12\x0f\n\x07goodsSn\x18\x04 \x01(\t\x12\x10\n\x08\x63lickNum\x18\x05 \x01(\x05\x12\x0f\n\x07soldNum\x18\x06 \x01(\x05\x12\x0e\n\x06\x66\x61vNum\x18\x07 \x01(\x05\x12\x13\n\x0bmarketPrice\x18\t \x01(\x02\x12\x11\n\tshopPrice\x18\n \x01(\x02\x12\x12\n\ngoodsBrief\x18\x0b \x01(\t\x12\x11\n\tgoodsDesc\x18\x0c \x01(\t\x12\x10\n\x08shipFree\x18\r \x01(\x08\x12\x0e\n\x06images\x18\x0e \x03(\t\x12\x12\n\ndescImages\x18\x0f \x03(\t\x12\x17\n\x0fgoodsFrontImage\x18\x10 \x01(\t\x12\r\n\x05isNew\x18\x11 \x01(\x08\x12\r\n\x05isHot\x18\x12 \x01(\x08\x12\x0e\n\x06onSale\x18\x13 \x01(\x08\x12\x0f\n\x07\x61\x64\x64Time\x18\x14 \x01(\x03\x12,\n\x08\x63\x61tegory\x18\x15 \x01(\x0b\x32\x1a.CategoryBriefInfoResponse\x12!\n\x05\x62rand\x18\x16 \x01(\x0b\x32\x12.BrandInfoResponse\"v\n\x11GoodsListResponse\x12\r\n\x05total\x18\x01 \x01(\x05\x12 \n\x04\x64\x61ta\x18\x02 \x03(\x0b\x32\x12.GoodsInfoResponse\x12\x12\n\nnextCursor\x18\x03 \x01(\t\x12\x1c\n\x06\x66\x61\x63\x65ts\x18\x04 \x01(\x0b\x32\x0c.GoodsFacets\"5\n\nBrandFacet\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\r\n\x05\x63ount\x18\x03 \x01(\x05\"5\n\nPriceFacet\x12\x0b\n\x03min\x18\x01 \x01(\x05\x12\x0b\n\x03max\x18\x02 \x01(\x05\x12\r\n\x05\x63ount\x18\x03 \x01(\x05\"k\n\x0bGoodsFacets\x12\x1b\n\x06\x62rands\x18\x01 \x03(\x0b\x32\x0b.BrandFacet\x12\x1b\n\x06prices\x18\x02 \x03(\x0b\x32\x0b.PriceFacet\x12\x10\n\x08hotCount\x18\x03 \x01(\x05\x12\x10\n\x08newCount\x18\x04 \x01(\x05*,\n\tGoodsView\x12\r\n\tVIEW_FULL\x10\x00\x12\x10\n\x0cVIEW_SUMMARY\x10\x01*@\n\tCountMode\x12\x0f\n\x0b\x43OUNT_EXACT\x10\x00\x12\x0e\n\nCOUNT_NONE\x10\x01\x12\x12\n\x0e\x43OUNT_ESTIMATE\x10\x02\x32\xe2\x0c\n\x05Goods\x12\x34\n\tGoodsList\x12\x13.GoodsFilterRequest\x1a\x12.GoodsListResponse\x12\x36\n\rBatchGetGoods\x12\x11.BatchGoodsIdInfo\x1a\x12.GoodsListResponse\x12\x33\n\x0b\x43reateGoods\x12\x10.CreateGoodsInfo\x1a\x12.GoodsInfoResponse\x12\x37\n\x0b\x44\x65leteGoods\x12\x10.DeleteGoodsInfo\x1a\x16.google.protobuf.Empty\x12\x37\n\x0bUpdateGoods\x12\x10.CreateGoodsInfo\x1a\x16.google.protobuf.Empty\x12\x36\n\x0eGetGoodsDetail\x12\x10.GoodInfoRequest\x1a\x12.GoodsInfoResponse\x12<\n\x0fStreamGoodsList\x12\x13.GoodsFilterRequest\x1a\x12.GoodsInfoResponse0\x01\x12>\n\x13StreamBatchGetGoods\x12\x11.BatchGoodsIdInfo\x1a\x12.GoodsInfoResponse0\x01\x12\x37\n\x0bImportGoods\x12\x10.CreateGoodsInfo\x1a\x14.ImportGoodsResponse(\x01\x12\x44\n\x13GetAllCategorysList\x12\x16.google.protobuf.Empty\x1a\x15.CategoryListResponse\x12@\n\x0eGetSubCategory\x12\x14.CategoryListRequest\x1a\x18.SubCategoryListResponse\x12=\n\x0e\x43reateCategory\x12\x14.CategoryInfoRequest\x1a\x15.CategoryInfoResponse\x12@\n\x0e\x44\x65leteCategory\x12\x16.DeleteCategoryRequest\x1a\x16.google.protobuf.Empty\x12>\n\x0eUpdateCategory\x12\x14.CategoryInfoRequest\x1a\x16.google.protobuf.Empty\x12\x34\n\tBrandList\x12\x13.BrandFilterRequest\x1a\x12.BrandListResponse\x12\x30\n\x0b\x43reateBrand\x12\r.BrandRequest\x1a\x12.BrandInfoResponse\x12\x34\n\x0b\x44\x65leteBrand\x12\r.BrandRequest\x1a\x16.google.protobuf.Empty\x12\x34\n\x0bUpdateBrand\x12\r.BrandRequest\x1a\x16.google.protobuf.Empty\x12\x35\n\nBannerList\x12\x12.BannerListRequest\x1a\x13.BannerListResponse\x12/\n\x0c\x43reateBanner\x12\x0e.BannerRequest\x1a\x0f.BannerResponse\x12\x36\n\x0c\x44\x65leteBanner\x12\x0e.BannerRequest\x1a\x16.google.protobuf.Empty\x12\x36\n\x0cUpdateBanner\x12\x0e.BannerRequest\x1a\x16.google.protobuf.Empty\x12L\n\x11\x43\x61tegoryBrandList\x12\x1b.CategoryBrandFilterRequest\x1a\x1a.CategoryBrandListResponse\x12@\n\x14GetCategoryBrandList\x12\x14.CategoryInfoRequest\x1a\x12.BrandListResponse\x12\x44\n\x13\x43reateCategoryBrand\x12\x15.CategoryBrandRequest\x1a\x16.CategoryBrandResponse\x12\x44\n\x13\x44\x65leteCategoryBrand\x12\x15.CategoryBrandRequest\x1a\x16.google.protobuf.Empty\x12\x44\n\x13UpdateCategoryBrand\x12\x15.CategoryBrandRequest\x1a\x16.google.protobuf.EmptyB\tZ\x07.;protob\x06proto3'
   ,
   dependencies=[google_dot_protobuf_dot_empty__pb2.DESCRIPTOR,])
 
+_GOODSVIEW = _descriptor.EnumDescriptor(
+  name='GoodsView',
+  full_name='GoodsView',
+  filename=None,
+  file=DESCRIPTOR,
+  create_key=_descriptor._internal_create_key,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='VIEW_FULL', index=0, number=0,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='VIEW_SUMMARY', index=1, number=1,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+  ],
+  containing_type=None,
+  serialized_options=None,
+  serialized_start=3470,
+  serialized_end=3514,
+)
+_sym_db.RegisterEnumDescriptor(_GOODSVIEW)
+
+GoodsView = enum_type_wrapper.EnumTypeWrapper(_GOODSVIEW)
+_COUNTMODE = _descriptor.EnumDescriptor(
+  name='CountMode',
+  full_name='CountMode',
+  filename=None,
+  file=DESCRIPTOR,
+  create_key=_descriptor._internal_create_key,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='COUNT_EXACT', index=0, number=0,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='COUNT_NONE', index=1, number=1,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='COUNT_ESTIMATE', index=2, number=2,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+  ],
+  containing_type=None,
+  serialized_options=None,
+  serialized_start=3516,
+  serialized_end=3580,
+)
+_sym_db.RegisterEnumDescriptor(_COUNTMODE)
+
+CountMode = enum_type_wrapper.EnumTypeWrapper(_COUNTMODE)
+VIEW_FULL = 0
+VIEW_SUMMARY = 1
+COUNT_EXACT = 0
+COUNT_NONE = 1
+COUNT_ESTIMATE = 2
 
 
 
@@ -795,6 +858,38 @@ _BRANDLISTRESPONSE = _descriptor.Descriptor(
 )
 
 
+_BANNERLISTREQUEST = _descriptor.Descriptor(
+  name='BannerListRequest',
+  full_name='BannerListRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='version', full_name='BannerListRequest.version', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1301,
+  serialized_end=1337,
+)
+
+
 _BANNERLISTRESPONSE = _descriptor.Descriptor(
   name='BannerListResponse',
   full_name='BannerListResponse',
@@ -817,6 +912,20 @@ _BANNERLISTRESPONSE = _descriptor.Descriptor(
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='version', full_name='BannerListResponse.version', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='notModified', full_name='BannerListResponse.notModified', index=3,
+      number=4, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
   ],
   extensions=[
   ],
@@ -829,8 +938,8 @@ _BANNERLISTRESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1301,
-  serialized_end=1367,
+  serialized_start=1339,
+  serialized_end=1443,
 )
 
 
@@ -868,8 +977,8 @@ _CATEGORYBRANDLISTRESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1369,
-  serialized_end=1449,
+  serialized_start=1445,
+  serialized_end=1525,
 )
 
 
@@ -888,6 +997,13 @@ _BATCHGOODSIDINFO = _descriptor.Descriptor(
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='view', full_name='BatchGoodsIdInfo.view', index=1,
+      number=2, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
   ],
   extensions=[
   ],
@@ -900,8 +1016,8 @@ _BATCHGOODSIDINFO = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1451,
-  serialized_end=1481,
+  serialized_start=1527,
+  serialized_end=1583,
 )
 
 
@@ -932,8 +1048,8 @@ _DELETEGOODSINFO = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1483,
-  serialized_end=1512,
+  serialized_start=1585,
+  serialized_end=1614,
 )
 
 
@@ -971,8 +1087,8 @@ _CATEGORYBRIEFINFORESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1514,
-  serialized_end=1567,
+  serialized_start=1616,
+  serialized_end=1669,
 )
 
 
@@ -1010,8 +1126,8 @@ _CATEGORYFILTERREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1569,
-  serialized_end=1619,
+  serialized_start=1671,
+  serialized_end=1721,
 )
 
 
@@ -1042,8 +1158,8 @@ _GOODINFOREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1621,
-  serialized_end=1650,
+  serialized_start=1723,
+  serialized_end=1752,
 )
 
 
@@ -1186,8 +1302,107 @@ _CREATEGOODSINFO = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1653,
-  serialized_end=1970,
+  serialized_start=1755,
+  serialized_end=2072,
+)
+
+
+_IMPORTGOODSSTATUS = _descriptor.Descriptor(
+  name='ImportGoodsStatus',
+  full_name='ImportGoodsStatus',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='index', full_name='ImportGoodsStatus.index', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='id', full_name='ImportGoodsStatus.id', index=1,
+      number=2, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='code', full_name='ImportGoodsStatus.code', index=2,
+      number=3, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='detail', full_name='ImportGoodsStatus.detail', index=3,
+      number=4, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2074,
+  serialized_end=2150,
+)
+
+
+_IMPORTGOODSRESPONSE = _descriptor.Descriptor(
+  name='ImportGoodsResponse',
+  full_name='ImportGoodsResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='total', full_name='ImportGoodsResponse.total', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='succeeded', full_name='ImportGoodsResponse.succeeded', index=1,
+      number=2, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='data', full_name='ImportGoodsResponse.data', index=2,
+      number=3, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2152,
+  serialized_end=2241,
 )
 
 
@@ -1225,8 +1440,8 @@ _GOODSREDUCEREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1972,
-  serialized_end=2023,
+  serialized_start=2243,
+  serialized_end=2294,
 )
 
 
@@ -1271,8 +1486,8 @@ _BATCHCATEGORYINFOREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2025,
-  serialized_end=2101,
+  serialized_start=2296,
+  serialized_end=2372,
 )
 
 
@@ -1354,6 +1569,48 @@ _GOODSFILTERREQUEST = _descriptor.Descriptor(
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='cursor', full_name='GoodsFilterRequest.cursor', index=10,
+      number=11, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='countMode', full_name='GoodsFilterRequest.countMode', index=11,
+      number=12, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='sort', full_name='GoodsFilterRequest.sort', index=12,
+      number=13, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='facets', full_name='GoodsFilterRequest.facets', index=13,
+      number=14, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='priceBuckets', full_name='GoodsFilterRequest.priceBuckets', index=14,
+      number=15, type=5, cpp_type=1, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='view', full_name='GoodsFilterRequest.view', index=15,
+      number=16, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
   ],
   extensions=[
   ],
@@ -1366,8 +1623,8 @@ _GOODSFILTERREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2104,
-  serialized_end=2295,
+  serialized_start=2375,
+  serialized_end=2691,
 )
 
 
@@ -1538,8 +1795,8 @@ _GOODSINFORESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2298,
-  serialized_end=2733,
+  serialized_start=2694,
+  serialized_end=3129,
 )
 
 
@@ -1565,6 +1822,165 @@ _GOODSLISTRESPONSE = _descriptor.Descriptor(
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='nextCursor', full_name='GoodsListResponse.nextCursor', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='facets', full_name='GoodsListResponse.facets', index=3,
+      number=4, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3131,
+  serialized_end=3249,
+)
+
+
+_BRANDFACET = _descriptor.Descriptor(
+  name='BrandFacet',
+  full_name='BrandFacet',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='id', full_name='BrandFacet.id', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='name', full_name='BrandFacet.name', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='count', full_name='BrandFacet.count', index=2,
+      number=3, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3251,
+  serialized_end=3304,
+)
+
+
+_PRICEFACET = _descriptor.Descriptor(
+  name='PriceFacet',
+  full_name='PriceFacet',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='min', full_name='PriceFacet.min', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='max', full_name='PriceFacet.max', index=1,
+      number=2, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='count', full_name='PriceFacet.count', index=2,
+      number=3, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3306,
+  serialized_end=3359,
+)
+
+
+_GOODSFACETS = _descriptor.Descriptor(
+  name='GoodsFacets',
+  full_name='GoodsFacets',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='brands', full_name='GoodsFacets.brands', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='prices', full_name='GoodsFacets.prices', index=1,
+      number=2, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='hotCount', full_name='GoodsFacets.hotCount', index=2,
+      number=3, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='newCount', full_name='GoodsFacets.newCount', index=3,
+      number=4, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
   ],
   extensions=[
   ],
@@ -1577,8 +1993,8 @@ _GOODSLISTRESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2735,
-  serialized_end=2803,
+  serialized_start=3361,
+  serialized_end=3468,
 )
 
 _CATEGORYLISTRESPONSE.fields_by_name['data'].message_type = _CATEGORYINFORESPONSE
@@ -1589,9 +2005,16 @@ _CATEGORYBRANDRESPONSE.fields_by_name['category'].message_type = _CATEGORYINFORE
 _BRANDLISTRESPONSE.fields_by_name['data'].message_type = _BRANDINFORESPONSE
 _BANNERLISTRESPONSE.fields_by_name['data'].message_type = _BANNERRESPONSE
 _CATEGORYBRANDLISTRESPONSE.fields_by_name['data'].message_type = _CATEGORYBRANDRESPONSE
+_BATCHGOODSIDINFO.fields_by_name['view'].enum_type = _GOODSVIEW
+_IMPORTGOODSRESPONSE.fields_by_name['data'].message_type = _IMPORTGOODSSTATUS
+_GOODSFILTERREQUEST.fields_by_name['countMode'].enum_type = _COUNTMODE
+_GOODSFILTERREQUEST.fields_by_name['view'].enum_type = _GOODSVIEW
 _GOODSINFORESPONSE.fields_by_name['category'].message_type = _CATEGORYBRIEFINFORESPONSE
 _GOODSINFORESPONSE.fields_by_name['brand'].message_type = _BRANDINFORESPONSE
 _GOODSLISTRESPONSE.fields_by_name['data'].message_type = _GOODSINFORESPONSE
+_GOODSLISTRESPONSE.fields_by_name['facets'].message_type = _GOODSFACETS
+_GOODSFACETS.fields_by_name['brands'].message_type = _BRANDFACET
+_GOODSFACETS.fields_by_name['prices'].message_type = _PRICEFACET
 DESCRIPTOR.message_types_by_name['CategoryListRequest'] = _CATEGORYLISTREQUEST
 DESCRIPTOR.message_types_by_name['CategoryInfoRequest'] = _CATEGORYINFOREQUEST
 DESCRIPTOR.message_types_by_name['DeleteCategoryRequest'] = _DELETECATEGORYREQUEST
@@ -1609,6 +2032,7 @@ DESCRIPTOR.message_types_by_name['BrandFilterRequest'] = _BRANDFILTERREQUEST
 DESCRIPTOR.message_types_by_name['BrandRequest'] = _BRANDREQUEST
 DESCRIPTOR.message_types_by_name['BrandInfoResponse'] = _BRANDINFORESPONSE
 DESCRIPTOR.message_types_by_name['BrandListResponse'] = _BRANDLISTRESPONSE
+DESCRIPTOR.message_types_by_name['BannerListRequest'] = _BANNERLISTREQUEST
 DESCRIPTOR.message_types_by_name['BannerListResponse'] = _BANNERLISTRESPONSE
 DESCRIPTOR.message_types_by_name['CategoryBrandListResponse'] = _CATEGORYBRANDLISTRESPONSE
 DESCRIPTOR.message_types_by_name['BatchGoodsIdInfo'] = _BATCHGOODSIDINFO
@@ -1617,11 +2041,18 @@ DESCRIPTOR.message_types_by_name['CategoryBriefInfoResponse'] = _CATEGORYBRIEFIN
 DESCRIPTOR.message_types_by_name['CategoryFilterRequest'] = _CATEGORYFILTERREQUEST
 DESCRIPTOR.message_types_by_name['GoodInfoRequest'] = _GOODINFOREQUEST
 DESCRIPTOR.message_types_by_name['CreateGoodsInfo'] = _CREATEGOODSINFO
+DESCRIPTOR.message_types_by_name['ImportGoodsStatus'] = _IMPORTGOODSSTATUS
+DESCRIPTOR.message_types_by_name['ImportGoodsResponse'] = _IMPORTGOODSRESPONSE
 DESCRIPTOR.message_types_by_name['GoodsReduceRequest'] = _GOODSREDUCEREQUEST
 DESCRIPTOR.message_types_by_name['BatchCategoryInfoRequest'] = _BATCHCATEGORYINFOREQUEST
 DESCRIPTOR.message_types_by_name['GoodsFilterRequest'] = _GOODSFILTERREQUEST
 DESCRIPTOR.message_types_by_name['GoodsInfoResponse'] = _GOODSINFORESPONSE
 DESCRIPTOR.message_types_by_name['GoodsListResponse'] = _GOODSLISTRESPONSE
+DESCRIPTOR.message_types_by_name['BrandFacet'] = _BRANDFACET
+DESCRIPTOR.message_types_by_name['PriceFacet'] = _PRICEFACET
+DESCRIPTOR.message_types_by_name['GoodsFacets'] = _GOODSFACETS
+DESCRIPTOR.enum_types_by_name['GoodsView'] = _GOODSVIEW
+DESCRIPTOR.enum_types_by_name['CountMode'] = _COUNTMODE
 _sym_db.RegisterFileDescriptor(DESCRIPTOR)
 
 CategoryListRequest = _reflection.GeneratedProtocolMessageType('CategoryListRequest', (_message.Message,), {
@@ -1743,6 +2174,13 @@ BrandListResponse = _reflection.GeneratedProtocolMessageType('BrandListResponse'
   })
 _sym_db.RegisterMessage(BrandListResponse)
 
+BannerListRequest = _reflection.GeneratedProtocolMessageType('BannerListRequest', (_message.Message,), {
+  'DESCRIPTOR' : _BANNERLISTREQUEST,
+  '__module__' : 'goods_pb2'
+  # @@protoc_insertion_point(class_scope:BannerListRequest)
+  })
+_sym_db.RegisterMessage(BannerListRequest)
+
 BannerListResponse = _reflection.GeneratedProtocolMessageType('BannerListResponse', (_message.Message,), {
   'DESCRIPTOR' : _BANNERLISTRESPONSE,
   '__module__' : 'goods_pb2'
@@ -1799,6 +2237,20 @@ CreateGoodsInfo = _reflection.GeneratedProtocolMessageType('CreateGoodsInfo', (_
   })
 _sym_db.RegisterMessage(CreateGoodsInfo)
 
+ImportGoodsStatus = _reflection.GeneratedProtocolMessageType('ImportGoodsStatus', (_message.Message,), {
+  'DESCRIPTOR' : _IMPORTGOODSSTATUS,
+  '__module__' : 'goods_pb2'
+  # @@protoc_insertion_point(class_scope:ImportGoodsStatus)
+  })
+_sym_db.RegisterMessage(ImportGoodsStatus)
+
+ImportGoodsResponse = _reflection.GeneratedProtocolMessageType('ImportGoodsResponse', (_message.Message,), {
+  'DESCRIPTOR' : _IMPORTGOODSRESPONSE,
+  '__module__' : 'goods_pb2'
+  # @@protoc_insertion_point(class_scope:ImportGoodsResponse)
+  })
+_sym_db.RegisterMessage(ImportGoodsResponse)
+
 GoodsReduceRequest = _reflection.GeneratedProtocolMessageType('GoodsReduceRequest', (_message.Message,), {
   'DESCRIPTOR' : _GOODSREDUCEREQUEST,
   '__module__' : 'goods_pb2'
@@ -1834,6 +2286,27 @@ GoodsListResponse = _reflection.GeneratedProtocolMessageType('GoodsListResponse'
   })
 _sym_db.RegisterMessage(GoodsListResponse)
 
+BrandFacet = _reflection.GeneratedProtocolMessageType('BrandFacet', (_message.Message,), {
+  'DESCRIPTOR' : _BRANDFACET,
+  '__module__' : 'goods_pb2'
+  # @@protoc_insertion_point(class_scope:BrandFacet)
+  })
+_sym_db.RegisterMessage(BrandFacet)
+
+PriceFacet = _reflection.GeneratedProtocolMessageType('PriceFacet', (_message.Message,), {
+  'DESCRIPTOR' : _PRICEFACET,
+  '__module__' : 'goods_pb2'
+  # @@protoc_insertion_point(class_scope:PriceFacet)
+  })
+_sym_db.RegisterMessage(PriceFacet)
+
+GoodsFacets = _reflection.GeneratedProtocolMessageType('GoodsFacets', (_message.Message,), {
+  'DESCRIPTOR' : _GOODSFACETS,
+  '__module__' : 'goods_pb2'
+  # @@protoc_insertion_point(class_scope:GoodsFacets)
+  })
+_sym_db.RegisterMessage(GoodsFacets)
+
 
 DESCRIPTOR._options = None
 
@@ -1844,8 +2317,8 @@ _GOODS = _descriptor.ServiceDescriptor(
   index=0,
   serialized_options=None,
   create_key=_descriptor._internal_create_key,
-  serialized_start=2806,
-  serialized_end=4261,
+  serialized_start=3583,
+  serialized_end=5217,
   methods=[
   _descriptor.MethodDescriptor(
     name='GoodsList',
@@ -1907,10 +2380,40 @@ _GOODS = _descriptor.ServiceDescriptor(
     serialized_options=None,
     create_key=_descriptor._internal_create_key,
   ),
+  _descriptor.MethodDescriptor(
+    name='StreamGoodsList',
+    full_name='Goods.StreamGoodsList',
+    index=6,
+    containing_service=None,
+    input_type=_GOODSFILTERREQUEST,
+    output_type=_GOODSINFORESPONSE,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
+  _descriptor.MethodDescriptor(
+    name='StreamBatchGetGoods',
+    full_name='Goods.StreamBatchGetGoods',
+    index=7,
+    containing_service=None,
+    input_type=_BATCHGOODSIDINFO,
+    output_type=_GOODSINFORESPONSE,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
+  _descriptor.MethodDescriptor(
+    name='ImportGoods',
+    full_name='Goods.ImportGoods',
+    index=8,
+    containing_service=None,
+    input_type=_CREATEGOODSINFO,
+    output_type=_IMPORTGOODSRESPONSE,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
   _descriptor.MethodDescriptor(
     name='GetAllCategorysList',
     full_name='Goods.GetAllCategorysList',
-    index=6,
+    index=9,
     containing_service=None,
     input_type=google_dot_protobuf_dot_empty__pb2._EMPTY,
     output_type=_CATEGORYLISTRESPONSE,
@@ -1920,7 +2423,7 @@ _GOODS = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='GetSubCategory',
     full_name='Goods.GetSubCategory',
-    index=7,
+    index=10,
     containing_service=None,
     input_type=_CATEGORYLISTREQUEST,
     output_type=_SUBCATEGORYLISTRESPONSE,
@@ -1930,7 +2433,7 @@ _GOODS = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='CreateCategory',
     full_name='Goods.CreateCategory',
-    index=8,
+    index=11,
     containing_service=None,
     input_type=_CATEGORYINFOREQUEST,
     output_type=_CATEGORYINFORESPONSE,
@@ -1940,7 +2443,7 @@ _GOODS = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='DeleteCategory',
     full_name='Goods.DeleteCategory',
-    index=9,
+    index=12,
     containing_service=None,
     input_type=_DELETECATEGORYREQUEST,
     output_type=google_dot_protobuf_dot_empty__pb2._EMPTY,
@@ -1950,7 +2453,7 @@ _GOODS = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='UpdateCategory',
     full_name='Goods.UpdateCategory',
-    index=10,
+    index=13,
     containing_service=None,
     input_type=_CATEGORYINFOREQUEST,
     output_type=google_dot_protobuf_dot_empty__pb2._EMPTY,
@@ -1960,7 +2463,7 @@ _GOODS = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='BrandList',
     full_name='Goods.BrandList',
-    index=11,
+    index=14,
     containing_service=None,
     input_type=_BRANDFILTERREQUEST,
     output_type=_BRANDLISTRESPONSE,
@@ -1970,7 +2473,7 @@ _GOODS = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='CreateBrand',
     full_name='Goods.CreateBrand',
-    index=12,
+    index=15,
     containing_service=None,
     input_type=_BRANDREQUEST,
     output_type=_BRANDINFORESPONSE,
@@ -1980,7 +2483,7 @@ _GOODS = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='DeleteBrand',
     full_name='Goods.DeleteBrand',
-    index=13,
+    index=16,
     containing_service=None,
     input_type=_BRANDREQUEST,
     output_type=google_dot_protobuf_dot_empty__pb2._EMPTY,
@@ -1990,7 +2493,7 @@ _GOODS = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='UpdateBrand',
     full_name='Goods.UpdateBrand',
-    index=14,
+    index=17,
     containing_service=None,
     input_type=_BRANDREQUEST,
     output_type=google_dot_protobuf_dot_empty__pb2._EMPTY,
@@ -2000,9 +2503,9 @@ _GOODS = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='BannerList',
     full_name='Goods.BannerList',
-    index=15,
+    index=18,
     containing_service=None,
-    input_type=google_dot_protobuf_dot_empty__pb2._EMPTY,
+    input_type=_BANNERLISTREQUEST,
     output_type=_BANNERLISTRESPONSE,
     serialized_options=None,
     create_key=_descriptor._internal_create_key,
@@ -2010,7 +2513,7 @@ _GOODS = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='CreateBanner',
     full_name='Goods.CreateBanner',
-    index=16,
+    index=19,
     containing_service=None,
     input_type=_BANNERREQUEST,
     output_type=_BANNERRESPONSE,
@@ -2020,7 +2523,7 @@ _GOODS = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='DeleteBanner',
     full_name='Goods.DeleteBanner',
-    index=17,
+    index=20,
     containing_service=None,
     input_type=_BANNERREQUEST,
     output_type=google_dot_protobuf_dot_empty__pb2._EMPTY,
@@ -2030,7 +2533,7 @@ _GOODS = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='UpdateBanner',
     full_name='Goods.UpdateBanner',
-    index=18,
+    index=21,
     containing_service=None,
     input_type=_BANNERREQUEST,
     output_type=google_dot_protobuf_dot_empty__pb2._EMPTY,
@@ -2040,7 +2543,7 @@ _GOODS = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='CategoryBrandList',
     full_name='Goods.CategoryBrandList',
-    index=19,
+    index=22,
     containing_service=None,
     input_type=_CATEGORYBRANDFILTERREQUEST,
     output_type=_CATEGORYBRANDLISTRESPONSE,
@@ -2050,7 +2553,7 @@ _GOODS = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='GetCategoryBrandList',
     full_name='Goods.GetCategoryBrandList',
-    index=20,
+    index=23,
     containing_service=None,
     input_type=_CATEGORYINFOREQUEST,
     output_type=_BRANDLISTRESPONSE,
@@ -2060,7 +2563,7 @@ _GOODS = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='CreateCategoryBrand',
     full_name='Goods.CreateCategoryBrand',
-    index=21,
+    index=24,
     containing_service=None,
     input_type=_CATEGORYBRANDREQUEST,
     output_type=_CATEGORYBRANDRESPONSE,
@@ -2070,7 +2573,7 @@ _GOODS = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='DeleteCategoryBrand',
     full_name='Goods.DeleteCategoryBrand',
-    index=22,
+    index=25,
     containing_service=None,
     input_type=_CATEGORYBRANDREQUEST,
     output_type=google_dot_protobuf_dot_empty__pb2._EMPTY,
@@ -2080,7 +2583,7 @@ _GOODS = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='UpdateCategoryBrand',
     full_name='Goods.UpdateCategoryBrand',
-    index=23,
+    index=26,
     containing_service=None,
     input_type=_CATEGORYBRANDREQUEST,
     output_type=google_dot_protobuf_dot_empty__pb2._EMPTY,
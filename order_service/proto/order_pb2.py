@@ -20,7 +20,7 @@ DESCRIPTOR = _descriptor.FileDescriptor(
   syntax='proto3',
   serialized_options=b'Z\007.;proto',
   create_key=_descriptor._internal_create_key,
-  serialized_pb=b'\n\x0border.proto\x12\x05proto\x1a\x1bgoogle/protobuf/empty.proto\"\x16\n\x08UserInfo\x12\n\n\x02id\x18\x01 \x01(\x05\"b\n\x14ShopCartInfoResponse\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0e\n\x06userId\x18\x02 \x01(\x05\x12\x0f\n\x07goodsId\x18\x03 \x01(\x05\x12\x0c\n\x04nums\x18\x04 \x01(\x05\x12\x0f\n\x07\x63hecked\x18\x05 \x01(\x08\"P\n\x14\x43\x61rtItemListResponse\x12\r\n\x05total\x18\x01 \x01(\x05\x12)\n\x04\x64\x61ta\x18\x02 \x03(\x0b\x32\x1b.proto.ShopCartInfoResponse\"Q\n\x0f\x43\x61rtItemRequest\x12\x0e\n\x06userId\x18\x02 \x01(\x05\x12\x0f\n\x07goodsId\x18\x03 \x01(\x05\x12\x0c\n\x04nums\x18\x04 \x01(\x05\x12\x0f\n\x07\x63hecked\x18\x05 \x01(\x08\"g\n\x0cOrderRequest\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0e\n\x06userId\x18\x02 \x01(\x05\x12\x0f\n\x07\x61\x64\x64ress\x18\x03 \x01(\t\x12\x0e\n\x06mobile\x18\x04 \x01(\t\x12\x0c\n\x04name\x18\x05 \x01(\t\x12\x0c\n\x04post\x18\x06 \x01(\t\"\xbe\x01\n\x11OrderInfoResponse\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0e\n\x06userId\x18\x02 \x01(\x05\x12\x0f\n\x07orderSn\x18\x03 \x01(\t\x12\x0f\n\x07payType\x18\x04 \x01(\t\x12\x0e\n\x06status\x18\x05 \x01(\t\x12\x0c\n\x04post\x18\x06 \x01(\t\x12\r\n\x05total\x18\x07 \x01(\x02\x12\x0f\n\x07\x61\x64\x64ress\x18\x08 \x01(\t\x12\x0c\n\x04name\x18\t \x01(\t\x12\x0e\n\x06mobile\x18\n \x01(\t\x12\x0f\n\x07\x61\x64\x64Time\x18\x0b \x01(\t\"J\n\x11OrderListResponse\x12\r\n\x05total\x18\x01 \x01(\x05\x12&\n\x04\x64\x61ta\x18\x02 \x03(\x0b\x32\x18.proto.OrderInfoResponse\"H\n\x12OrderFilterRequest\x12\x0e\n\x06userId\x18\x01 \x01(\x05\x12\r\n\x05pages\x18\x02 \x01(\x05\x12\x13\n\x0bpagePerNums\x18\x03 \x01(\x05\"\x8a\x01\n\x11OrderItemResponse\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0f\n\x07orderId\x18\x02 \x01(\x05\x12\x0f\n\x07goodsId\x18\x03 \x01(\x05\x12\x11\n\tgoodsName\x18\x04 \x01(\t\x12\x12\n\ngoodsImage\x18\x05 \x01(\t\x12\x12\n\ngoodsPrice\x18\x06 \x01(\x02\x12\x0c\n\x04nums\x18\x07 \x01(\x05\"n\n\x17OrderInfoDetailResponse\x12+\n\torderInfo\x18\x01 \x01(\x0b\x32\x18.proto.OrderInfoResponse\x12&\n\x04\x64\x61ta\x18\x02 \x03(\x0b\x32\x18.proto.OrderItemResponse\".\n\x0bOrderStatus\x12\x0f\n\x07OrderSn\x18\x01 \x01(\t\x12\x0e\n\x06status\x18\x02 \x01(\t2\x95\x04\n\x05Order\x12<\n\x0c\x43\x61rtItemList\x12\x0f.proto.UserInfo\x1a\x1b.proto.CartItemListResponse\x12\x45\n\x0e\x43reateCartItem\x12\x16.proto.CartItemRequest\x1a\x1b.proto.ShopCartInfoResponse\x12@\n\x0eUpdateCartItem\x12\x16.proto.CartItemRequest\x1a\x16.google.protobuf.Empty\x12@\n\x0e\x44\x65leteCartItem\x12\x16.proto.CartItemRequest\x1a\x16.google.protobuf.Empty\x12<\n\x0b\x43reateOrder\x12\x13.proto.OrderRequest\x1a\x18.proto.OrderInfoResponse\x12@\n\tOrderList\x12\x19.proto.OrderFilterRequest\x1a\x18.proto.OrderListResponse\x12\x42\n\x0bOrderDetail\x12\x13.proto.OrderRequest\x1a\x1e.proto.OrderInfoDetailResponse\x12?\n\x11UpdateOrderStatus\x12\x12.proto.OrderStatus\x1a\x16.google.protobuf.EmptyB\tZ\x07.;protob\x06proto3'
+  serialized_pb=b'\n\x0border.proto\x12\x05proto\x1a\x1bgoogle/protobuf/empty.proto\"\x16\n\x08UserInfo\x12\n\n\x02id\x18\x01 \x01(\x05\"b\n\x14ShopCartInfoResponse\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0e\n\x06userId\x18\x02 \x01(\x05\x12\x0f\n\x07goodsId\x18\x03 \x01(\x05\x12\x0c\n\x04nums\x18\x04 \x01(\x05\x12\x0f\n\x07\x63hecked\x18\x05 \x01(\x08\"P\n\x14\x43\x61rtItemListResponse\x12\r\n\x05total\x18\x01 \x01(\x05\x12)\n\x04\x64\x61ta\x18\x02 \x03(\x0b\x32\x1b.proto.ShopCartInfoResponse\"\xc2\x01\n\x16ShopCartDetailResponse\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0e\n\x06userId\x18\x02 \x01(\x05\x12\x0f\n\x07goodsId\x18\x03 \x01(\x05\x12\x0c\n\x04nums\x18\x04 \x01(\x05\x12\x0f\n\x07\x63hecked\x18\x05 \x01(\x08\x12\x11\n\tgoodsName\x18\x06 \x01(\t\x12\x12\n\ngoodsImage\x18\x07 \x01(\t\x12\x12\n\ngoodsPrice\x18\x08 \x01(\x02\x12\x0e\n\x06\x61mount\x18\t \x01(\x02\x12\x11\n\tavailable\x18\n \x01(\x08\"n\n\x1a\x43\x61rtItemDetailListResponse\x12\r\n\x05total\x18\x01 \x01(\x05\x12+\n\x04\x64\x61ta\x18\x02 \x03(\x0b\x32\x1d.proto.ShopCartDetailResponse\x12\x14\n\x0c\x63heckedTotal\x18\x03 \x01(\x02\"Q\n\x0f\x43\x61rtItemRequest\x12\x0e\n\x06userId\x18\x02 \x01(\x05\x12\x0f\n\x07goodsId\x18\x03 \x01(\x05\x12\x0c\n\x04nums\x18\x04 \x01(\x05\x12\x0f\n\x07\x63hecked\x18\x05 \x01(\x08\"g\n\x0cOrderRequest\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0e\n\x06userId\x18\x02 \x01(\x05\x12\x0f\n\x07\x61\x64\x64ress\x18\x03 \x01(\t\x12\x0e\n\x06mobile\x18\x04 \x01(\t\x12\x0c\n\x04name\x18\x05 \x01(\t\x12\x0c\n\x04post\x18\x06 \x01(\t\"\xbe\x01\n\x11OrderInfoResponse\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0e\n\x06userId\x18\x02 \x01(\x05\x12\x0f\n\x07orderSn\x18\x03 \x01(\t\x12\x0f\n\x07payType\x18\x04 \x01(\t\x12\x0e\n\x06status\x18\x05 \x01(\t\x12\x0c\n\x04post\x18\x06 \x01(\t\x12\r\n\x05total\x18\x07 \x01(\x02\x12\x0f\n\x07\x61\x64\x64ress\x18\x08 \x01(\t\x12\x0c\n\x04name\x18\t \x01(\t\x12\x0e\n\x06mobile\x18\n \x01(\t\x12\x0f\n\x07\x61\x64\x64Time\x18\x0b \x01(\t\"J\n\x11OrderListResponse\x12\r\n\x05total\x18\x01 \x01(\x05\x12&\n\x04\x64\x61ta\x18\x02 \x03(\x0b\x32\x18.proto.OrderInfoResponse\"H\n\x12OrderFilterRequest\x12\x0e\n\x06userId\x18\x01 \x01(\x05\x12\r\n\x05pages\x18\x02 \x01(\x05\x12\x13\n\x0bpagePerNums\x18\x03 \x01(\x05\"\x8a\x01\n\x11OrderItemResponse\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0f\n\x07orderId\x18\x02 \x01(\x05\x12\x0f\n\x07goodsId\x18\x03 \x01(\x05\x12\x11\n\tgoodsName\x18\x04 \x01(\t\x12\x12\n\ngoodsImage\x18\x05 \x01(\t\x12\x12\n\ngoodsPrice\x18\x06 \x01(\x02\x12\x0c\n\x04nums\x18\x07 \x01(\x05\"n\n\x17OrderInfoDetailResponse\x12+\n\torderInfo\x18\x01 \x01(\x0b\x32\x18.proto.OrderInfoResponse\x12&\n\x04\x64\x61ta\x18\x02 \x03(\x0b\x32\x18.proto.OrderItemResponse\".\n\x0bOrderStatus\x12\x0f\n\x07OrderSn\x18\x01 \x01(\t\x12\x0e\n\x06status\x18\x02 \x01(\t2\xdf\x04\n\x05Order\x12<\n\x0c\x43\x61rtItemList\x12\x0f.proto.UserInfo\x1a\x1b.proto.CartItemListResponse\x12\x45\n\x0e\x43reateCartItem\x12\x16.proto.CartItemRequest\x1a\x1b.proto.ShopCartInfoResponse\x12@\n\x0eUpdateCartItem\x12\x16.proto.CartItemRequest\x1a\x16.google.protobuf.Empty\x12@\n\x0e\x44\x65leteCartItem\x12\x16.proto.CartItemRequest\x1a\x16.google.protobuf.Empty\x12H\n\x12\x43\x61rtItemDetailList\x12\x0f.proto.UserInfo\x1a!.proto.CartItemDetailListResponse\x12<\n\x0b\x43reateOrder\x12\x13.proto.OrderRequest\x1a\x18.proto.OrderInfoResponse\x12@\n\tOrderList\x12\x19.proto.OrderFilterRequest\x1a\x18.proto.OrderListResponse\x12\x42\n\x0bOrderDetail\x12\x13.proto.OrderRequest\x1a\x1e.proto.OrderInfoDetailResponse\x12?\n\x11UpdateOrderStatus\x12\x12.proto.OrderStatus\x1a\x16.google.protobuf.EmptyB\tZ\x07.;protob\x06proto3'
   ,
   dependencies=[google_dot_protobuf_dot_empty__pb2.DESCRIPTOR,])
 
@@ -158,6 +158,147 @@ _CARTITEMLISTRESPONSE = _descriptor.Descriptor(
 )
 
 
+_SHOPCARTDETAILRESPONSE = _descriptor.Descriptor(
+  name='ShopCartDetailResponse',
+  full_name='proto.ShopCartDetailResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='id', full_name='proto.ShopCartDetailResponse.id', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='userId', full_name='proto.ShopCartDetailResponse.userId', index=1,
+      number=2, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='goodsId', full_name='proto.ShopCartDetailResponse.goodsId', index=2,
+      number=3, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='nums', full_name='proto.ShopCartDetailResponse.nums', index=3,
+      number=4, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='checked', full_name='proto.ShopCartDetailResponse.checked', index=4,
+      number=5, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='goodsName', full_name='proto.ShopCartDetailResponse.goodsName', index=5,
+      number=6, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='goodsImage', full_name='proto.ShopCartDetailResponse.goodsImage', index=6,
+      number=7, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='goodsPrice', full_name='proto.ShopCartDetailResponse.goodsPrice', index=7,
+      number=8, type=2, cpp_type=6, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='amount', full_name='proto.ShopCartDetailResponse.amount', index=8,
+      number=9, type=2, cpp_type=6, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='available', full_name='proto.ShopCartDetailResponse.available', index=9,
+      number=10, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=258,
+  serialized_end=452,
+)
+
+
+_CARTITEMDETAILLISTRESPONSE = _descriptor.Descriptor(
+  name='CartItemDetailListResponse',
+  full_name='proto.CartItemDetailListResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='total', full_name='proto.CartItemDetailListResponse.total', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='data', full_name='proto.CartItemDetailListResponse.data', index=1,
+      number=2, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='checkedTotal', full_name='proto.CartItemDetailListResponse.checkedTotal', index=2,
+      number=3, type=2, cpp_type=6, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=454,
+  serialized_end=564,
+)
+
+
 _CARTITEMREQUEST = _descriptor.Descriptor(
   name='CartItemRequest',
   full_name='proto.CartItemRequest',
@@ -206,8 +347,8 @@ _CARTITEMREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=257,
-  serialized_end=338,
+  serialized_start=566,
+  serialized_end=647,
 )
 
 
@@ -273,8 +414,8 @@ _ORDERREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=340,
-  serialized_end=443,
+  serialized_start=649,
+  serialized_end=752,
 )
 
 
@@ -375,8 +516,8 @@ _ORDERINFORESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=446,
-  serialized_end=636,
+  serialized_start=755,
+  serialized_end=945,
 )
 
 
@@ -414,8 +555,8 @@ _ORDERLISTRESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=638,
-  serialized_end=712,
+  serialized_start=947,
+  serialized_end=1021,
 )
 
 
@@ -460,8 +601,8 @@ _ORDERFILTERREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=714,
-  serialized_end=786,
+  serialized_start=1023,
+  serialized_end=1095,
 )
 
 
@@ -534,8 +675,8 @@ _ORDERITEMRESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=789,
-  serialized_end=927,
+  serialized_start=1098,
+  serialized_end=1236,
 )
 
 
@@ -573,8 +714,8 @@ _ORDERINFODETAILRESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=929,
-  serialized_end=1039,
+  serialized_start=1238,
+  serialized_end=1348,
 )
 
 
@@ -612,17 +753,20 @@ _ORDERSTATUS = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1041,
-  serialized_end=1087,
+  serialized_start=1350,
+  serialized_end=1396,
 )
 
 _CARTITEMLISTRESPONSE.fields_by_name['data'].message_type = _SHOPCARTINFORESPONSE
+_CARTITEMDETAILLISTRESPONSE.fields_by_name['data'].message_type = _SHOPCARTDETAILRESPONSE
 _ORDERLISTRESPONSE.fields_by_name['data'].message_type = _ORDERINFORESPONSE
 _ORDERINFODETAILRESPONSE.fields_by_name['orderInfo'].message_type = _ORDERINFORESPONSE
 _ORDERINFODETAILRESPONSE.fields_by_name['data'].message_type = _ORDERITEMRESPONSE
 DESCRIPTOR.message_types_by_name['UserInfo'] = _USERINFO
 DESCRIPTOR.message_types_by_name['ShopCartInfoResponse'] = _SHOPCARTINFORESPONSE
 DESCRIPTOR.message_types_by_name['CartItemListResponse'] = _CARTITEMLISTRESPONSE
+DESCRIPTOR.message_types_by_name['ShopCartDetailResponse'] = _SHOPCARTDETAILRESPONSE
+DESCRIPTOR.message_types_by_name['CartItemDetailListResponse'] = _CARTITEMDETAILLISTRESPONSE
 DESCRIPTOR.message_types_by_name['CartItemRequest'] = _CARTITEMREQUEST
 DESCRIPTOR.message_types_by_name['OrderRequest'] = _ORDERREQUEST
 DESCRIPTOR.message_types_by_name['OrderInfoResponse'] = _ORDERINFORESPONSE
@@ -654,6 +798,20 @@ CartItemListResponse = _reflection.GeneratedProtocolMessageType('CartItemListRes
   })
 _sym_db.RegisterMessage(CartItemListResponse)
 
+ShopCartDetailResponse = _reflection.GeneratedProtocolMessageType('ShopCartDetailResponse', (_message.Message,), {
+  'DESCRIPTOR' : _SHOPCARTDETAILRESPONSE,
+  '__module__' : 'order_pb2'
+  # @@protoc_insertion_point(class_scope:proto.ShopCartDetailResponse)
+  })
+_sym_db.RegisterMessage(ShopCartDetailResponse)
+
+CartItemDetailListResponse = _reflection.GeneratedProtocolMessageType('CartItemDetailListResponse', (_message.Message,), {
+  'DESCRIPTOR' : _CARTITEMDETAILLISTRESPONSE,
+  '__module__' : 'order_pb2'
+  # @@protoc_insertion_point(class_scope:proto.CartItemDetailListResponse)
+  })
+_sym_db.RegisterMessage(CartItemDetailListResponse)
+
 CartItemRequest = _reflection.GeneratedProtocolMessageType('CartItemRequest', (_message.Message,), {
   'DESCRIPTOR' : _CARTITEMREQUEST,
   '__module__' : 'order_pb2'
@@ -720,8 +878,8 @@ _ORDER = _descriptor.ServiceDescriptor(
   index=0,
   serialized_options=None,
   create_key=_descriptor._internal_create_key,
-  serialized_start=1090,
-  serialized_end=1623,
+  serialized_start=1399,
+  serialized_end=2006,
   methods=[
   _descriptor.MethodDescriptor(
     name='CartItemList',
@@ -763,10 +921,20 @@ _ORDER = _descriptor.ServiceDescriptor(
     serialized_options=None,
     create_key=_descriptor._internal_create_key,
   ),
+  _descriptor.MethodDescriptor(
+    name='CartItemDetailList',
+    full_name='proto.Order.CartItemDetailList',
+    index=4,
+    containing_service=None,
+    input_type=_USERINFO,
+    output_type=_CARTITEMDETAILLISTRESPONSE,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
   _descriptor.MethodDescriptor(
     name='CreateOrder',
     full_name='proto.Order.CreateOrder',
-    index=4,
+    index=5,
     containing_service=None,
     input_type=_ORDERREQUEST,
     output_type=_ORDERINFORESPONSE,
@@ -776,7 +944,7 @@ _ORDER = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='OrderList',
     full_name='proto.Order.OrderList',
-    index=5,
+    index=6,
     containing_service=None,
     input_type=_ORDERFILTERREQUEST,
     output_type=_ORDERLISTRESPONSE,
@@ -786,7 +954,7 @@ _ORDER = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='OrderDetail',
     full_name='proto.Order.OrderDetail',
-    index=6,
+    index=7,
     containing_service=None,
     input_type=_ORDERREQUEST,
     output_type=_ORDERINFODETAILRESPONSE,
@@ -796,7 +964,7 @@ _ORDER = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='UpdateOrderStatus',
     full_name='proto.Order.UpdateOrderStatus',
-    index=7,
+    index=8,
     containing_service=None,
     input_type=_ORDERSTATUS,
     output_type=google_dot_protobuf_dot_empty__pb2._EMPTY,
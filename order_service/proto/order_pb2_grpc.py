@@ -35,6 +35,11 @@ class OrderStub(object):
                 request_serializer=order__pb2.CartItemRequest.SerializeToString,
                 response_deserializer=google_dot_protobuf_dot_empty__pb2.Empty.FromString,
                 )
+        self.CartItemDetailList = channel.unary_unary(
+                '/proto.Order/CartItemDetailList',
+                request_serializer=order__pb2.UserInfo.SerializeToString,
+                response_deserializer=order__pb2.CartItemDetailListResponse.FromString,
+                )
         self.CreateOrder = channel.unary_unary(
                 '/proto.Order/CreateOrder',
                 request_serializer=order__pb2.OrderRequest.SerializeToString,
@@ -89,6 +94,13 @@ class OrderServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def CartItemDetailList(self, request, context):
+        """购物车信息带上商品名称、图片、价格和选中商品的总价
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def CreateOrder(self, request, context):
         """订单
         新建订单
@@ -141,6 +153,11 @@ def add_OrderServicer_to_server(servicer, server):
                     request_deserializer=order__pb2.CartItemRequest.FromString,
                     response_serializer=google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
             ),
+            'CartItemDetailList': grpc.unary_unary_rpc_method_handler(
+                    servicer.CartItemDetailList,
+                    request_deserializer=order__pb2.UserInfo.FromString,
+                    response_serializer=order__pb2.CartItemDetailListResponse.SerializeToString,
+            ),
             'CreateOrder': grpc.unary_unary_rpc_method_handler(
                     servicer.CreateOrder,
                     request_deserializer=order__pb2.OrderRequest.FromString,
@@ -239,6 +256,23 @@ class Order(object):
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
 
+    @staticmethod
+    def CartItemDetailList(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/proto.Order/CartItemDetailList',
+            order__pb2.UserInfo.SerializeToString,
+            order__pb2.CartItemDetailListResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
     @staticmethod
     def CreateOrder(request,
             target,
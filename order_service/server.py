@@ -1,13 +1,11 @@
 import logging
 
-import grpc
 import signal
 import sys
 import os
 import argparse
 import environ
 import uuid
-from concurrent import futures
 from loguru import logger
 
 BASE_DIR = os.path.dirname(os.path.abspath(os.path.dirname(__file__)))
@@ -25,6 +23,7 @@ from jaeger_client import Config
 from grpc_opentracing.grpcext import intercept_server
 class OrderServiceServer(BaseServer):
     SERVICE_NAME = 'order-srv'
+    servicer = None
 
     def __init__(self, host, port):
         super(OrderServiceServer, self).__init__()
@@ -33,10 +32,14 @@ class OrderServiceServer(BaseServer):
         self.SERVICE_PORT = port
         self.CONSUL_HOST = settings.data["consul"]["host"]
         self.CONSUL_PORT = settings.data["consul"]["port"]
+        self.SERVER_CONFIG = settings.data.get("grpc", {})
 
     def onExit(self, signo, frame):
         logger.info("Order Service terminate")
         self.unregister()
+        if self.servicer is not None:
+            self.servicer.close()
+        super(OrderServiceServer, self).onExit(signo, frame)
         sys.exit(0)
 
     def serve(self):
@@ -56,10 +59,11 @@ class OrderServiceServer(BaseServer):
             validate=True,
         )
         tracer = config.initialize_tracer()
-        self.server = grpc.server(futures.ThreadPoolExecutor(max_workers=40))
+        self.server = self.create_server(max_workers=40)
         tracing_interceptor = open_tracing_server_interceptor(tracer)
         self.server = intercept_server(self.server, tracing_interceptor)
-        order_pb2_grpc.add_OrderServicer_to_server(OrderService(), self.server)
+        self.servicer = OrderService()
+        order_pb2_grpc.add_OrderServicer_to_server(self.servicer, self.server)
         health_servicer = health.HealthServicer()
         health_pb2_grpc.add_HealthServicer_to_server(health_servicer, self.server)
         self.server.add_insecure_port(f'[::]:{self.SERVICE_PORT}')
@@ -90,6 +94,14 @@ if __name__ == "__main__":
                         type=int,
                         default=50063,
                         help="port")
+    parser.add_argument('--processes',
+                        nargs="?",
+                        type=int,
+                        default=1,
+                        help="worker processes sharing the port")
     args = parser.parse_args()
     server = OrderServiceServer(args.host, args.port)
-    server.serve()
+    if args.processes > 1:
+        server.prefork(args.processes)
+    else:
+        server.serve()
@@ -51,4 +51,8 @@ Service_name = data['service_name']
 
 RocketMQ_HOST = data["rocketmq"]["host"]
 RocketMQ_PORT = data["rocketmq"]["port"]
+# CreateOrder 等待本地事务结果的最长时间(秒)
+CREATE_ORDER_TIMEOUT = data.get('create_order_timeout', 30)
+# 调用商品、库存服务的负载均衡策略: round_robin, least_outstanding, p2c
+LB_POLICY = data.get('lb_policy', 'p2c')
 logger.info("Read config from nacos " + f"{NACOS['Host']}:{NACOS['Port']}")
@@ -1,22 +1,15 @@
-import consul
-import grpc
+from common.channel_pool import ChannelPool
+from common.register import consul
 from order_service.proto import order_pb2_grpc, order_pb2
 from order_service.settings import settings
 
 
 class OrderTest:
     def __init__(self):
-        c = consul.Consul(host=settings.CONSUL_HOST, port=settings.CONSUL_POST)
-        services = c.agent.services()
-        ip, port = None, None
-        for key, value in services.items():
-            if value["Service"] == settings.Service_name:
-                ip = value['Address']
-                port = value['Port']
-                break
-        if not ip or not port:
+        channels = ChannelPool(consul.ConsulRegister(settings.CONSUL_HOST, settings.CONSUL_POST))
+        channel = channels.get(settings.Service_name)
+        if channel is None:
             raise Exception()
-        channel = grpc.insecure_channel(f"{ip}:{port}")
         self.order_stub = order_pb2_grpc.OrderStub(channel)
 
     def create_cart_item(self):
@@ -36,6 +29,10 @@ class OrderTest:
         rsp = self.order_stub.CartItemList(order_pb2.UserInfo(id=2))
         print(rsp)
 
+    def cart_detail_list(self):
+        rsp = self.order_stub.CartItemDetailList(order_pb2.UserInfo(id=2))
+        print(rsp)
+
 
     def order_list(self):
         rsp = self.order_stub.OrderList(order_pb2.OrderFilterRequest(userId=1))
@@ -82,6 +82,7 @@ class UserServiceServer(BaseServer):
         self.SERVICE_PORT = port
         self.CONSUL_HOST = setting.data["consul"]["host"]
         self.CONSUL_PORT = setting.data["consul"]["port"]
+        self.SERVER_CONFIG = setting.data.get("grpc", {})
         logger.add("logs/user_service_{time}.log")
 
     def onExit(self, signo, frame):
@@ -125,7 +126,7 @@ class UserServiceServer(BaseServer):
 
 
     def serve(self):
-        self.server = grpc.server(futures.ThreadPoolExecutor(max_workers=40))
+        self.server = self.create_server(max_workers=40)
         user_pb2_grpc.add_UserServicer_to_server(UserServicer(), self.server)
         health_servicer = health.HealthServicer()
         health_pb2_grpc.add_HealthServicer_to_server(health_servicer, self.server)
@@ -150,6 +151,14 @@ if __name__ == "__main__":
                         type=int,
                         default=50052,
                         help="port")
+    parser.add_argument('--processes',
+                        nargs="?",
+                        type=int,
+                        default=1,
+                        help="worker processes sharing the port")
     args = parser.parse_args()
     server = UserServiceServer(args.host, args.port)
-    server.serve()
+    if args.processes > 1:
+        server.prefork(args.processes)
+    else:
+        server.serve()
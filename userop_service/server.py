@@ -1,5 +1,4 @@
 import consul
-import grpc
 import logging
 import signal
 import sys
@@ -7,7 +6,6 @@ import os
 import argparse
 import environ
 import uuid
-from concurrent import futures
 
 import requests
 from loguru import logger
@@ -35,6 +33,7 @@ class UserOPServiceServer(BaseServer):
         self.SERVICE_PORT = port
         self.CONSUL_HOST = settings.data["consul"]["host"]
         self.CONSUL_PORT = settings.data["consul"]["port"]
+        self.SERVER_CONFIG = settings.data.get("grpc", {})
         logger.add("logs/userop_service_{time}.log")
 
     def onExit(self, signo, frame):
@@ -43,7 +42,7 @@ class UserOPServiceServer(BaseServer):
         sys.exit(0)
 
     def serve(self):
-        self.server = grpc.server(futures.ThreadPoolExecutor(max_workers=40))
+        self.server = self.create_server(max_workers=40)
         address_pb2_grpc.add_AddressServicer_to_server(AddressServicer(), self.server)
         userfav_pb2_grpc.add_UserFavServicer_to_server(UserFavServicer(), self.server)
         message_pb2_grpc.add_MessageServicer_to_server(MessageServicer(), self.server)
@@ -70,6 +69,14 @@ if __name__ == "__main__":
                         type=int,
                         default=50066,
                         help="port")
+    parser.add_argument('--processes',
+                        nargs="?",
+                        type=int,
+                        default=1,
+                        help="worker processes sharing the port")
     args = parser.parse_args()
     server = UserOPServiceServer(args.host, args.port)
-    server.serve()
+    if args.processes > 1:
+        server.prefork(args.processes)
+    else:
+        server.serve()